@@ -22,6 +22,7 @@
 """This module defines the class that is used to create an input file for
 Abaqus."""
 
+import io as _io
 from enum import Enum as _Enum
 from enum import auto as _auto
 
@@ -33,12 +34,18 @@ from beamme.core.mesh import Mesh as _Mesh
 from beamme.core.mesh_utils import (
     get_coupled_nodes_to_master_map as _get_coupled_nodes_to_master_map,
 )
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.core.rotation import smallest_rotation as _smallest_rotation
+from beamme.utils.nodes import get_nodal_coordinates as _get_nodal_coordinates
+from beamme.utils.nodes import get_nodal_quaternions as _get_nodal_quaternions
 
 # Format template for different number types.
 F_INT = "{:6d}"
 F_FLOAT = "{: .14e}"
 
+# Number of lines that are formatted at once when writing arrays.
+LINES_PER_BLOCK = 10000
+
 
 def set_i_global(data_list, *, start_index=0):
     """Set i_global in every item of data_list.
@@ -60,20 +67,77 @@ def set_i_global(data_list, *, start_index=0):
         item.i_global = i + start_index
 
 
-def get_set_lines(set_type, items, name):
-    """Get the Abaqus input file lines for a set of items (max 16 items per
-    row)"""
+def get_i_global_array(items):
+    """Return an array with i_global of all items."""
+    return _np.fromiter((item.i_global for item in items), dtype=int, count=len(items))
+
+
+def write_array_lines(file, line_format, *arrays):
+    """Write lines with the values of the given arrays to a file.
+
+    The lines are formatted in blocks of LINES_PER_BLOCK lines, i.e., the
+    whole string is never created at once.
+
+    Args
+    ----
+    file: file object
+        The file the lines are written to.
+    line_format: str
+        Format string for a single line (without the line break). The
+        values of the arrays in each row are passed to this format string.
+    arrays: _np.array (n_lines) or (n_lines x n)
+        Arrays with the values for each line.
+    """
+
+    arrays = [_np.asarray(array) for array in arrays]
+    arrays = [array if array.ndim == 2 else array[:, None] for array in arrays]
+    n_lines = len(arrays[0])
+    n_values = sum(array.shape[1] for array in arrays)
+    line_format += "\n"
+
+    for start in range(0, n_lines, LINES_PER_BLOCK):
+        stop = min(start + LINES_PER_BLOCK, n_lines)
+
+        # Python scalars are formatted considerably faster than numpy scalars,
+        # therefore we collect the values in an object array.
+        values = _np.empty((stop - start, n_values), dtype=object)
+        i_value = 0
+        for array in arrays:
+            for column in array[start:stop].T:
+                values[:, i_value] = column.tolist()
+                i_value += 1
+        file.write((line_format * (stop - start)).format(*values.ravel().tolist()))
+
+
+def write_set_lines(file, set_type, ids, name):
+    """Write the Abaqus input file lines for a set of items (max 16 items per
+    row)
+
+    Args
+    ----
+    file: file object
+        The file the lines are written to.
+    set_type: str
+        Type of the set, i.e., "Nset" or "Elset".
+    ids: _np.array
+        The global indices (starting at 0) of the items in the set.
+    name: str
+        Name of the set.
+    """
     max_entries_per_line = 16
-    lines = ["*{}, {}={}".format(set_type, set_type.lower(), name)]
-    set_ids = [item.i_global + 1 for item in items]
-    set_ids.sort()
-    set_ids = [
-        set_ids[i : i + max_entries_per_line]
-        for i in range(0, len(set_ids), max_entries_per_line)
-    ]
-    for ids in set_ids:
-        lines.append(", ".join([F_INT.format(id) for id in ids]))
-    return lines
+    file.write("*{}, {}={}\n".format(set_type, set_type.lower(), name))
+    set_ids = _np.sort(ids) + 1
+    n_full_lines = len(set_ids) // max_entries_per_line
+    n_full = n_full_lines * max_entries_per_line
+    write_array_lines(
+        file,
+        ", ".join(max_entries_per_line * [F_INT]),
+        set_ids[:n_full].reshape(n_full_lines, max_entries_per_line),
+    )
+    if n_full < len(set_ids):
+        write_array_lines(
+            file, ", ".join((len(set_ids) - n_full) * [F_INT]), set_ids[n_full:][None]
+        )
 
 
 class AbaqusBeamNormalDefinition(_Enum):
@@ -111,6 +175,9 @@ class AbaqusInputFile(object):
     ):
         """Write the ASCII input file to disk.
 
+        The input file is written block by block, i.e., the whole input file
+        is never stored as a single string.
+
         Args
         ----
         file_path: path
@@ -121,11 +188,24 @@ class AbaqusInputFile(object):
 
         # Write the input file to disk
         with open(file_path, "w") as input_file:
-            input_file.write(self.get_input_file_string(normal_definition))
-            input_file.write("\n")
+            self.write(input_file, normal_definition)
 
     def get_input_file_string(self, normal_definition):
         """Generate the string for the Abaqus input file."""
+        input_file = _io.StringIO()
+        self.write(input_file, normal_definition)
+        return input_file.getvalue()[:-1]
+
+    def write(self, file, normal_definition):
+        """Write the Abaqus input file to a file object.
+
+        Args
+        ----
+        file: file object
+            The file the input file is written to.
+        normal_definition: AbaqusBeamNormalDefinition
+            How the beam cross-section should be defined.
+        """
 
         # Perform some checks on the mesh.
         if _mpy.check_overlapping_elements:
@@ -135,21 +215,19 @@ class AbaqusInputFile(object):
         set_i_global(self.mesh.materials)
 
         # Calculate the required cross-section normal data
-        self.calculate_cross_section_normal_data(normal_definition)
+        n1_positions, n2 = self.calculate_cross_section_normal_data(normal_definition)
 
-        # Add the lines to the input file
-        input_file_lines = []
-        input_file_lines.extend(["** " + line for line in _mpy.input_file_header])
-        input_file_lines.extend(self.get_nodes_lines())
-        input_file_lines.extend(self.get_element_lines())
-        input_file_lines.extend(self.get_material_lines())
-        input_file_lines.extend(self.get_set_lines())
-        return "\n".join(input_file_lines)
+        # Write the blocks of the input file
+        for line in _mpy.input_file_header:
+            file.write("** " + line + "\n")
+        n1_node_ids = self.write_nodes(file, n1_positions)
+        self.write_elements(file, n1_node_ids, n2)
+        self.write_materials(file)
+        self.write_sets(file)
 
     def calculate_cross_section_normal_data(self, normal_definition):
         """Evaluate all data that is required to fully specify the cross-
-        section orientation in Abaqus. The evaluated data is stored in the
-        elements.
+        section orientation in Abaqus.
 
         For more information see the Abaqus documentation on: "Beam element cross-section orientation"
 
@@ -157,29 +235,18 @@ class AbaqusInputFile(object):
         ----
         normal_definition: AbaqusBeamNormalDefinition
             How the beam cross-section should be defined.
-        """
 
-        def normalize(vector):
-            """Normalize a vector."""
-            return vector / _np.linalg.norm(vector)
-
-        # Reset possibly existing data stored in the elements
-        # element.n1_orientation_node: list(float)
-        #     The coordinates of an additional (dummy) node connected to the
-        #     element to define its approximate n1 direction. It this is None,
-        #     no additional node will be added to the input file.
-        # element.n1_node_id: str
-        #     The global ID in the input file for the additional orientation
-        #     node.
-        # element.n2: list(list(float)):
-        #     A list containing possible explicit normal definitions for each
-        #     element node. All entries that are not None will be added to the
-        #     *NORMAL section of the input file.
-
-        for element in self.mesh.elements:
-            element.n1_position = None
-            element.n1_node_id = None
-            element.n2 = [None for i_node in range(len(element.nodes))]
+        Return
+        ----
+        n1_positions: _np.array (n_elements x 3)
+            The coordinates of an additional (dummy) node connected to each
+            element to define its approximate n1 direction. If this is None,
+            no additional nodes will be added to the input file.
+        n2: _np.array (n_elements x 3)
+            The explicit normal definition for the first node of each
+            element, which will be added to the *NORMAL section of the input
+            file.
+        """
 
         if (
             normal_definition == AbaqusBeamNormalDefinition.normal
@@ -190,29 +257,40 @@ class AbaqusInputFile(object):
             # via a smallest rotation mapping from the triad of the first node onto
             # the tangent.
 
-            for element in self.mesh.elements:
-                node_1 = element.nodes[0].coordinates
-                node_2 = element.nodes[1].coordinates
-                t = normalize(node_2 - node_1)
-
-                rotation = element.nodes[0].rotation
-                cross_section_rotation = _smallest_rotation(rotation, t)
-
-                if (
-                    normal_definition
-                    == AbaqusBeamNormalDefinition.normal_and_extra_node
-                ):
-                    element.n1_position = node_1 + cross_section_rotation * [
-                        0.0,
-                        1.0,
-                        0.0,
-                    ]
-                element.n2[0] = cross_section_rotation * [0.0, 0.0, 1.0]
+            nodes_1 = [element.nodes[0] for element in self.mesh.elements]
+            nodes_2 = [element.nodes[1] for element in self.mesh.elements]
+            coordinates_1 = _get_nodal_coordinates(nodes_1)
+            t = _get_nodal_coordinates(nodes_2) - coordinates_1
+            rotations = _RotationArray.from_quaternion(
+                _get_nodal_quaternions(nodes_1).reshape(-1, 4), normalized=True
+            )
+            cross_section_rotations = _smallest_rotation(rotations, t.reshape(-1, 3))
+
+            if normal_definition == AbaqusBeamNormalDefinition.normal_and_extra_node:
+                n1_positions = coordinates_1 + cross_section_rotations * [0.0, 1.0, 0.0]
+            else:
+                n1_positions = None
+            return n1_positions, cross_section_rotations * [0.0, 0.0, 1.0]
         else:
             raise ValueError(f"Got unexpected normal_definition {normal_definition}")
 
-    def get_nodes_lines(self):
-        """Get the lines for the input file that represent the nodes."""
+    def write_nodes(self, file, n1_positions):
+        """Write the nodes to the input file.
+
+        Args
+        ----
+        file: file object
+            The file the nodes are written to.
+        n1_positions: _np.array (n_elements x 3)
+            Coordinates of the additional nodes for the element cross-section
+            directions, see calculate_cross_section_normal_data.
+
+        Return
+        ----
+        n1_node_ids: _np.array (n_elements)
+            The global IDs in the input file of the additional nodes, or None
+            if there are no additional nodes.
+        """
 
         # The nodes require postprocessing, as we have to identify coupled nodes in Abaqus.
         # Internally in Abaqus, coupled nodes are a single node with different normals for the
@@ -223,77 +301,89 @@ class AbaqusInputFile(object):
         )
 
         # Number the remaining nodes and create nodes for the input file
-        input_file_lines = ["*Node"]
-        for node in unique_nodes:
-            input_file_lines.append(
-                (", ".join([F_INT] + 3 * [F_FLOAT])).format(
-                    node.i_global + 1, *node.coordinates
-                )
-            )
+        node_format = ", ".join([F_INT] + 3 * [F_FLOAT])
+        file.write("*Node\n")
+        write_array_lines(
+            file,
+            node_format,
+            get_i_global_array(unique_nodes) + 1,
+            _get_nodal_coordinates(unique_nodes),
+        )
 
         # Check if we need to write additional nodes for the element cross-section directions
-        node_counter = len(unique_nodes)
-        for element in self.mesh.elements:
-            if element.n1_position is not None:
-                node_counter += 1
-                input_file_lines.append(
-                    (", ".join([F_INT] + 3 * [F_FLOAT])).format(
-                        node_counter, *element.n1_position
-                    )
-                )
-                element.n1_node_id = node_counter
+        if n1_positions is None:
+            return None
+        n1_node_ids = len(unique_nodes) + 1 + _np.arange(len(n1_positions))
+        write_array_lines(file, node_format, n1_node_ids, n1_positions)
+        return n1_node_ids
 
-        return input_file_lines
+    def write_elements(self, file, n1_node_ids, n2):
+        """Write the elements and the explicit normal definitions to the input
+        file.
 
-    def get_element_lines(self):
-        """Get the lines for the input file that represent the elements."""
+        Args
+        ----
+        file: file object
+            The file the elements are written to.
+        n1_node_ids: _np.array (n_elements)
+            The global IDs of the additional nodes for the element
+            cross-section directions, see write_nodes.
+        n2: _np.array (n_elements x 3)
+            The explicit normal definitions of the first element nodes, see
+            calculate_cross_section_normal_data.
+        """
 
         # Sort the elements after their types.
         element_types = {}
-        for element in self.mesh.elements:
+        for i_element, element in enumerate(self.mesh.elements):
             element_type = element.beam_type
             if element_type in element_types.keys():
-                element_types[element_type].append(element)
+                element_types[element_type].append(i_element)
             else:
-                element_types[element_type] = [element]
+                element_types[element_type] = [i_element]
 
         # Write the element connectivity.
         element_count = 0
-        element_lines = []
-        normal_lines = ["*Normal, type=element"]
-        for element_type, elements in element_types.items():
+        normal_element_indices = []
+        for element_type, element_indices in element_types.items():
+            elements = [self.mesh.elements[i_element] for i_element in element_indices]
+
             # Number the elements of this type
             set_i_global(elements, start_index=element_count)
+            element_ids = element_count + 1 + _np.arange(len(elements))
 
             # Set the element connectivity, possibly including the n1 direction node
-            element_lines.append("*Element, type={}".format(element_type))
-            for element in elements:
-                node_ids = [node.i_global + 1 for node in element.nodes]
-                if element.n1_node_id is not None:
-                    node_ids.append(element.n1_node_id)
-                line_ids = [element.i_global + 1] + node_ids
-                element_lines.append(", ".join(F_INT.format(i) for i in line_ids))
-
-                # Set explicit normal definitions for the nodes
-                for i_node, n2 in enumerate(element.n2):
-                    if n2 is not None:
-                        node = element.nodes[i_node]
-                        normal_lines.append(
-                            (", ".join(2 * [F_INT] + 3 * [F_FLOAT])).format(
-                                element.i_global + 1, node.i_global + 1, *n2
-                            )
-                        )
+            n_nodes = len(elements[0].nodes)
+            node_ids = get_i_global_array(
+                [node for element in elements for node in element.nodes]
+            ).reshape(-1, n_nodes)
+            line_ids = [element_ids, node_ids + 1]
+            if n1_node_ids is not None:
+                line_ids.append(n1_node_ids[element_indices])
+            file.write("*Element, type={}\n".format(element_type))
+            write_array_lines(
+                file,
+                ", ".join((len(line_ids) + n_nodes - 1) * [F_INT]),
+                *line_ids,
+            )
 
+            normal_element_indices.extend(element_indices)
             element_count += len(elements)
 
-        if len(normal_lines) > 1:
-            return element_lines + normal_lines
-        else:
-            return element_lines
+        # Set explicit normal definitions for the first node of each element
+        if len(normal_element_indices) > 0:
+            elements = [self.mesh.elements[i] for i in normal_element_indices]
+            file.write("*Normal, type=element\n")
+            write_array_lines(
+                file,
+                ", ".join(2 * [F_INT] + 3 * [F_FLOAT]),
+                get_i_global_array(elements) + 1,
+                get_i_global_array([element.nodes[0] for element in elements]) + 1,
+                n2[normal_element_indices],
+            )
 
-    def get_material_lines(self):
-        """Get the lines for the input file that represent the element sets
-        with the same material."""
+    def write_materials(self, file):
+        """Write the element sets with the same material to the input file."""
 
         materials = {}
         for element in self.mesh.elements:
@@ -304,33 +394,30 @@ class AbaqusInputFile(object):
                 materials[element_material] = [element]
 
         # Create the element sets for the different materials.
-        input_file_lines = []
         for material, elements in materials.items():
             material_name = material.dump_to_list()[0]
-            input_file_lines.extend(get_set_lines("Elset", elements, material_name))
-        return input_file_lines
+            write_set_lines(file, "Elset", get_i_global_array(elements), material_name)
 
-    def get_set_lines(self):
-        """Add lines to the input file that represent node and element sets."""
+    def write_sets(self, file):
+        """Write the node and element sets to the input file."""
 
-        input_file_lines = []
         for point_set in self.mesh.geometry_sets[_mpy.geo.point]:
             if point_set.name is None:
                 raise ValueError("Sets added to the mesh have to have a valid name!")
-            input_file_lines.extend(
-                get_set_lines("Nset", point_set.get_points(), point_set.name)
+            write_set_lines(
+                file, "Nset", get_i_global_array(point_set.get_points()), point_set.name
             )
         for line_set in self.mesh.geometry_sets[_mpy.geo.line]:
             if line_set.name is None:
                 raise ValueError("Sets added to the mesh have to have a valid name!")
             if isinstance(line_set, _GeometrySet):
-                input_file_lines.extend(
-                    get_set_lines(
-                        "Elset", line_set.geometry_objects[_mpy.geo.line], line_set.name
-                    )
+                write_set_lines(
+                    file,
+                    "Elset",
+                    get_i_global_array(line_set.geometry_objects[_mpy.geo.line]),
+                    line_set.name,
                 )
             else:
                 raise ValueError(
                     "Line sets can only be exported to Abaqus if they are defined with the beam elements"
                 )
-        return input_file_lines
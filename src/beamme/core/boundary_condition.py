@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 """This module implements a class to represent boundary conditions."""
 
+import copy as _copy
 import warnings as _warnings
 from typing import Dict as _Dict
 from typing import Optional as _Optional
@@ -55,6 +56,27 @@ class BoundaryConditionBase(_BaseMeshItem):
         self.bc_type = bc_type
         self.geometry_set = geometry_set
 
+    def _copy_with_geometry_set(
+        self, geometry_set: _GeometrySetBase
+    ) -> "BoundaryConditionBase":
+        """Return a copy of this boundary condition that acts on the given
+        geometry set.
+
+        The data is copied, functions in the data are shared with this
+        boundary condition.
+
+        Args:
+            geometry_set: Geometry that the copy acts on.
+
+        Returns:
+            The copied boundary condition.
+        """
+        boundary_condition = object.__new__(type(self))
+        boundary_condition.__dict__.update(self.__dict__, geometry_set=geometry_set)
+        if self.data is not None:
+            boundary_condition.data = _copy.deepcopy(self.data)
+        return boundary_condition
+
 
 class BoundaryCondition(BoundaryConditionBase):
     """This object represents one boundary condition, e.g., Dirichlet, Neumann,
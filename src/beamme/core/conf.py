@@ -179,5 +179,9 @@ class BeamMe(object):
             "-" * 40,
         ]
 
+        # Number of nodes / elements that are converted and written at once
+        # when the mesh sections of an input file are streamed.
+        self.input_file_stream_chunk_size = 10000
+
 
 mpy = BeamMe()
@@ -20,11 +20,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 """This module implements containers to manage boundary conditions and geometry
-sets in one object."""
+sets in one object, as well as an indexed list for mesh items and the
+adjacency between nodes and other mesh items."""
+
+from bisect import bisect_left as _bisect_left
+from bisect import insort as _insort
+from itertools import chain as _chain
+from itertools import repeat as _repeat
+
+import numpy as _np
 
 
 class ContainerBase(dict):
-    """A base class for containers."""
+    """A base class for containers.
+
+    The items for each key are stored in an IndexedList, i.e., checking
+    if an item is already in the container is done in constant time,
+    while the insertion order of the items is kept.
+    """
+
+    def __setitem__(self, key, items):
+        """Set the items for the given key."""
+        if not isinstance(items, IndexedList):
+            items = IndexedList(items)
+        super().__setitem__(key, items)
 
     def append(self, key, item):
         """Append item to this container and check if the item is already in
@@ -58,3 +77,309 @@ class ContainerBase(dict):
         for key, items in container.items():
             for item in items:
                 self.append(key, item)
+
+
+class IndexedList(list):
+    """A list that additionally keeps a hash map of its items.
+
+    The hash map is updated with every modification of the list. This
+    allows for membership checks and position lookups in constant time,
+    e.g., when checking if a node is already in a mesh. The items have
+    to be hashable.
+
+    Deleting a single item does not invalidate the positions of the other
+    items. The positions are stored as if the deleted items were still in
+    the list and the deleted positions are kept as a sorted list. The
+    position of an item is then corrected by the number of deleted items
+    before it.
+
+    The attribute modification_count is increased with every modification
+    of the list, so other objects can check if the list changed since they
+    last looked at it. The attribute last_non_append_modification stores the
+    modification_count of the last modification that did not only append
+    items to the list.
+    """
+
+    def __init__(self, items=()):
+        """Initialize the list and build the index.
+
+        Args:
+            items: Initial items of the list.
+        """
+        super().__init__(items)
+        self.modification_count = 0
+        self.last_non_append_modification = 0
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Build the item counts and the item positions from scratch."""
+        self._counts = {}
+        for item in self:
+            self._counts[item] = self._counts.get(item, 0) + 1
+        self._invalidate_positions()
+
+    def _invalidate_positions(self):
+        """Reset the item positions, they are recomputed when they are
+        needed."""
+        self._positions = None
+        self._deleted_positions = []
+        self.modification_count += 1
+        self.last_non_append_modification = self.modification_count
+
+    def _get_positions(self):
+        """Return a dictionary with the position of the first occurrence of
+        each item, including the deleted positions before it.
+
+        The positions are invalidated by all operations that remove
+        multiple items or change the order of the items and are only
+        recomputed when they are needed.
+        """
+        if self._positions is None:
+            n_items = len(self)
+            self._positions = dict(zip(reversed(self), range(n_items - 1, -1, -1)))
+        return self._positions
+
+    def _add_to_index(self, items):
+        """Add the given items, which have been appended at the end of the
+        list, to the index."""
+        self.modification_count += 1
+        n_previous = len(self) - len(items) + len(self._deleted_positions)
+        for i, item in enumerate(items):
+            if item in self._counts:
+                self._counts[item] += 1
+            else:
+                self._counts[item] = 1
+                if self._positions is not None:
+                    self._positions[item] = n_previous + i
+
+    def _remove_from_index(self, items):
+        """Remove the given items, which have been removed from the list,
+        from the index."""
+        for item in items:
+            if self._counts[item] == 1:
+                del self._counts[item]
+            else:
+                self._counts[item] -= 1
+        self._invalidate_positions()
+
+    def __contains__(self, item):
+        """Check if the item is in this list in constant time."""
+        return item in self._counts
+
+    def __reduce_ex__(self, protocol):
+        """Rebuild the index when the list is copied or pickled.
+
+        The modification counters are kept, so objects that are copied
+        together with this list can still compare them.
+        """
+        return (
+            self.__class__,
+            (list(self),),
+            {
+                "modification_count": self.modification_count,
+                "last_non_append_modification": self.last_non_append_modification,
+            },
+        )
+
+    def copy(self):
+        """Return a shallow copy of this list."""
+        return self.__class__(self)
+
+    def index(self, item, *args):
+        """Return the position of the first occurrence of item in constant
+        time."""
+        if args:
+            return super().index(item, *args)
+        try:
+            position = self._get_positions()[item]
+        except KeyError:
+            raise ValueError(f"{item} is not in list")
+        return position - _bisect_left(self._deleted_positions, position)
+
+    def count(self, item):
+        """Return the number of occurrences of item in constant time."""
+        return self._counts.get(item, 0)
+
+    def append(self, item):
+        """Append an item to the end of the list."""
+        super().append(item)
+        self._add_to_index([item])
+
+    def extend(self, items):
+        """Extend the list with the given items."""
+        items = list(items)
+        super().extend(items)
+        self._add_to_index(items)
+
+    def __iadd__(self, items):
+        """Extend the list with the given items."""
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        """Repeat the items of the list n times."""
+        super().__imul__(n)
+        self._rebuild_index()
+        return self
+
+    def insert(self, i, item):
+        """Insert an item before the given position."""
+        super().insert(i, item)
+        self._counts[item] = self._counts.get(item, 0) + 1
+        self._invalidate_positions()
+
+    def remove(self, item):
+        """Remove the first occurrence of item."""
+        del self[self.index(item)]
+
+    def pop(self, i=-1):
+        """Remove and return the item at the given position."""
+        item = self[i]
+        del self[i]
+        return item
+
+    def clear(self):
+        """Remove all items from the list."""
+        super().clear()
+        self._rebuild_index()
+
+    def __delitem__(self, key):
+        """Delete the item(s) at the given position(s)."""
+        if isinstance(key, slice):
+            removed_items = self[key]
+            super().__delitem__(key)
+            self._remove_from_index(removed_items)
+            return
+
+        # Keep the positions of the other items valid when a single unique item
+        # is deleted. The positions are rebuilt once there are more deleted
+        # positions than items.
+        item = self[key]
+        super().__delitem__(key)
+        if (
+            self._positions is None
+            or self._counts[item] > 1
+            or len(self._deleted_positions) >= len(self)
+        ):
+            self._remove_from_index([item])
+        else:
+            del self._counts[item]
+            _insort(self._deleted_positions, self._positions.pop(item))
+            self.modification_count += 1
+            self.last_non_append_modification = self.modification_count
+
+    def __setitem__(self, key, value):
+        """Set the item(s) at the given position(s)."""
+        removed_items = self[key] if isinstance(key, slice) else [self[key]]
+        if isinstance(key, slice):
+            value = list(value)
+        super().__setitem__(key, value)
+        self._remove_from_index(removed_items)
+        for item in value if isinstance(key, slice) else [value]:
+            self._counts[item] = self._counts.get(item, 0) + 1
+
+    def sort(self, *args, **kwargs):
+        """Sort the list in place."""
+        super().sort(*args, **kwargs)
+        self._invalidate_positions()
+
+    def reverse(self):
+        """Reverse the list in place."""
+        super().reverse()
+        self._invalidate_positions()
+
+
+class NodeAdjacency:
+    """Adjacency between a list of nodes and other mesh items, e.g., elements
+    or geometry sets.
+
+    The items connected to each node are stored as compressed sparse row
+    (CSR) index arrays, i.e., the indices of the items connected to the
+    i-th node are indices[indptr[i]:indptr[i + 1]]. The items connected
+    to a node are in the order of the given items.
+
+    The nodes only store a reference to this object (see link_nodes), the
+    list of connected items is created when it is accessed.
+    """
+
+    def __init__(self, nodes, items, items_nodes):
+        """Create the adjacency.
+
+        Args:
+            nodes: List of nodes.
+            items: List of items that are connected to the nodes.
+            items_nodes: List with the list of connected nodes for each item.
+        """
+
+        self.nodes = list(nodes)
+        self.items = list(items)
+        items_nodes = [list(item_nodes) for item_nodes in items_nodes]
+        n_nodes = len(self.nodes)
+        self.positions = dict(zip(reversed(self.nodes), range(n_nodes - 1, -1, -1)))
+
+        # Get the node index for each connection, nodes that are not in the list
+        # of nodes get the index -1.
+        connected_nodes = list(_chain.from_iterable(items_nodes))
+        node_ids = _np.fromiter(
+            map(self.positions.get, connected_nodes, _repeat(-1)),
+            dtype=int,
+            count=len(connected_nodes),
+        )
+        item_ids = _np.repeat(
+            _np.arange(len(self.items)),
+            [len(item_nodes) for item_nodes in items_nodes],
+        )
+
+        # Connections of nodes that are not in the list of nodes.
+        self.other_node_links: dict = {}
+        for i_connection in _np.flatnonzero(node_ids == -1):
+            self.other_node_links.setdefault(connected_nodes[i_connection], []).append(
+                self.items[item_ids[i_connection]]
+            )
+
+        # Create the CSR arrays.
+        is_in_nodes = node_ids >= 0
+        node_ids = node_ids[is_in_nodes]
+        item_ids = item_ids[is_in_nodes]
+        self.indices = item_ids[_np.argsort(node_ids, kind="stable")]
+        self.indptr = _np.zeros(n_nodes + 1, dtype=int)
+        _np.cumsum(_np.bincount(node_ids, minlength=n_nodes), out=self.indptr[1:])
+
+        # The items sorted by the nodes they are connected to, so the linked
+        # items of a single node can be accessed with a slice.
+        self._indptr = self.indptr.tolist()
+        self._sorted_items = [self.items[i] for i in self.indices.tolist()]
+
+    def __getitem__(self, node):
+        """Return a list with the items connected to the given node."""
+        i_node = self.positions.get(node)
+        if i_node is None:
+            return list(self.other_node_links.get(node, []))
+        return self._sorted_items[self._indptr[i_node] : self._indptr[i_node + 1]]
+
+    def get_connections(self, node_ids):
+        """Return the connections of multiple nodes as index arrays.
+
+        Args:
+            node_ids: Indices of nodes in self.nodes.
+
+        Returns:
+            connection_node_ids: Index in node_ids for each connection.
+            connection_item_ids: Index in self.items for each connection.
+        """
+        starts = self.indptr[node_ids]
+        counts = self.indptr[_np.asarray(node_ids) + 1] - starts
+        connection_node_ids = _np.repeat(_np.arange(len(starts)), counts)
+        offsets = _np.arange(counts.sum()) - _np.repeat(
+            _np.cumsum(counts) - counts, counts
+        )
+        return connection_node_ids, self.indices[starts[connection_node_ids] + offsets]
+
+    def link_nodes(self, attribute_name: str) -> None:
+        """Set the links to this object in all connected nodes.
+
+        Args:
+            attribute_name: Name of the link attribute in the nodes.
+        """
+        for node in _chain(self.nodes, self.other_node_links.keys()):
+            setattr(node, attribute_name, self)
@@ -21,6 +21,8 @@
 # THE SOFTWARE.
 """This module implements the class that represents one element in the Mesh."""
 
+import copy as _copy
+
 from beamme.core.base_mesh_item import BaseMeshItem as _BaseMeshItem
 
 
@@ -42,6 +44,20 @@ class Element(_BaseMeshItem):
         # VTK cell data for this element.
         self.vtk_cell_data = {}
 
+    def _copy_with_nodes(self, nodes):
+        """Return a copy of this element that is connected to the given nodes.
+
+        The material is shared with this element, the data and the vtk cell
+        data are copied.
+        """
+        element = object.__new__(type(self))
+        element.__dict__.update(self.__dict__, nodes=nodes, vtk_cell_data={})
+        if self.vtk_cell_data:
+            element.vtk_cell_data = _copy.deepcopy(self.vtk_cell_data)
+        if self.data is not None:
+            element.data = _copy.deepcopy(self.data)
+        return element
+
     def flip(self):
         """Reverse the nodes of this element.
 
@@ -64,6 +80,12 @@ class Element(_BaseMeshItem):
                 "The node that should be replaced is not in the current element"
             )
 
+        # The cached links between the nodes and the elements of the mesh are
+        # no longer valid.
+        for node in (old_node, new_node):
+            if node.mesh is not None:
+                node.mesh.increment_topology_version()
+
     def dump_element_specific_section(self, yaml_dict):
         """Add information of this element to specific section (e.g. STRUCTURE
         KNOTVECTORS for NURBS elements)."""
@@ -72,3 +94,14 @@ class Element(_BaseMeshItem):
         """Add representation of this element to the vtk_writers for solid and
         beam."""
         raise NotImplementedError("VTK output has to be implemented in the class!")
+
+    @classmethod
+    def get_vtk_batch(cls, elements, vtk_writer_beam, vtk_writer_solid, **kwargs):
+        """Add representation of multiple elements of this class to the
+        vtk_writers for solid and beam.
+
+        Derived classes can overwrite this method to process all
+        elements at once.
+        """
+        for element in elements:
+            element.get_vtk(vtk_writer_beam, vtk_writer_solid, **kwargs)
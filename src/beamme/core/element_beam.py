@@ -33,7 +33,30 @@ from beamme.core.conf import mpy as _mpy
 from beamme.core.element import Element as _Element
 from beamme.core.node import NodeCosserat as _NodeCosserat
 from beamme.core.rotation import Rotation as _Rotation
-from beamme.core.vtk_writer import add_point_data_node_sets as _add_point_data_node_sets
+from beamme.core.rotation import RotationArray as _RotationArray
+from beamme.core.vtk_writer import (
+    add_point_data_node_sets_batch as _add_point_data_node_sets_batch,
+)
+from beamme.core.vtk_writer import combine_data as _combine_data
+
+
+def _check_node(node, pos, rot, arc_length, name):
+    """Check if the given node matches with the position and rotation and
+    optionally also the arc length."""
+
+    if _np.linalg.norm(pos - node.coordinates) > _mpy.eps_pos:
+        raise ValueError(
+            f"{name} position does not match with function! Got {pos} from function but "
+            + f"given node value is {node.coordinates}"
+        )
+    if not node.rotation == rot:
+        raise ValueError(f"{name} rotation does not match with function!")
+
+    if arc_length is not None:
+        if _np.abs(node.arc_length - arc_length) > _mpy.eps_pos:
+            raise ValueError(
+                f"Arc lengths don't match, got {node.arc_length} and {arc_length}"
+            )
 
 
 class Beam(_Element):
@@ -91,24 +114,6 @@ class Beam(_Element):
         if len(self.nodes) > 0:
             raise ValueError("The beam should not have any local nodes yet!")
 
-        def check_node(node, pos, rot, arc_length, name):
-            """Check if the given node matches with the position and rotation
-            and optionally also the arc length."""
-
-            if _np.linalg.norm(pos - node.coordinates) > _mpy.eps_pos:
-                raise ValueError(
-                    f"{name} position does not match with function! Got {pos} from function but "
-                    + f"given node value is {node.coordinates}"
-                )
-            if not node.rotation == rot:
-                raise ValueError(f"{name} rotation does not match with function!")
-
-            if arc_length is not None:
-                if _np.abs(node.arc_length - arc_length) > _mpy.eps_pos:
-                    raise ValueError(
-                        f"Arc lengths don't match, got {node.arc_length} and {arc_length}"
-                    )
-
         # Flags if nodes are given
         has_start_node = start_node is not None
         has_end_node = end_node is not None
@@ -125,10 +130,10 @@ class Beam(_Element):
 
             # Check if the position and rotation match existing nodes
             if i == 0 and has_start_node:
-                check_node(start_node, pos, rot, arc_length, "start_node")
+                _check_node(start_node, pos, rot, arc_length, "start_node")
                 self.nodes = [start_node]
             elif (i == len(self.nodes_create) - 1) and has_end_node:
-                check_node(end_node, pos, rot, arc_length, "end_node")
+                _check_node(end_node, pos, rot, arc_length, "end_node")
 
             # Create the node
             if (i > 0 or not has_start_node) and (
@@ -154,6 +159,71 @@ class Beam(_Element):
         # Return the created nodes.
         return created_nodes
 
+    def create_beam_from_arrays(
+        self,
+        positions: _np.ndarray,
+        quaternions: _np.ndarray,
+        arc_lengths: _Optional[_np.ndarray] = None,
+        *,
+        start_node: _Optional[_NodeCosserat] = None,
+        end_node: _Optional[_NodeCosserat] = None,
+    ) -> _List[_NodeCosserat]:
+        """Create the nodes for this beam element from already evaluated nodal
+        values. The function returns a list with the created nodes.
+
+        This is the counterpart to create_beam for the case where the
+        positions and rotations of all nodes are evaluated at once (see
+        create_beam_mesh_generic). In the case of start_node and end_node, it
+        is checked, that the given values and the node have the same
+        coordinates and rotations.
+
+        Args:
+            positions: Positions of the local nodes (in the order of
+                nodes_create).
+            quaternions: Quaternions of the local nodes (in the order of
+                nodes_create). Possible relative twists already have to be
+                applied.
+            arc_lengths: Arc lengths to be stored in the local nodes. If this
+                is None, no arc length is set.
+            start_node: If this argument is given, this is the node of the beam
+                at xi=-1.
+            end_node: If this argument is given, this is the node of the beam
+                at xi=1.
+        """
+
+        if len(self.nodes) > 0:
+            raise ValueError("The beam should not have any local nodes yet!")
+
+        n_nodes = len(self.nodes_create)
+        if not len(positions) == len(quaternions) == n_nodes:
+            raise ValueError(
+                f"Expected nodal values for {n_nodes} nodes, got {len(positions)} "
+                f"positions and {len(quaternions)} quaternions"
+            )
+
+        created_nodes = []
+        for i in range(n_nodes):
+            arc_length = None if arc_lengths is None else arc_lengths[i]
+            if i == 0 and start_node is not None:
+                rot = _Rotation.from_quaternion(quaternions[i], normalized=True)
+                _check_node(start_node, positions[i], rot, arc_length, "start_node")
+                self.nodes.append(start_node)
+            elif i == n_nodes - 1 and end_node is not None:
+                rot = _Rotation.from_quaternion(quaternions[i], normalized=True)
+                _check_node(end_node, positions[i], rot, arc_length, "end_node")
+                self.nodes.append(end_node)
+            else:
+                node = _NodeCosserat(
+                    positions[i],
+                    _Rotation.from_quaternion(quaternions[i], normalized=True),
+                    is_middle_node=0 < i < n_nodes - 1,
+                    arc_length=arc_length,
+                )
+                self.nodes.append(node)
+                created_nodes.append(node)
+
+        return created_nodes
+
     @classmethod
     def get_coupling_dict(cls, coupling_dof_type):
         """Return the dict to couple this beam to another beam."""
@@ -213,60 +283,116 @@ class Beam(_Element):
             Values greater than 1, a Hermite interpolation of the centerline is assumed for
             visualization purposes.
         """
+        self._add_vtk_poly_lines(
+            [self],
+            vtk_writer_beam,
+            beam_centerline_visualization_segments=beam_centerline_visualization_segments,
+        )
 
-        n_nodes = len(self.nodes)
+    @classmethod
+    def get_vtk_batch(
+        cls,
+        elements,
+        vtk_writer_beam,
+        vtk_writer_solid,
+        *,
+        beam_centerline_visualization_segments=1,
+        **kwargs,
+    ):
+        """Add the representation of multiple elements of this class to the
+        VTK writer.
+
+        If all elements have the same number of nodes, the poly lines of
+        all elements are evaluated at once. See get_vtk for the
+        arguments.
+        """
+        if (
+            cls.get_vtk is Beam.get_vtk
+            and len({len(element.nodes) for element in elements}) == 1
+        ):
+            cls._add_vtk_poly_lines(
+                elements,
+                vtk_writer_beam,
+                beam_centerline_visualization_segments=beam_centerline_visualization_segments,
+            )
+        else:
+            super().get_vtk_batch(
+                elements,
+                vtk_writer_beam,
+                vtk_writer_solid,
+                beam_centerline_visualization_segments=beam_centerline_visualization_segments,
+                **kwargs,
+            )
+
+    @staticmethod
+    def _add_vtk_poly_lines(
+        elements, vtk_writer_beam, *, beam_centerline_visualization_segments=1
+    ):
+        """Add the poly line representation of the given beam elements to the
+        VTK writer.
+
+        All elements have to have the same number of nodes. The points
+        of each element are the nodes, followed by the additional
+        visualization points.
+        """
+
+        n_elements = len(elements)
+        n_nodes = len(elements[0].nodes)
         n_segments = n_nodes - 1
         n_additional_points_per_segment = beam_centerline_visualization_segments - 1
         # Number of points (in addition to the nodes) to be used for output
         n_additional_points = n_segments * n_additional_points_per_segment
         n_points = n_nodes + n_additional_points
 
-        # Dictionary with cell data.
-        cell_data = self.vtk_cell_data.copy()
-        cell_data["cross_section_radius"] = self.material.radius
+        # Get the nodal values of all elements.
+        nodal_coordinates = _np.zeros((n_elements, n_nodes, 3))
+        nodal_quaternions = _np.zeros((n_elements, n_nodes, 4))
+        is_middle_node = _np.zeros((n_elements, n_nodes), dtype=bool)
+        cell_data_list = []
+        for i_element, element in enumerate(elements):
+            element_partner_indices = []
+            for i_node, node in enumerate(element.nodes):
+                nodal_coordinates[i_element, i_node] = node.coordinates
+                nodal_quaternions[i_element, i_node] = node.rotation.q
+                is_middle_node[i_element, i_node] = node.is_middle_node
+                if node.element_partner_index is not None:
+                    element_partner_indices.append(node.element_partner_index)
+
+            # Dictionary with cell data.
+            cell_data = element.vtk_cell_data.copy()
+            cell_data["cross_section_radius"] = element.material.radius
+
+            # We can output the element partner index, which is a debug quantity to help find
+            # elements with matching middle nodes. This is usually an indicator for an issue with
+            # the mesh.
+            # TODO: Check if we really need this partner index output any more
+            if len(element_partner_indices) > 1:
+                raise ValueError(
+                    "More than one element partner indices are currently not supported in the output"
+                    "functionality"
+                )
+            elif len(element_partner_indices) == 1:
+                cell_data["partner_index"] = element_partner_indices[0] + 1
+            cell_data_list.append(cell_data)
+
+        nodal_rotation_matrices = _RotationArray.from_quaternion(
+            nodal_quaternions.reshape(-1, 4), normalized=True
+        ).get_rotation_matrix()
+        nodal_rotation_matrices = nodal_rotation_matrices.reshape(
+            n_elements, n_nodes, 3, 3
+        )
 
         # Dictionary with point data.
         point_data = {}
-        point_data["node_value"] = _np.zeros(n_points)
-        point_data["base_vector_1"] = _np.zeros((n_points, 3))
-        point_data["base_vector_2"] = _np.zeros((n_points, 3))
-        point_data["base_vector_3"] = _np.zeros((n_points, 3))
-
-        coordinates = _np.zeros((n_points, 3))
-        nodal_rotation_matrices = [
-            node.rotation.get_rotation_matrix() for node in self.nodes
-        ]
-
-        for i_node, (node, rotation_matrix) in enumerate(
-            zip(self.nodes, nodal_rotation_matrices)
-        ):
-            coordinates[i_node, :] = node.coordinates
-            if node.is_middle_node:
-                point_data["node_value"][i_node] = 0.5
-            else:
-                point_data["node_value"][i_node] = 1.0
-
-            point_data["base_vector_1"][i_node] = rotation_matrix[:, 0]
-            point_data["base_vector_2"][i_node] = rotation_matrix[:, 1]
-            point_data["base_vector_3"][i_node] = rotation_matrix[:, 2]
-
-        # We can output the element partner index, which is a debug quantity to help find elements
-        # with matching middle nodes. This is usually an indicator for an issue with the mesh.
-        # TODO: Check if we really need this partner index output any more
-        element_partner_indices = list(
-            [
-                node.element_partner_index
-                for node in self.nodes
-                if node.element_partner_index is not None
-            ]
-        )
-        if len(element_partner_indices) > 1:
-            raise ValueError(
-                "More than one element partner indices are currently not supported in the output"
-                "functionality"
-            )
-        elif len(element_partner_indices) == 1:
-            cell_data["partner_index"] = element_partner_indices[0] + 1
+        point_data["node_value"] = _np.zeros((n_elements, n_points))
+        point_data["node_value"][:, :n_nodes] = _np.where(is_middle_node, 0.5, 1.0)
+        for i_dir in range(3):
+            base_vector = _np.zeros((n_elements, n_points, 3))
+            base_vector[:, :n_nodes] = nodal_rotation_matrices[:, :, :, i_dir]
+            point_data[f"base_vector_{i_dir + 1}"] = base_vector
+
+        coordinates = _np.zeros((n_elements, n_points, 3))
+        coordinates[:, :n_nodes] = nodal_coordinates
 
         # Check if we have everything we need to write output or if we need to calculate additional
         # points for a smooth beam visualization.
@@ -290,54 +416,54 @@ class Beam(_Element):
                 ]
             ).transpose()
 
-            point_connectivity = _np.zeros(n_points, dtype=int)
-
-            for i_segment in range(n_segments):
-                positions = _np.array(
-                    [
-                        self.nodes[i_node].coordinates
-                        for i_node in [i_segment, i_segment + 1]
-                    ]
-                )
-                tangents = _np.array(
-                    [
-                        nodal_rotation_matrices[i_node][:, 0]
-                        for i_node in [i_segment, i_segment + 1]
-                    ]
-                )
-                length_factor = _np.linalg.norm(positions[1] - positions[0])
-                interpolated_coordinates = _np.dot(
-                    hermite_shape_functions_pos, positions
-                ) + length_factor * _np.dot(hermite_shape_functions_tan, tangents)
-
-                index_first_point = (
-                    n_nodes + i_segment * n_additional_points_per_segment
-                )
-                index_last_point = (
-                    n_nodes + (i_segment + 1) * n_additional_points_per_segment
-                )
+            # Interpolate all segments of all elements at once, the arrays
+            # have the shape (n_elements, n_segments, n_additional_points_per_segment, 3).
+            positions = [nodal_coordinates[:, :-1], nodal_coordinates[:, 1:]]
+            tangents = [
+                nodal_rotation_matrices[:, :-1, :, 0],
+                nodal_rotation_matrices[:, 1:, :, 0],
+            ]
+            length_factor = _np.linalg.norm(positions[1] - positions[0], axis=2)
+            interpolated_coordinates = sum(
+                hermite_shape_functions_pos[:, i][:, None] * positions[i][:, :, None]
+                + length_factor[:, :, None, None]
+                * hermite_shape_functions_tan[:, i][:, None]
+                * tangents[i][:, :, None]
+                for i in range(2)
+            )
+            coordinates[:, n_nodes:] = interpolated_coordinates.reshape(
+                n_elements, n_additional_points, 3
+            )
 
-                coordinates[index_first_point:index_last_point] = (
-                    interpolated_coordinates
-                )
-                point_connectivity[
-                    i_segment * beam_centerline_visualization_segments
-                ] = i_segment
-                point_connectivity[
-                    (i_segment + 1) * beam_centerline_visualization_segments
-                ] = i_segment + 1
-                point_connectivity[
-                    i_segment * beam_centerline_visualization_segments + 1 : (
-                        i_segment + 1
-                    )
-                    * beam_centerline_visualization_segments
-                ] = _np.arange(index_first_point, index_last_point)
+            # The poly line goes through the nodes and the additional points
+            # of each segment.
+            point_connectivity = _np.zeros(
+                n_segments * beam_centerline_visualization_segments + 1, dtype=int
+            )
+            point_connectivity[::beam_centerline_visualization_segments] = _np.arange(
+                n_nodes
+            )
+            point_connectivity[
+                _np.arange(len(point_connectivity))
+                % beam_centerline_visualization_segments
+                != 0
+            ] = _np.arange(n_nodes, n_points)
 
         # Get the point data sets and add everything to the output file.
-        _add_point_data_node_sets(
-            point_data, self.nodes, extra_points=n_additional_points
+        point_data = {
+            key: value.reshape(n_elements * n_points, *value.shape[2:])
+            for key, value in point_data.items()
+        }
+        _add_point_data_node_sets_batch(
+            point_data,
+            [element.nodes for element in elements],
+            extra_points=n_additional_points,
+        )
+        indices = vtk_writer_beam.add_points(
+            coordinates.reshape(-1, 3), point_data=point_data
         )
-        indices = vtk_writer_beam.add_points(coordinates, point_data=point_data)
-        vtk_writer_beam.add_cell(
-            _vtk.vtkPolyLine, indices[point_connectivity], cell_data=cell_data
+        vtk_writer_beam.add_cells(
+            _vtk.vtkPolyLine,
+            indices.reshape(n_elements, n_points)[:, point_connectivity],
+            cell_data=_combine_data(cell_data_list),
         )
@@ -80,6 +80,53 @@ class VolumeElement(_Element):
             self.vtk_cell_type, indices[self.vtk_topology], cell_data=cell_data
         )
 
+    @classmethod
+    def get_vtk_batch(
+        cls,
+        elements,
+        vtk_writer_beam,
+        vtk_writer_solid,
+        *,
+        solid_shared_points=False,
+        **kwargs,
+    ):
+        """Add the representation of multiple elements of this class to the
+        VTK writer.
+
+        Args
+        ----
+        solid_shared_points: bool
+            If this is true, each node is added once to the solid VTK writer
+            and the cells of all elements reference these shared points. The
+            connectivity of all elements is created as a single array.
+            Otherwise, the points are added for each element individually.
+        """
+
+        if not solid_shared_points:
+            super().get_vtk_batch(elements, vtk_writer_beam, vtk_writer_solid, **kwargs)
+            return
+
+        # Check that the element has a valid vtk cell type.
+        if cls.vtk_cell_type is None:
+            raise TypeError(f"vtk_cell_type for {cls} not set!")
+
+        vtk_writer_solid.add_nodes(
+            node for element in elements for node in element.nodes
+        )
+        n_element_nodes = len(elements[0].nodes)
+        point_indices = _np.fromiter(
+            (
+                vtk_writer_solid.node_point_indices[node]
+                for element in elements
+                for node in element.nodes
+            ),
+            dtype=int,
+            count=len(elements) * n_element_nodes,
+        ).reshape(len(elements), n_element_nodes)
+        vtk_writer_solid.add_cells(
+            cls.vtk_cell_type, point_indices[:, cls.vtk_topology]
+        )
+
 
 class VolumeWEDGE6(VolumeElement):
     """A WEDGE6 volume element."""
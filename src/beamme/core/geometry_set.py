@@ -22,6 +22,7 @@
 """This module implements a basic class to manage geometry in the input
 file."""
 
+import copy as _copy
 from typing import KeysView as _KeysView
 from typing import Sequence as _Sequence
 from typing import Union as _Union
@@ -61,6 +62,11 @@ class GeometrySetBase(_BaseMeshItem):
         self.geometry_type = geometry_type
         self.name = name
 
+        # Counter that is incremented each time the contained geometry
+        # changes. This is used by the mesh to detect if the links between
+        # the nodes and the geometry sets have to be recreated.
+        self.modification_count = 0
+
     def link_to_nodes(
         self, *, link_to_nodes: str = "explicitly_contained_nodes"
     ) -> None:
@@ -107,6 +113,21 @@ class GeometrySetBase(_BaseMeshItem):
         explicit_nodes_in_this_set = self.get_node_dict()
         explicit_nodes_in_this_set[new_node] = None
         del explicit_nodes_in_this_set[old_node]
+        self.modification_count += 1
+
+    def _get_geometry(self) -> list:
+        """Return the items that define this set, i.e., the nodes or elements
+        that were added to it."""
+        raise NotImplementedError(
+            'The "_get_geometry" method has to be overwritten in the derived class'
+        )
+
+    def _copy_with_geometry(self, geometry: list) -> "GeometrySetBase":
+        """Return a copy of this set that is defined by the given items instead
+        of the items of this set, see _get_geometry."""
+        raise NotImplementedError(
+            'The "_copy_with_geometry" method has to be overwritten in the derived class'
+        )
 
     def get_node_dict(self) -> dict[_Node, None]:
         """Determine the explicitly added nodes for this set, i.e., nodes
@@ -243,6 +264,7 @@ class GeometrySet(GeometrySetBase):
             self.geometry_objects[self.geometry_type][_cast(_Node | _Element, item)] = (
                 None
             )
+            self.modification_count += 1
         else:
             raise TypeError(f"Got unexpected geometry type {type(item)}")
 
@@ -311,6 +333,35 @@ class GeometrySet(GeometrySetBase):
         """
         return list(self.geometry_objects[self.geometry_type].keys())
 
+    def _get_geometry(self) -> list[_Node | _Element]:
+        """Return the nodes or elements that were added to this set.
+
+        Returns:
+            A list with the contained geometry.
+        """
+        return self.get_geometry_objects()
+
+    def _copy_with_geometry(self, geometry: list[_Node | _Element]) -> "GeometrySet":
+        """Return a copy of this set that contains the given geometry instead
+        of the geometry of this set.
+
+        Args:
+            geometry: Geometry entries of the copy, they are not checked.
+
+        Returns:
+            The copied geometry set.
+        """
+        geometry_set = object.__new__(type(self))
+        geometry_set.__dict__.update(
+            self.__dict__,
+            geometry_objects={geo: {} for geo in _mpy.geo},
+            modification_count=0,
+        )
+        geometry_set.geometry_objects[self.geometry_type] = dict.fromkeys(geometry)
+        if self.data is not None:
+            geometry_set.data = _copy.deepcopy(self.data)
+        return geometry_set
+
     def copy(self) -> "GeometrySet":
         """Create a shallow copy of this object, the reference to the nodes
         will be the same, but the containers storing them will be copied.
@@ -361,6 +412,7 @@ class GeometrySetNodes(GeometrySetBase):
                 self.add(item)
         elif isinstance(value, (int, _Node)):
             self.nodes[value] = None
+            self.modification_count += 1
         elif isinstance(value, GeometrySetNodes):
             # Add all nodes from this geometry set.
             if self.geometry_type == value.geometry_type:
@@ -411,6 +463,32 @@ class GeometrySetNodes(GeometrySetBase):
         """
         return list(self.get_node_dict().keys())
 
+    def _get_geometry(self) -> list[_Node]:
+        """Return the nodes that were added to this set.
+
+        Returns:
+            A list with the contained nodes.
+        """
+        return list(self.nodes.keys())
+
+    def _copy_with_geometry(self, geometry: list[_Node]) -> "GeometrySetNodes":
+        """Return a copy of this set that contains the given nodes instead of
+        the nodes of this set.
+
+        Args:
+            geometry: Nodes of the copy, they are not checked.
+
+        Returns:
+            The copied geometry set.
+        """
+        geometry_set = object.__new__(type(self))
+        geometry_set.__dict__.update(
+            self.__dict__, nodes=dict.fromkeys(geometry), modification_count=0
+        )
+        if self.data is not None:
+            geometry_set.data = _copy.deepcopy(self.data)
+        return geometry_set
+
     def copy(self) -> "GeometrySetNodes":
         """Create a shallow copy of this object, the reference to the nodes
         will be the same, but the containers storing them will be copied.
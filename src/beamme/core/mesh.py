@@ -23,8 +23,10 @@
 elements, sets, ...) for a meshed geometry."""
 
 import copy as _copy
+import itertools as _itertools
 import os as _os
 import warnings as _warnings
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from typing import Dict as _Dict
 from typing import List as _List
 from typing import Optional as _Optional
@@ -39,6 +41,8 @@ from beamme.core.boundary_condition import (
     BoundaryConditionContainer as _BoundaryConditionContainer,
 )
 from beamme.core.conf import mpy as _mpy
+from beamme.core.container import IndexedList as _IndexedList
+from beamme.core.container import NodeAdjacency as _NodeAdjacency
 from beamme.core.coupling import coupling_factory as _coupling_factory
 from beamme.core.element import Element as _Element
 from beamme.core.element_beam import Beam as _Beam
@@ -49,10 +53,13 @@ from beamme.core.geometry_set import GeometrySetContainer as _GeometrySetContain
 from beamme.core.material import Material as _Material
 from beamme.core.node import Node as _Node
 from beamme.core.node import NodeCosserat as _NodeCosserat
+from beamme.core.node import NodeStore as _NodeStore
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.core.rotation import add_rotations as _add_rotations
 from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
 from beamme.core.vtk_writer import VTKWriter as _VTKWriter
+from beamme.core.vtk_writer import write_pvd as _write_pvd
 from beamme.geometric_search.find_close_points import (
     find_close_points as _find_close_points,
 )
@@ -68,12 +75,68 @@ from beamme.utils.nodes import get_nodal_quaternions as _get_nodal_quaternions
 from beamme.utils.nodes import get_nodes_by_function as _get_nodes_by_function
 
 
+def _reflect_nodal_arrays(pos, rot1, normal_vector, origin, flip_beams):
+    """Return the reflected positions and rotations of nodes, see
+    Mesh.reflect."""
+
+    # Normalize the normal vector.
+    normal_vector = _np.asarray(normal_vector) / _np.linalg.norm(normal_vector)
+
+    # Check if origin has to be added.
+    if origin is not None:
+        pos = pos - origin
+
+    # Get the reflection matrix A.
+    A = _np.eye(3) - 2.0 * _np.outer(normal_vector, normal_vector)
+
+    # Calculate the new positions.
+    pos_new = _np.dot(pos, A)
+
+    # Move back from the origin.
+    if origin is not None:
+        pos_new += origin
+
+    # First get all e3 vectors of the nodes.
+    e3 = _np.zeros_like(pos)
+    e3[:, 0] = 2 * (rot1[:, 0] * rot1[:, 2] + rot1[:, 1] * rot1[:, 3])
+    e3[:, 1] = 2 * (-1 * rot1[:, 0] * rot1[:, 1] + rot1[:, 2] * rot1[:, 3])
+    e3[:, 2] = rot1[:, 0] ** 2 - rot1[:, 1] ** 2 - rot1[:, 2] ** 2 + rot1[:, 3] ** 2
+
+    # Get the dot and cross product of e3 and the normal vector.
+    rot2 = _np.zeros_like(rot1)
+    rot2[:, 0] = _np.dot(e3, normal_vector)
+    rot2[:, 1:] = _np.cross(e3, normal_vector)
+
+    # Add to the existing rotations.
+    rot_new = _add_rotations(rot2, rot1)
+
+    if flip_beams:
+        # To achieve the flip, the triads are rotated with the angle pi
+        # around the e2 axis.
+        rot_flip = _Rotation([0, 1, 0], _np.pi)
+        rot_new = _add_rotations(rot_new, rot_flip)
+
+    return pos_new, rot_new
+
+
 class Mesh:
     """A class that contains a full mesh, i.e. Nodes, Elements, Boundary
     Conditions, Sets, Couplings, Materials and Functions."""
 
-    def __init__(self):
-        """Initialize all empty containers."""
+    def __init__(self, *, use_node_store: bool = False):
+        """Initialize all empty containers.
+
+        Args:
+            use_node_store: If this is true, the nodal data (coordinates and
+                quaternions) of all nodes in this mesh is stored in contiguous
+                arrays (see NodeStore). Transformations of the whole mesh are
+                then performed directly on these arrays, which considerably
+                improves the performance for large meshes.
+        """
+
+        # Counter for changes of the connectivity between the mesh items, see
+        # _get_topology_version.
+        self._topology_version = 0
 
         self.nodes = []
         self.elements = []
@@ -82,6 +145,47 @@ class Mesh:
         self.geometry_sets = _GeometrySetContainer()
         self.boundary_conditions = _BoundaryConditionContainer()
 
+        self.use_node_store = use_node_store
+        self._node_store = None
+
+        # The node list and its modification count when the node store was
+        # last updated, see get_node_store.
+        self._node_store_state = None
+
+        # Cached adjacencies between the nodes and other mesh items, see
+        # _link_nodes.
+        self._node_adjacencies: dict = {}
+
+    @property
+    def nodes(self) -> _IndexedList:
+        """List with all nodes of this mesh.
+
+        The list keeps an index of its items, i.e., checking if a node
+        is in the mesh is done in constant time.
+        """
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: _List) -> None:
+        """Set the nodes of this mesh."""
+        self._nodes = _IndexedList(nodes)
+        self.increment_topology_version()
+
+    @property
+    def elements(self) -> _IndexedList:
+        """List with all elements of this mesh.
+
+        The list keeps an index of its items, i.e., checking if an
+        element is in the mesh is done in constant time.
+        """
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: _List) -> None:
+        """Set the elements of this mesh."""
+        self._elements = _IndexedList(elements)
+        self.increment_topology_version()
+
     @staticmethod
     def get_base_mesh_item_type(item):
         """Return the base mesh type of the given item.
@@ -102,6 +206,7 @@ class Mesh:
             _Element,
             _GeometrySetBase,
             _GeometryName,
+            list,
         ):
             if isinstance(item, cls):
                 return cls
@@ -215,16 +320,20 @@ class Mesh:
                 base types of the list items are the same.
 
                 In the special case of a node or element list, we add the whole list
-                at once. This avoids a check for duplicate entries for every
-                addition, which scales very badly. By doing it this way we only
-                check the final list for duplicate entries which is much more
-                performant.
+                at once. The check for duplicate entries is done with the index
+                of the internal lists, i.e., it only scales with the number of
+                added items.
 
                 For all other types of items, we add each element individually
                 via the Mesh.add method.
         """
 
-        types = {self.get_base_mesh_item_type(item) for item in add_list}
+        # The base type only depends on the type of the item, so we only have to
+        # check one item per type.
+        types = {
+            self.get_base_mesh_item_type(item)
+            for item in {type(item): item for item in add_list}.values()
+        }
         if len(types) > 1:
             raise TypeError(
                 f"You can only add lists with the same type of element. Got {types}"
@@ -232,17 +341,19 @@ class Mesh:
         elif len(types) == 1:
             list_type = types.pop()
 
-            def extend_internal_list(self_list: _List, new_list: _List) -> None:
+            def extend_internal_list(self_list: _IndexedList, new_list: _List) -> None:
                 """Extend an internal list with the new list.
 
                 It is checked that the final list does not have
                 duplicate entries.
                 """
-                self_list.extend(new_list)
-                if not len(set(self_list)) == len(self_list):
+                if len(set(new_list)) != len(new_list) or any(
+                    item in self_list for item in new_list
+                ):
                     raise ValueError(
                         "The added list contains entries already existing in the Mesh"
                     )
+                self_list.extend(new_list)
 
             if list_type == _Node:
                 extend_internal_list(self.nodes, add_list)
@@ -259,12 +370,85 @@ class Mesh:
         if new_node not in self.nodes:
             raise ValueError("The new node is not in the mesh!")
 
-        for i, node in enumerate(self.nodes):
-            if node == old_node:
-                del self.nodes[i]
-                break
-        else:
+        if old_node not in self.nodes:
             raise ValueError("The node that should be replaced is not in the mesh")
+        del self.nodes[self.nodes.index(old_node)]
+        self.increment_topology_version()
+
+    def replace_nodes(self, replace_nodes: _Dict[_Node, _Node]) -> None:
+        """Replace multiple nodes in this mesh at once.
+
+        The nodes are replaced in the elements and geometry sets of this mesh
+        (including the sets of boundary conditions) and removed from the
+        nodes of this mesh.
+
+        Args:
+            replace_nodes: Dictionary where the keys are the nodes that should
+                be replaced and the values are the nodes that will be placed
+                instead. The nodes are replaced in the order of this
+                dictionary.
+        """
+
+        if len(replace_nodes) == 0:
+            return
+
+        for old_node, new_node in replace_nodes.items():
+            if not isinstance(old_node, type(new_node)):
+                raise TypeError(
+                    "A node can only be replaced by a node with the same type. "
+                    + f"Got {type(old_node)} and {type(new_node)}"
+                )
+            if new_node not in self.nodes:
+                raise ValueError("The new node is not in the mesh!")
+            if new_node in replace_nodes:
+                raise ValueError("The new node can not be replaced itself!")
+            if old_node not in self.nodes:
+                raise ValueError("The node that should be replaced is not in the mesh")
+
+        # Replace the nodes in the elements.
+        for element in self.elements:
+            if not replace_nodes.keys().isdisjoint(element.nodes):
+                for node in [node for node in element.nodes if node in replace_nodes]:
+                    element.replace_node(node, replace_nodes[node])
+
+        # Replace the explicitly contained nodes in the geometry sets.
+        replace_order = {node: i for i, node in enumerate(replace_nodes)}
+        for geometry_sets in self.get_unique_geometry_sets().values():
+            for geometry_set in geometry_sets:
+                for node in sorted(
+                    replace_nodes.keys() & geometry_set.get_node_dict().keys(),
+                    key=replace_order.get,
+                ):
+                    geometry_set.replace_node(node, replace_nodes[node])
+
+        self.nodes = [node for node in self.nodes if node not in replace_nodes]
+        for old_node, new_node in replace_nodes.items():
+            old_node.master_node = new_node.get_master_node()
+        self.increment_topology_version()
+
+    def increment_topology_version(self) -> None:
+        """Mark that the connectivity between the items of this mesh changed.
+
+        This invalidates the cached links between the nodes and the
+        elements of this mesh. Adding nodes or elements to the mesh and
+        replacing nodes via the mesh or the elements automatically
+        increments the topology version.
+        """
+        self._topology_version += 1
+
+    def _get_topology_version(self):
+        """Return an identifier for the current connectivity between the
+        nodes and the elements of this mesh.
+
+        The identifier changes if nodes or elements are added to or removed
+        from this mesh, or if nodes are replaced. Changes of element.nodes
+        that are not done via Element.replace_node are not detected.
+        """
+        return (
+            self._topology_version,
+            self.nodes.modification_count,
+            self.elements.modification_count,
+        )
 
     def get_unique_geometry_sets(
         self,
@@ -297,10 +481,6 @@ class Mesh:
         """
 
         is_link_nodes = not link_to_nodes == "no_link"
-        if is_link_nodes:
-            # First clear all links in existing nodes.
-            for node in self.nodes:
-                node.node_sets_link = []
 
         # Make a copy of the sets in this mesh.
         mesh_sets = self.geometry_sets.copy()
@@ -330,8 +510,49 @@ class Mesh:
             for i, geometry_set in enumerate(mesh_sets[key]):
                 # Add global indices to the geometry set.
                 geometry_set.i_global = i + 1 + i_global_offset
-                if is_link_nodes:
-                    geometry_set.link_to_nodes(link_to_nodes=link_to_nodes)
+
+        if is_link_nodes:
+            # Link the nodes to the geometry sets, this replaces all existing
+            # links in the nodes of this mesh.
+            geometry_sets = [
+                geometry_set
+                for geometry_set_list in mesh_sets.values()
+                for geometry_set in geometry_set_list
+            ]
+            if link_to_nodes == "explicitly_contained_nodes":
+
+                def get_geometry_sets_nodes():
+                    """Return the explicitly contained nodes of each set."""
+                    return [
+                        list(geometry_set.get_node_dict().keys())
+                        for geometry_set in geometry_sets
+                    ]
+
+            elif link_to_nodes == "all_nodes":
+
+                def get_geometry_sets_nodes():
+                    """Return all nodes of each set."""
+                    return [
+                        geometry_set.get_all_nodes() for geometry_set in geometry_sets
+                    ]
+
+            else:
+                raise ValueError(f'Got unexpected value link nodes="{link_to_nodes}"')
+            # The nodes in the geometry sets can change without the mesh noticing,
+            # therefore, the modification counts of the sets are part of the
+            # version.
+            self._link_nodes(
+                ("_node_sets_link", link_to_nodes),
+                (
+                    self._get_topology_version(),
+                    tuple(
+                        (geometry_set, geometry_set.modification_count)
+                        for geometry_set in geometry_sets
+                    ),
+                ),
+                geometry_sets,
+                get_geometry_sets_nodes,
+            )
 
         return mesh_sets
 
@@ -340,12 +561,107 @@ class Mesh:
 
         Also add a link to this mesh.
         """
-        for element in self.elements:
-            for node in element.nodes:
-                node.element_link.append(element)
+        self._link_nodes(
+            ("_element_link",),
+            self._get_topology_version(),
+            self.elements,
+            lambda: [element.nodes for element in self.elements],
+        )
         for node in self.nodes:
             node.mesh = self
 
+    def _link_nodes(self, key, version, items, get_items_nodes):
+        """Link the nodes to the items they are connected to.
+
+        The adjacency between the nodes and the items is cached and only
+        recreated if the given version changed.
+
+        Args:
+            key: Tuple whose first entry is the name of the link attribute in
+                the nodes. The full tuple identifies the cached adjacency.
+            version: Identifier for the state of the nodes, the items and
+                their connectivity, see _get_topology_version.
+            items: List of items, e.g., elements or geometry sets.
+            get_items_nodes: Function that returns a list with the list of
+                connected nodes for each item.
+        """
+        cached_version, adjacency = self._node_adjacencies.get(key, (None, None))
+        if adjacency is None or cached_version != version:
+            adjacency = _NodeAdjacency(self.nodes, items, get_items_nodes())
+            self._node_adjacencies[key] = (version, adjacency)
+        adjacency.link_nodes(key[0])
+
+    def get_node_store(self) -> _NodeStore:
+        """Return a node store that contains all nodes of this mesh.
+
+        If nodes were appended to this mesh since the node store was last
+        updated, they are added to the existing node store. For all other
+        changes of the nodes of this mesh, e.g., removed nodes, a new node
+        store is created.
+        """
+        node_store = self._node_store
+        if node_store is not None and node_store.is_valid:
+            nodes, modification_count = self._node_store_state
+            if nodes is self.nodes:
+                if self.nodes.modification_count == modification_count:
+                    return node_store
+                if self.nodes.last_non_append_modification <= modification_count:
+                    node_store.extend(self.nodes[len(node_store) :])
+                    self._node_store_state = (self.nodes, self.nodes.modification_count)
+                    return node_store
+
+        if node_store is not None:
+            node_store.release()
+        self._node_store = _NodeStore(self.nodes)
+        self._node_store_state = (self.nodes, self.nodes.modification_count)
+        return self._node_store
+
+    def get_nodal_arrays(self):
+        """Return arrays with the coordinates and quaternions of all nodes.
+
+        If the node store is used, the arrays of the store are returned,
+        i.e., they must not be modified in-place. Use
+        :meth:`set_nodal_arrays` to change the nodal values.
+
+        Return
+        ----
+        coordinates: _np.ndarray (n_nodes x 3)
+            Coordinates of all nodes in the mesh.
+        quaternions: _np.ndarray (n_nodes x 4)
+            Quaternions of all nodes in the mesh. Nodes without rotations
+            have the quaternion [2, 0, 0, 0].
+        """
+        if self.use_node_store:
+            node_store = self.get_node_store()
+            return node_store.coordinates, node_store.quaternions
+        return _get_nodal_coordinates(self.nodes), _get_nodal_quaternions(self.nodes)
+
+    def set_nodal_arrays(self, *, coordinates=None, quaternions=None):
+        """Set the coordinates and/or quaternions of all nodes.
+
+        Args
+        ----
+        coordinates: _np.ndarray (n_nodes x 3)
+            New coordinates of all nodes in the mesh.
+        quaternions: _np.ndarray (n_nodes x 4)
+            New quaternions of all nodes in the mesh. The quaternions are
+            only set for nodes with rotations.
+        """
+        if self.use_node_store:
+            node_store = self.get_node_store()
+            if coordinates is not None:
+                node_store.coordinates[:] = coordinates
+            if quaternions is not None:
+                node_store.quaternions[node_store.is_cosserat] = quaternions[
+                    node_store.is_cosserat
+                ]
+        else:
+            for i, node in enumerate(self.nodes):
+                if coordinates is not None:
+                    node.coordinates = coordinates[i, :]
+                if quaternions is not None and isinstance(node, _NodeCosserat):
+                    node.rotation.q = quaternions[i, :]
+
     def translate(self, vector):
         """Translate all beam nodes of this mesh.
 
@@ -354,8 +670,11 @@ class Mesh:
         vector: _np.array, list
             3D vector that will be added to all nodes.
         """
-        for node in self.nodes:
-            node.coordinates += vector
+        if self.use_node_store:
+            self.get_node_store().coordinates += vector
+        else:
+            for node in self.nodes:
+                node.coordinates += vector
 
     def rotate(self, rotation, origin=None, only_rotate_triads=False):
         """Rotate all beam nodes of the mesh with rotation.
@@ -372,22 +691,17 @@ class Mesh:
             If true the nodal positions are not changed.
         """
 
-        # Get array with all quaternions for the nodes.
-        rot1 = _get_nodal_quaternions(self.nodes)
+        # Get array with all positions and quaternions for the nodes.
+        pos, rot1 = self.get_nodal_arrays()
 
         # Apply the rotation to the rotation of all nodes.
         rot_new = _add_rotations(rotation, rot1)
 
-        if not only_rotate_triads:
-            # Get array with all positions for the nodes.
-            pos = _get_nodal_coordinates(self.nodes)
+        if only_rotate_triads:
+            self.set_nodal_arrays(quaternions=rot_new)
+        else:
             pos_new = _rotate_coordinates(pos, rotation, origin=origin)
-
-        for i, node in enumerate(self.nodes):
-            if isinstance(node, _NodeCosserat):
-                node.rotation.q = rot_new[i, :]
-            if not only_rotate_triads:
-                node.coordinates = pos_new[i, :]
+            self.set_nodal_arrays(coordinates=pos_new, quaternions=rot_new)
 
     def reflect(self, normal_vector, origin=None, flip_beams=False):
         """Reflect all nodes of the mesh with respect to a plane defined by its
@@ -418,62 +732,29 @@ class Mesh:
             beam is reversed.
         """
 
-        # Normalize the normal vector.
-        normal_vector = _np.asarray(normal_vector) / _np.linalg.norm(normal_vector)
-
-        # Get array with all quaternions and positions for the nodes.
-        pos = _get_nodal_coordinates(self.nodes)
-        rot1 = _get_nodal_quaternions(self.nodes)
-
-        # Check if origin has to be added.
-        if origin is not None:
-            pos -= origin
-
-        # Get the reflection matrix A.
-        A = _np.eye(3) - 2.0 * _np.outer(normal_vector, normal_vector)
-
-        # Calculate the new positions.
-        pos_new = _np.dot(pos, A)
-
-        # Move back from the origin.
-        if origin is not None:
-            pos_new += origin
-
-        # First get all e3 vectors of the nodes.
-        e3 = _np.zeros_like(pos)
-        e3[:, 0] = 2 * (rot1[:, 0] * rot1[:, 2] + rot1[:, 1] * rot1[:, 3])
-        e3[:, 1] = 2 * (-1 * rot1[:, 0] * rot1[:, 1] + rot1[:, 2] * rot1[:, 3])
-        e3[:, 2] = rot1[:, 0] ** 2 - rot1[:, 1] ** 2 - rot1[:, 2] ** 2 + rot1[:, 3] ** 2
-
-        # Get the dot and cross product of e3 and the normal vector.
-        rot2 = _np.zeros_like(rot1)
-        rot2[:, 0] = _np.dot(e3, normal_vector)
-        rot2[:, 1:] = _np.cross(e3, normal_vector)
-
-        # Add to the existing rotations.
-        rot_new = _add_rotations(rot2, rot1)
-
-        if flip_beams:
-            # To achieve the flip, the triads are rotated with the angle pi
-            # around the e2 axis.
-            rot_flip = _Rotation([0, 1, 0], _np.pi)
-            rot_new = _add_rotations(rot_new, rot_flip)
+        # Get the reflected positions and rotations of all nodes.
+        pos_new, rot_new = _reflect_nodal_arrays(
+            *self.get_nodal_arrays(), normal_vector, origin, flip_beams
+        )
 
         # For solid elements we need to adapt the connectivity to avoid negative Jacobians.
         # For beam elements this is optional.
-        for element in self.elements:
+        self._flip_reflected_elements(self.elements, flip_beams)
+
+        # Set the new positions and rotations.
+        self.set_nodal_arrays(coordinates=pos_new, quaternions=rot_new)
+
+    @staticmethod
+    def _flip_reflected_elements(elements, flip_beams):
+        """Flip the given elements after they were reflected, see
+        Mesh.reflect."""
+        for element in elements:
             if isinstance(element, _Beam):
                 if flip_beams:
                     element.flip()
             else:
                 element.flip()
 
-        # Set the new positions and rotations.
-        for i, node in enumerate(self.nodes):
-            node.coordinates = pos_new[i, :]
-            if isinstance(node, _NodeCosserat):
-                node.rotation.q = rot_new[i, :]
-
     def wrap_around_cylinder(self, radius=None, advanced_warning=True):
         """Wrap the geometry around a cylinder. The y-z plane gets morphed into
         the z-axis of symmetry. If all nodes are on the same y-z plane, the
@@ -493,7 +774,7 @@ class Mesh:
             cases (up to 100,000 elements) this check can be left activated.
         """
 
-        pos = _get_nodal_coordinates(self.nodes)
+        pos, _ = self.get_nodal_arrays()
         quaternions = _np.zeros([len(self.nodes), 4])
 
         # The x coordinate is the radius, the y coordinate the arc length.
@@ -572,16 +853,16 @@ class Mesh:
         quaternions[:, 0] = _np.cos(0.5 * phi)
         quaternions[:, 3] = _np.sin(0.5 * phi)
 
-        # Set the new positions in the global array.
-        pos[:, 0] = radius_points * _np.cos(phi)
-        pos[:, 1] = radius_points * _np.sin(phi)
+        # Get the new positions.
+        pos_new = pos.copy()
+        pos_new[:, 0] = radius_points * _np.cos(phi)
+        pos_new[:, 1] = radius_points * _np.sin(phi)
 
         # Rotate the mesh
         self.rotate(quaternions, only_rotate_triads=True)
 
         # Set the new position for the nodes.
-        for i, node in enumerate(self.nodes):
-            node.coordinates = pos[i, :]
+        self.set_nodal_arrays(coordinates=pos_new)
 
     def couple_nodes(
         self,
@@ -638,79 +919,67 @@ class Mesh:
             # Check if there are nodes with the same rotation. If there are the
             # nodes are reused, and no coupling is inserted.
 
-            # Set the links to all nodes in the mesh. In this case we have to use
-            # "all_nodes" since we also have to replace nodes that are in existing
-            # GeometrySetNodes.
-            self.unlink_nodes()
-            self.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
-            self.set_node_links()
+            # Get array with rotation vectors of all partner nodes. For the
+            # case of nodes that belong to solid elements, we define the
+            # default value [4 * pi, 0, 0].
+            partner_node_list = list(_itertools.chain.from_iterable(partner_nodes))
+            is_cosserat = _np.array(
+                [isinstance(node, _NodeCosserat) for node in partner_node_list]
+            )
+            rotation_vectors = _np.zeros([len(partner_node_list), 3])
+            rotation_vectors[:, 0] = 4 * _np.pi
+            if _np.any(is_cosserat):
+                rotation_vectors[is_cosserat] = _RotationArray.from_quaternion(
+                    _get_nodal_quaternions(partner_node_list)[is_cosserat],
+                    normalized=True,
+                ).get_rotation_vector()
+
+            # Use find close points function to find nodes with the same
+            # rotation for all partner clusters at once. The index of the
+            # partner cluster is added as an additional coordinate, so only
+            # nodes in the same cluster can be found as partners.
+            cluster_ids = _np.repeat(
+                _np.arange(len(partner_nodes)),
+                [len(node_list) for node_list in partner_nodes],
+            )
+            partners, _n_partners = _find_close_points(
+                _np.column_stack([rotation_vectors, cluster_ids]),
+                tol=_mpy.eps_quaternion,
+            )
 
             # Go through partner nodes.
+            replace_nodes = {}
+            master_nodes = {}
+            offset = 0
             for node_list in partner_nodes:
-                # Get array with rotation vectors.
-                rotation_vectors = _np.zeros([len(node_list), 3])
-                for i, node in enumerate(node_list):
-                    if isinstance(node, _NodeCosserat):
-                        rotation_vectors[i, :] = node.rotation.get_rotation_vector()
+                cluster_partners = partners[offset : offset + len(node_list)]
+                offset += len(node_list)
+
+                # Add the nodes that will be coupled and get the nodes that
+                # need to be replaced. The first node of a partner set remains,
+                # the other ones will be replaced with this one.
+                coupling_nodes = []
+                for node, partner in zip(node_list, cluster_partners):
+                    if partner == -1:
+                        # This node does not have a partner with the same
+                        # rotation.
+                        coupling_nodes.append(node)
+                    elif partner in master_nodes:
+                        replace_nodes[node] = master_nodes[partner]
                     else:
-                        # For the case of nodes that belong to solid elements,
-                        # we define the following default value:
-                        rotation_vectors[i, :] = [4 * _np.pi, 0, 0]
-
-                # Use find close points function to find nodes with the
-                # same rotation.
-                partners, n_partners = _find_close_points(
-                    rotation_vectors, tol=_mpy.eps_quaternion
-                )
+                        master_nodes[partner] = node
+                        coupling_nodes.append(node)
 
-                # Check if nodes with the same rotations were found.
-                if n_partners == 0:
+                # Add the coupling nodes.
+                if len(coupling_nodes) > 1:
                     self.add(
-                        _coupling_factory(node_list, coupling_type, coupling_dof_type)
-                    )
-                else:
-                    # There are nodes that need to be combined.
-                    combining_nodes = []
-                    coupling_nodes = []
-                    found_partner_id = [None for _i in range(n_partners)]
-
-                    # Add the nodes that need to be combined and add the nodes
-                    # that will be coupled.
-                    for i, partner in enumerate(partners):
-                        if partner == -1:
-                            # This node does not have a partner with the same
-                            # rotation.
-                            coupling_nodes.append(node_list[i])
-
-                        elif found_partner_id[partner] is not None:
-                            # This node has already a processed partner, add
-                            # this one to the combining nodes.
-                            combining_nodes[found_partner_id[partner]].append(
-                                node_list[i]
-                            )
-
-                        else:
-                            # This is the first node of a partner set that was
-                            # found. This one will remain, the other ones will
-                            # be replaced with this one.
-                            new_index = len(combining_nodes)
-                            found_partner_id[partner] = new_index
-                            combining_nodes.append([node_list[i]])
-                            coupling_nodes.append(node_list[i])
-
-                    # Add the coupling nodes.
-                    if len(coupling_nodes) > 1:
-                        self.add(
-                            _coupling_factory(
-                                coupling_nodes, coupling_type, coupling_dof_type
-                            )
+                        _coupling_factory(
+                            coupling_nodes, coupling_type, coupling_dof_type
                         )
+                    )
 
-                    # Replace the identical nodes.
-                    for combine_list in combining_nodes:
-                        master_node = combine_list[0]
-                        for node in combine_list[1:]:
-                            node.replace_with(master_node)
+            # Replace the identical nodes.
+            self.replace_nodes(replace_nodes)
 
         else:
             # Connect close nodes with a coupling.
@@ -806,9 +1075,12 @@ class Mesh:
             # Check for overlapping elements.
             self.check_overlapping_elements(raise_error=False)
 
-        # Get representation of elements.
-        for element in self.elements:
-            element.get_vtk(vtk_writer_beam, vtk_writer_solid, **kwargs)
+        # Get representation of elements. Consecutive elements of the same
+        # type are processed at once.
+        for element_type, elements in _itertools.groupby(self.elements, key=type):
+            element_type.get_vtk_batch(
+                list(elements), vtk_writer_beam, vtk_writer_solid, **kwargs
+            )
 
         # Finish and return the writers
         vtk_writer_beam.complete_data()
@@ -816,7 +1088,14 @@ class Mesh:
         return vtk_writer_beam, vtk_writer_solid
 
     def write_vtk(
-        self, output_name="beamme", output_directory="", binary=True, **kwargs
+        self,
+        output_name="beamme",
+        output_directory="",
+        binary=True,
+        *,
+        n_pieces=1,
+        n_threads=None,
+        **kwargs,
     ):
         """Write the contents of this mesh to VTK files.
 
@@ -829,29 +1108,169 @@ class Mesh:
             Directory where the output files will be written.
         binary: bool
             If the data should be written encoded in binary or in human readable text
+        n_pieces: int
+            If this is larger than 1, the output is split into n_pieces
+            spatially coherent pieces that are written in parallel. There will
+            be a {}_beam.pvtu and {}_solid.pvtu file that reference the pieces.
+        n_threads: int
+            Number of threads used to write the pieces.
 
         **kwargs
             For all of them look into:
                 Mesh().get_vtk_representation
                 Beam().get_vtk
-                VolumeElement().get_vtk
+                VolumeElement().get_vtk_batch
         ----
         beam_centerline_visualization_segments: int
             Number of segments to be used for visualization of beam centerline between successive
             nodes. Default is 1, which means a straight line is drawn between the beam nodes. For
             Values greater than 1, a Hermite interpolation of the centerline is assumed for
             visualization purposes.
+        solid_shared_points: bool
+            If this is true, each node of the volume elements is written once to the
+            solid output and the cells reference these shared points. Otherwise, the
+            points are written for each element individually. Default is False.
         """
 
-        vtk_writer_beam, vtk_writer_solid = self.get_vtk_representation(**kwargs)
+        vtk_writers = self.get_vtk_representation(**kwargs)
 
         # Write to file, only if there is at least one point in the writer.
-        if vtk_writer_beam.points.GetNumberOfPoints() > 0:
-            filepath = _os.path.join(output_directory, output_name + "_beam.vtu")
-            vtk_writer_beam.write_vtk(filepath, binary=binary)
-        if vtk_writer_solid.points.GetNumberOfPoints() > 0:
-            filepath = _os.path.join(output_directory, output_name + "_solid.vtu")
-            vtk_writer_solid.write_vtk(filepath, binary=binary)
+        for vtk_writer, suffix in zip(vtk_writers, ["_beam", "_solid"]):
+            if vtk_writer.points.GetNumberOfPoints() > 0:
+                filepath = _os.path.join(output_directory, output_name + suffix)
+                self._write_vtk_writer(
+                    vtk_writer, filepath, binary, n_pieces, n_threads
+                )
+
+    def write_vtk_series(
+        self,
+        positions,
+        output_name="beamme",
+        output_directory="",
+        *,
+        rotations=None,
+        times=None,
+        binary=True,
+        n_pieces=1,
+        n_threads=None,
+        **kwargs,
+    ):
+        """Write the contents of this mesh for a series of nodal configurations
+        to VTK files.
+
+        For each configuration, the files {}_beam_{step}.vtu and
+        {}_solid_{step}.vtu (or .pvtu if n_pieces > 1) are written. The
+        ParaView collection files {}_beam.pvd and {}_solid.pvd reference the
+        files of all steps. The configurations are written in parallel. After
+        the output, the nodes are reset to their original configuration.
+
+        Args
+        ----
+        positions: _np.array (n_steps x n_nodes x 3)
+            The coordinates of all nodes of this mesh for each step, e.g.,
+            the positions from get_mesh_transformation.
+        output_name: str
+            Base name of the output files.
+        output_directory: path
+            Directory where the output files will be written.
+        rotations: _np.array (n_steps x n_nodes x 4)
+            The quaternions of all nodes for each step. They are only applied
+            to nodes with rotations. Per default the rotations are not changed.
+        times: list(float)
+            Time value of each step in the collection files. Defaults to the
+            step index.
+        binary: bool
+            If the data should be written encoded in binary or in human readable text
+        n_pieces: int
+            If this is larger than 1, the output of each step is split into
+            n_pieces pieces, see write_vtk.
+        n_threads: int
+            Number of threads used to write the files. Each thread writes all
+            pieces of a step.
+
+        **kwargs
+            Passed on to Mesh().get_vtk_representation, see write_vtk.
+        """
+
+        positions = _np.asarray(positions, dtype=float)
+        n_steps = len(positions)
+        if rotations is not None and len(rotations) != n_steps:
+            raise ValueError(
+                f"Got {len(rotations)} rotations for {n_steps} configurations!"
+            )
+        if times is None:
+            times = range(n_steps)
+        elif len(times) != n_steps:
+            raise ValueError(f"Got {len(times)} times for {n_steps} configurations!")
+
+        # Copy the original configuration, so it can be restored afterwards.
+        coordinates, quaternions = (array.copy() for array in self.get_nodal_arrays())
+
+        digits = len(str(n_steps - 1))
+        datasets = {"_beam": [], "_solid": []}
+        with _ThreadPoolExecutor(n_threads) as executor:
+            futures = []
+            try:
+                for i_step, time in enumerate(times):
+                    self.set_nodal_arrays(
+                        coordinates=positions[i_step],
+                        quaternions=None if rotations is None else rotations[i_step],
+                    )
+                    vtk_writers = self.get_vtk_representation(**kwargs)
+                    for vtk_writer, suffix in zip(vtk_writers, datasets.keys()):
+                        if vtk_writer.points.GetNumberOfPoints() > 0:
+                            filepath = _os.path.join(
+                                output_directory,
+                                f"{output_name}{suffix}_{i_step:0{digits}d}",
+                            )
+                            futures.append(
+                                executor.submit(
+                                    self._write_vtk_writer,
+                                    vtk_writer,
+                                    filepath,
+                                    binary,
+                                    n_pieces,
+                                    # The steps are already written in
+                                    # parallel, so the pieces of one step are
+                                    # written by a single thread.
+                                    1,
+                                )
+                            )
+                            datasets[suffix].append((time, futures[-1]))
+            finally:
+                self.set_nodal_arrays(coordinates=coordinates, quaternions=quaternions)
+
+        for suffix, suffix_datasets in datasets.items():
+            if len(suffix_datasets) > 0:
+                _write_pvd(
+                    _os.path.join(output_directory, output_name + suffix + ".pvd"),
+                    [(time, future.result()) for time, future in suffix_datasets],
+                )
+
+    @staticmethod
+    def _write_vtk_writer(vtk_writer, filepath, binary, n_pieces, n_threads):
+        """Write a VTK writer to a vtu file, or to a pvtu file with n_pieces
+        pieces.
+
+        Args
+        ----
+        filepath: str
+            Path of the output file without the file extension.
+
+        Return
+        ----
+        filepath: str
+            Path of the written file.
+        """
+        if n_pieces > 1:
+            filepath += ".pvtu"
+            vtk_writer.write_pvtu(
+                filepath, n_pieces, binary=binary, n_threads=n_threads
+            )
+        else:
+            filepath += ".vtu"
+            vtk_writer.write_vtk(filepath, binary=binary)
+        return filepath
 
     def display_pyvista(
         self,
@@ -900,6 +1319,8 @@ class Mesh:
             nodes. Default is 1, which means a straight line is drawn between the beam nodes. For
             Values greater than 1, a Hermite interpolation of the centerline is assumed for
             visualization purposes.
+        solid_shared_points: bool
+            See Mesh().get_vtk_representation. Default is True for the display.
         """
 
         plotter = _pv.Plotter()
@@ -908,6 +1329,9 @@ class Mesh:
         if parallel_projection:
             plotter.enable_parallel_projection()
 
+        # The solid nodes are only written once, the remaining coincident
+        # points, e.g., of uncoupled nodes, are merged by cleaning the grid.
+        kwargs.setdefault("solid_shared_points", True)
         vtk_writer_beam, vtk_writer_solid = self.get_vtk_representation(**kwargs)
 
         if vtk_writer_beam.points.GetNumberOfPoints() > 0:
@@ -1010,3 +1434,145 @@ class Mesh:
         The functions and materials will not be deep copied.
         """
         return _copy.deepcopy(self)
+
+    def replicate(
+        self,
+        translations,
+        *,
+        rotations=None,
+        origin=None,
+        reflection_normal=None,
+        flip_beams=False,
+    ) -> "Mesh":
+        """Return a new mesh with transformed copies of this mesh.
+
+        Each copy is first reflected (if reflection_normal is given), then
+        rotated and then translated. This is the same as calling copy,
+        reflect, rotate and translate for each copy and adding the copies to
+        a new mesh, but the transformations of all copies are evaluated at
+        once and the items of the mesh are copied without deep copying the
+        mesh. The elements of the copies are created from the connectivity of
+        this mesh and the geometry sets are mapped to the copied items via
+        their indices.
+
+        The nodes, elements, geometry sets and boundary conditions are copied,
+        the materials and functions are shared with this mesh.
+
+        Args:
+            translations: Array (n_copies x 3) with the translation of each
+                copy.
+            rotations: Optional array (n_copies x 4) with the quaternion of
+                the rotation of each copy. A single Rotation is applied to
+                all copies.
+            origin: The copies are reflected and rotated about this point.
+                Defaults to (0, 0, 0).
+            reflection_normal: If this is given, all copies are reflected with
+                respect to the plane through origin with this normal vector.
+            flip_beams: Passed on to reflect.
+
+        Returns:
+            A mesh that contains all copies.
+        """
+
+        translations = _np.atleast_2d(_np.asarray(translations, dtype=float))
+        n_copies = len(translations)
+        n_nodes = len(self.nodes)
+
+        # Get the nodal positions and rotations of all copies.
+        pos, rot = self.get_nodal_arrays()
+        if reflection_normal is not None:
+            pos, rot = _reflect_nodal_arrays(
+                pos, rot, reflection_normal, origin, flip_beams
+            )
+        pos = _np.tile(pos, (n_copies, 1))
+        rot = _np.tile(rot, (n_copies, 1))
+        if rotations is not None:
+            if isinstance(rotations, _Rotation):
+                rotations = [rotations.get_quaternion()] * n_copies
+            rotations = _np.repeat(_np.asarray(rotations, dtype=float), n_nodes, axis=0)
+            rot = _add_rotations(rotations, rot)
+            pos = _rotate_coordinates(pos, rotations, origin=origin)
+        pos += _np.repeat(translations, n_nodes, axis=0)
+        pos = pos.reshape(n_copies, n_nodes, 3)
+        rot = rot.reshape(n_copies, n_nodes, 4)
+
+        # Connectivity of the elements as indices of the nodes of this mesh.
+        node_indices = {node: i_node for i_node, node in enumerate(self.nodes)}
+        element_nodes = [
+            [node_indices[node] for node in element.nodes] for element in self.elements
+        ]
+        element_offsets = _np.cumsum([0] + [len(nodes) for nodes in element_nodes])
+        connectivity = _np.fromiter(
+            _itertools.chain.from_iterable(element_nodes),
+            dtype=int,
+            count=element_offsets[-1],
+        )
+
+        # Items of the geometry sets as indices of the nodes and elements of
+        # this mesh, the element indices are offset by the number of nodes.
+        # This includes geometry sets that are only used by boundary
+        # conditions.
+        item_indices = node_indices | {
+            element: n_nodes + i_element
+            for i_element, element in enumerate(self.elements)
+        }
+        geometry_sets = {}
+        for geometry_set in _itertools.chain(
+            _itertools.chain.from_iterable(self.geometry_sets.values()),
+            (
+                bc.geometry_set
+                for bc in _itertools.chain.from_iterable(
+                    self.boundary_conditions.values()
+                )
+            ),
+        ):
+            if geometry_set not in geometry_sets:
+                geometry_sets[geometry_set] = [
+                    item_indices[item] for item in geometry_set._get_geometry()
+                ]
+
+        # Create the nodes and elements of all copies.
+        nodes = [
+            node._copy_unlinked(pos[i_copy, i_node], rot[i_copy, i_node])
+            for i_copy in range(n_copies)
+            for i_node, node in enumerate(self.nodes)
+        ]
+        mesh = Mesh(use_node_store=self.use_node_store)
+        mesh.add(self.materials)
+        mesh.add(self.functions)
+        mesh.add(nodes)
+        for i_copy in range(n_copies):
+            copy_element_nodes = [
+                nodes[i_node] for i_node in (connectivity + i_copy * n_nodes).tolist()
+            ]
+            elements = [
+                element._copy_with_nodes(copy_element_nodes[start:end])
+                for element, start, end in zip(
+                    self.elements, element_offsets[:-1], element_offsets[1:]
+                )
+            ]
+            if reflection_normal is not None:
+                self._flip_reflected_elements(elements, flip_beams)
+            mesh.add(elements)
+
+            # The copied geometry sets and boundary conditions are new objects,
+            # so they can be added without checking for duplicates.
+            items = nodes[i_copy * n_nodes : (i_copy + 1) * n_nodes] + elements
+            geometry_set_copies = {
+                geometry_set: geometry_set._copy_with_geometry(
+                    [items[i_item] for i_item in indices]
+                )
+                for geometry_set, indices in geometry_sets.items()
+            }
+            for key, geometry_set_list in self.geometry_sets.items():
+                mesh.geometry_sets.setdefault(key, []).extend(
+                    geometry_set_copies[geometry_set]
+                    for geometry_set in geometry_set_list
+                )
+            for key, bc_list in self.boundary_conditions.items():
+                mesh.boundary_conditions.setdefault(key, []).extend(
+                    bc._copy_with_geometry_set(geometry_set_copies[bc.geometry_set])
+                    for bc in bc_list
+                )
+
+        return mesh
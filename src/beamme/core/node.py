@@ -21,9 +21,14 @@
 # THE SOFTWARE.
 """This module implements the class that represents one node in the Mesh."""
 
+import copy as _copy
+from itertools import compress as _compress
+
 import numpy as _np
 
 from beamme.core.base_mesh_item import BaseMeshItem as _BaseMeshItem
+from beamme.core.container import NodeAdjacency as _NodeAdjacency
+from beamme.core.rotation import Rotation as _Rotation
 
 
 class Node(_BaseMeshItem):
@@ -32,6 +37,12 @@ class Node(_BaseMeshItem):
     def __init__(self, coordinates, *, is_middle_node=False, **kwargs):
         super().__init__(**kwargs)
 
+        # Optional array based storage of the nodal data, see NodeStore. If
+        # this node is stored in a NodeStore, the nodal data is a view into
+        # the arrays of that object.
+        self._node_store = None
+        self._node_store_index = None
+
         # Coordinates of this node.
         self.coordinates = _np.array(coordinates)
 
@@ -42,15 +53,111 @@ class Node(_BaseMeshItem):
         # If the node is in the middle of a beam element.
         self.is_middle_node = is_middle_node
 
-        # Lists with the objects that this node is linked to.
-        self.element_link = []
-        self.node_sets_link = []
+        # Lists with the objects that this node is linked to. The links are
+        # stored as a list, as a reference to a NodeAdjacency, or as None if
+        # the node is not linked. The lists are only created when they are
+        # accessed.
+        self._element_link = None
+        self._node_sets_link = None
         self.element_partner_index = None
         self.mesh = None
 
         # If this node is replaced, store a link to the remaining node.
         self.master_node = None
 
+    @property
+    def coordinates(self):
+        """Coordinates of this node.
+
+        If this node is part of a NodeStore, a view into the coordinate
+        array of the store is returned.
+        """
+        if self._node_store is None:
+            return self._coordinates
+        return self._node_store.coordinates[self._node_store_index]
+
+    @coordinates.setter
+    def coordinates(self, coordinates):
+        """Set the coordinates of this node."""
+        if self._node_store is None:
+            self._coordinates = coordinates
+        else:
+            self._node_store.coordinates[self._node_store_index] = coordinates
+
+    @property
+    def element_link(self):
+        """List with the elements that this node is linked to."""
+        if not isinstance(self._element_link, list):
+            self._element_link = self._get_link_list(self._element_link)
+        return self._element_link
+
+    @element_link.setter
+    def element_link(self, element_link):
+        """Set the elements that this node is linked to."""
+        self._element_link = element_link
+
+    @property
+    def node_sets_link(self):
+        """List with the geometry sets that this node is linked to."""
+        if not isinstance(self._node_sets_link, list):
+            self._node_sets_link = self._get_link_list(self._node_sets_link)
+        return self._node_sets_link
+
+    @node_sets_link.setter
+    def node_sets_link(self, node_sets_link):
+        """Set the geometry sets that this node is linked to."""
+        self._node_sets_link = node_sets_link
+
+    def _get_link_list(self, link):
+        """Return the list of linked objects for a link that is not stored as
+        a list."""
+        if link is None:
+            return []
+        return link[self]
+
+    def _copy_unlinked(self, coordinates, quaternion):
+        """Return a copy of this node at the given coordinates.
+
+        The copy is not linked to any mesh, node store, element or
+        geometry set. The quaternion is only used for nodes with
+        rotations.
+        """
+        node = object.__new__(type(self))
+        node.__dict__.update(
+            self.__dict__,
+            _node_store=None,
+            _node_store_index=None,
+            _coordinates=_np.array(coordinates),
+            _element_link=None,
+            _node_sets_link=None,
+            mesh=None,
+            master_node=None,
+        )
+        if self.data is not None:
+            node.data = _copy.deepcopy(self.data)
+        return node
+
+    def _bind_to_node_store(self, node_store, index):
+        """Store the nodal data of this node in the given node store.
+
+        The current nodal data has to be copied to the store before
+        calling this method.
+        """
+        if self._node_store is not None and self._node_store is not node_store:
+            # The node can only be part of one store, the old store is no
+            # longer consistent with its nodes.
+            self._node_store.is_valid = False
+        self._node_store = node_store
+        self._node_store_index = index
+
+    def _unbind_from_node_store(self):
+        """Copy the nodal data from the node store back to this node."""
+        if self._node_store is not None:
+            coordinates = self.coordinates.copy()
+            self._node_store = None
+            self._node_store_index = None
+            self.coordinates = coordinates
+
     def get_master_node(self):
         """Return the master node of this node.
 
@@ -84,8 +191,8 @@ class Node(_BaseMeshItem):
 
     def unlink(self):
         """Reset the links to elements, node sets and global indices."""
-        self.element_link = []
-        self.node_sets_link = []
+        self._element_link = None
+        self._node_sets_link = None
         self.mesh = None
         self.i_global = None
 
@@ -103,6 +210,44 @@ class Node(_BaseMeshItem):
         }
 
 
+class _NodeRotation(_Rotation):
+    """The rotation of a NodeCosserat that is part of a NodeStore.
+
+    The quaternion is always read from and written to the current storage
+    of the node, i.e., the modifications are not lost if the node store
+    is rebuilt or released.
+    """
+
+    def __init__(self, node):
+        """Initialize the rotation with the node it belongs to."""
+        self._node = node
+
+    @property
+    def q(self):
+        """Quaternion of the node."""
+        node = self._node
+        if node._node_store is None:
+            return node._rotation.q
+        return node._node_store.quaternions[node._node_store_index]
+
+    @q.setter
+    def q(self, q):
+        """Set the quaternion of the node."""
+        node = self._node
+        if node._node_store is None:
+            node._rotation.q = _np.array(q, dtype=float)
+        else:
+            node._node_store.quaternions[node._node_store_index] = q
+
+    def __copy__(self):
+        """Return an independent copy of this rotation."""
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        """Return an independent copy of this rotation."""
+        return self.copy()
+
+
 class NodeCosserat(Node):
     """This object represents a Cosserat node in the mesh, i.e., it contains
     three positions and three rotations."""
@@ -116,6 +261,43 @@ class NodeCosserat(Node):
         # Arc length along the filament that this beam is a part of
         self.arc_length = arc_length
 
+    @property
+    def rotation(self):
+        """Rotation of this node.
+
+        If this node is part of a NodeStore, a _NodeRotation is returned.
+        Its quaternion is the quaternion of this node in the store, i.e.,
+        in-place modifications of the returned object and assignments to
+        its q attribute are reflected in the store. Copies of the returned
+        object (Rotation.copy, copy.copy, copy.deepcopy) are independent
+        Rotation objects.
+        """
+        if self._node_store is None:
+            return self._rotation
+        return _NodeRotation(self)
+
+    @rotation.setter
+    def rotation(self, rotation):
+        """Set the rotation of this node."""
+        if self._node_store is None:
+            self._rotation = rotation
+        else:
+            self._node_store.quaternions[self._node_store_index] = rotation.q
+
+    def _copy_unlinked(self, coordinates, quaternion):
+        """Return a copy of this node with the given coordinates and
+        rotation."""
+        node = super()._copy_unlinked(coordinates, quaternion)
+        node._rotation = _Rotation.from_quaternion(quaternion, normalized=True)
+        return node
+
+    def _unbind_from_node_store(self):
+        """Copy the nodal data from the node store back to this node."""
+        if self._node_store is not None:
+            rotation = self.rotation.copy()
+            super()._unbind_from_node_store()
+            self.rotation = rotation
+
     def rotate(self, rotation, *, origin=None, only_rotate_triads=False):
         """Rotate this node.
 
@@ -154,3 +336,169 @@ class ControlPoint(Node):
             "COORD": self.coordinates,
             "data": {"type": "CP", "weight": self.weight},
         }
+
+
+class NodeStore:
+    """Array based storage of the nodal data of a list of nodes.
+
+    The coordinates and quaternions of all nodes are stored in contiguous
+    arrays. The nodes themselves only store their index in this object, i.e.,
+    accessing Node.coordinates or NodeCosserat.rotation returns views into
+    these arrays. This allows to apply transformations to all nodes with
+    single numpy operations.
+    """
+
+    def __init__(self, nodes):
+        """Create the node store and link the given nodes to it.
+
+        Args:
+            nodes: List of nodes to be stored in this object.
+        """
+
+        self.nodes = []
+
+        # The nodal data is stored in buffers with additional capacity at the
+        # end, so nodes can be added without copying the data of all nodes.
+        # The public arrays are views into the used part of the buffers.
+        self._is_cosserat_buffer = _np.zeros(0, dtype=bool)
+        self._coordinates_buffer = _np.zeros([0, 3])
+        self._quaternions_buffer = _np.zeros([0, 4])
+        self._set_array_views()
+
+        # This flag is set to False if one of the nodes is moved to another store.
+        self.is_valid = True
+        self.extend(nodes)
+
+    def __len__(self):
+        """Return the number of nodes in this store."""
+        return len(self.nodes)
+
+    def _set_array_views(self):
+        """Set the public arrays to the used part of the buffers."""
+        n_nodes = len(self.nodes)
+        self.is_cosserat = self._is_cosserat_buffer[:n_nodes]
+        self.coordinates = self._coordinates_buffer[:n_nodes]
+        self.quaternions = self._quaternions_buffer[:n_nodes]
+
+    def extend(self, nodes):
+        """Add nodes at the end of this store and link them to it.
+
+        The capacity of the arrays is doubled if it is not sufficient, i.e.,
+        adding nodes one after another has an amortized constant cost per
+        node. Existing views into the arrays of this store, e.g., from
+        Node.coordinates, are not updated if the arrays are reallocated.
+
+        Args:
+            nodes: List of nodes to be added to this store.
+        """
+
+        nodes = list(nodes)
+        n_old = len(self.nodes)
+        n_new = n_old + len(nodes)
+        if n_new == n_old:
+            return
+
+        capacity = len(self._coordinates_buffer)
+        if n_new > capacity:
+            capacity = max(n_new, 2 * capacity)
+            for name in (
+                "_is_cosserat_buffer",
+                "_coordinates_buffer",
+                "_quaternions_buffer",
+            ):
+                buffer = getattr(self, name)
+                new_buffer = _np.zeros((capacity, *buffer.shape[1:]), buffer.dtype)
+                new_buffer[:n_old] = buffer[:n_old]
+                setattr(self, name, new_buffer)
+
+        # Copy the current nodal data. For the case of nodes that belong to solid
+        # elements, we define the quaternion [2, 0, 0, 0] as default value.
+        is_cosserat = _np.fromiter(
+            (isinstance(node, NodeCosserat) for node in nodes),
+            dtype=bool,
+            count=len(nodes),
+        )
+        self._is_cosserat_buffer[n_old:n_new] = is_cosserat
+        self._coordinates_buffer[n_old:n_new] = [node.coordinates for node in nodes]
+        quaternions = self._quaternions_buffer[n_old:n_new]
+        quaternions[:] = [2.0, 0.0, 0.0, 0.0]
+        if is_cosserat.any():
+            quaternions[is_cosserat] = [
+                node.rotation.q for node in _compress(nodes, is_cosserat)
+            ]
+
+        self.nodes.extend(nodes)
+        self._set_array_views()
+        for i, node in enumerate(nodes, start=n_old):
+            node._bind_to_node_store(self, i)
+
+    def release(self):
+        """Copy the nodal data back to the nodes that are still linked to this
+        store and remove the links."""
+        for node in self.nodes:
+            if node._node_store is self:
+                node._unbind_from_node_store()
+        self.nodes = []
+        self.is_valid = False
+
+
+def get_node_sets_link_incidence(nodes):
+    """Return the links between nodes and geometry sets as index arrays.
+
+    For nodes that are linked to an adjacency (see Mesh.get_unique_geometry_sets),
+    the connections are taken directly from the CSR arrays of the adjacency.
+
+    Args:
+        nodes: List of nodes. A node can be contained multiple times.
+
+    Returns:
+        geometry_sets: List with the geometry sets linked to the nodes.
+        node_ids: Index in nodes for each link.
+        set_ids: Index in geometry_sets for each link.
+    """
+
+    # Positions of the nodes in the adjacencies they are linked to.
+    adjacency_node_ids: dict = {}
+    list_node_ids = []
+    for i_node, node in enumerate(nodes):
+        link = node._node_sets_link
+        if link is None:
+            continue
+        elif isinstance(link, _NodeAdjacency) and node in link.positions:
+            adjacency_node_ids.setdefault(link, ([], []))
+            adjacency_node_ids[link][0].append(i_node)
+            adjacency_node_ids[link][1].append(link.positions[node])
+        else:
+            list_node_ids.append(i_node)
+
+    set_indices: dict = {}
+    node_ids = []
+    set_ids = []
+    for adjacency, (i_nodes, positions) in adjacency_node_ids.items():
+        connection_node_ids, item_ids = adjacency.get_connections(positions)
+        unique_item_ids, item_ids = _np.unique(item_ids, return_inverse=True)
+        item_set_ids = _np.array(
+            [
+                set_indices.setdefault(adjacency.items[i_item], len(set_indices))
+                for i_item in unique_item_ids
+            ],
+            dtype=int,
+        )
+        node_ids.append(_np.array(i_nodes)[connection_node_ids])
+        set_ids.append(item_set_ids[item_ids])
+    for i_node in list_node_ids:
+        node_sets_link = nodes[i_node].node_sets_link
+        node_ids.append(_np.full(len(node_sets_link), i_node))
+        set_ids.append(
+            _np.array(
+                [
+                    set_indices.setdefault(geometry_set, len(set_indices))
+                    for geometry_set in node_sets_link
+                ],
+                dtype=int,
+            )
+        )
+
+    if len(node_ids) == 0:
+        return [], _np.zeros(0, dtype=int), _np.zeros(0, dtype=int)
+    return list(set_indices), _np.concatenate(node_ids), _np.concatenate(set_ids)
@@ -130,6 +130,30 @@ class NURBSPatch(_Element):
         patch_data["ID"] = len(patches) + 1
         patches.append(patch_data)
 
+    def get_knot_spans(self) -> list[_np.ndarray]:
+        """Determine the knot spans that define the elements of this patch.
+
+        Only the nonzero knot spans within the parameter domain of the patch
+        are considered, i.e., knot spans between repeated knots are skipped.
+
+        Returns:
+            List with an array of the knot span indices for each parameter
+            direction.
+        """
+        knot_spans = []
+        for knot_vector, polynomial_order in zip(
+            self.knot_vectors, self.polynomial_orders
+        ):
+            knot_vector = _np.asarray(knot_vector, dtype=float)
+            knot_span_length = _np.diff(
+                knot_vector[polynomial_order : len(knot_vector) - polynomial_order]
+            )
+            knot_spans.append(
+                polynomial_order
+                + _np.flatnonzero(_np.abs(knot_span_length) > _mpy.eps_knot_vector)
+            )
+        return knot_spans
+
     def get_number_elements(self) -> int:
         """Determine the number of elements in this patch by checking the
         amount of nonzero knot spans in the knot vector.
@@ -137,23 +161,76 @@ class NURBSPatch(_Element):
         Returns:
             Number of elements for this patch.
         """
+        return int(_np.prod([len(knot_spans) for knot_spans in self.get_knot_spans()]))
 
-        num_elements_dir = _np.zeros(len(self.knot_vectors), dtype=int)
+    def get_element_control_point_ids(self) -> _np.ndarray:
+        """Determine the control points of all elements in this patch.
 
-        for i_dir in range(len(self.knot_vectors)):
-            for i_knot in range(len(self.knot_vectors[i_dir]) - 1):
-                if (
-                    abs(
-                        self.knot_vectors[i_dir][i_knot]
-                        - self.knot_vectors[i_dir][i_knot + 1]
-                    )
-                    > _mpy.eps_knot_vector
-                ):
-                    num_elements_dir[i_dir] += 1
+        The global index of a control point is calculated based on the book
+        "Isogeometric Analysis: toward Integration of CAD and FEA" of J.
+        Austin Cottrell, p. 314. The elements and the control points within
+        an element are ordered with the first parameter direction running
+        fastest.
+
+        Returns:
+            Array (n_elements x n_control_points_per_element) with the
+            indices of the control points of each element.
+        """
+
+        # Offset of the global control point index for a step in each
+        # parameter direction.
+        strides = _np.cumprod([1] + self.get_number_of_control_points_per_dir()[:-1])
+
+        # Sum up the offsets of all directions, the last direction is the
+        # outermost one.
+        element_offsets = _np.zeros(1, dtype=int)
+        local_offsets = _np.zeros(1, dtype=int)
+        for knot_spans, polynomial_order, stride in reversed(
+            list(zip(self.get_knot_spans(), self.polynomial_orders, strides))
+        ):
+            element_offsets = _np.add.outer(
+                element_offsets, (knot_spans - polynomial_order) * stride
+            ).ravel()
+            local_offsets = _np.add.outer(
+                local_offsets, _np.arange(polynomial_order + 1) * stride
+            ).ravel()
+
+        return _np.add.outer(element_offsets, local_offsets)
+
+    def get_element_dump_list(self, element_type: str) -> list[dict]:
+        """Return a list with all the element definitions contained in this
+        patch.
+
+        Args:
+            element_type: Type of the elements in the input file.
+
+        Returns:
+            List with the element definitions.
+        """
 
-        total_num_elements = _np.prod(num_elements_dir)
+        # Check the material
+        self._check_material()
+
+        element_control_point_ids = self.get_element_control_point_ids()
+        cell_type = f"NURBS{element_control_point_ids.shape[1]}"
+        nodes = _np.empty(len(self.nodes), dtype=object)
+        nodes[:] = self.nodes
+        element_data = {
+            "type": element_type,
+            "MAT": self.material,
+            **(self.data if self.data else {}),
+        }
 
-        return total_num_elements
+        return [
+            {
+                "id": self.i_global + i_element,
+                "cell": {"type": cell_type, "connectivity": connectivity},
+                "data": element_data.copy(),
+            }
+            for i_element, connectivity in enumerate(
+                nodes[element_control_point_ids].tolist()
+            )
+        ]
 
     def _check_material(self) -> None:
         """Check if the linked material is valid for this type of NURBS solid
@@ -176,71 +253,7 @@ class NURBSSurface(NURBSPatch):
     def dump_to_list(self):
         """Return a list with all the element definitions contained in this
         patch."""
-
-        # Check the material
-        self._check_material()
-
-        # Calculate how many control points are on the u direction
-        ctrlpts_size_u = len(self.knot_vectors[0]) - self.polynomial_orders[0] - 1
-
-        def get_ids_ctrlpts_surface(knot_span_u, knot_span_v):
-            """For an interpolated patch, calculate control points involved in
-            evaluation of the surface point at the knot span (knot_span_u,
-            knot_span_v)"""
-
-            id_u = knot_span_u - self.polynomial_orders[0]
-            id_v = knot_span_v - self.polynomial_orders[1]
-
-            element_ctrlpts_ids = []
-            for j in range(self.polynomial_orders[1] + 1):
-                for i in range(self.polynomial_orders[0] + 1):
-                    # Calculating the global index of the control point, based on the book
-                    # "Isogeometric Analysis: toward Integration of CAD and FEA" of J. Austin
-                    # Cottrell, p. 314.
-                    index_global = ctrlpts_size_u * (id_v + j) + id_u + i
-                    element_ctrlpts_ids.append(index_global)
-
-            return element_ctrlpts_ids
-
-        patch_elements = []
-
-        # Adding an increment j to self.global to obtain the ID of an element in the patch
-        j = 0
-
-        # Loop over the knot spans to obtain the elements inside the patch
-        for knot_span_v in range(
-            self.polynomial_orders[1],
-            len(self.knot_vectors[1]) - self.polynomial_orders[1] - 1,
-        ):
-            for knot_span_u in range(
-                self.polynomial_orders[0],
-                len(self.knot_vectors[0]) - self.polynomial_orders[0] - 1,
-            ):
-                element_cps_ids = get_ids_ctrlpts_surface(knot_span_u, knot_span_v)
-
-                connectivity = [self.nodes[i] for i in element_cps_ids]
-
-                num_cp_in_element = (self.polynomial_orders[0] + 1) * (
-                    self.polynomial_orders[1] + 1
-                )
-
-                patch_elements.append(
-                    {
-                        "id": self.i_global + j,
-                        "cell": {
-                            "type": f"NURBS{num_cp_in_element}",
-                            "connectivity": connectivity,
-                        },
-                        "data": {
-                            "type": "WALLNURBS",
-                            "MAT": self.material,
-                            **(self.data if self.data else {}),
-                        },
-                    }
-                )
-                j += 1
-
-        return patch_elements
+        return self.get_element_dump_list("WALLNURBS")
 
 
 class NURBSVolume(NURBSPatch):
@@ -252,85 +265,4 @@ class NURBSVolume(NURBSPatch):
     def dump_to_list(self):
         """Return a list with all the element definitions contained in this
         patch."""
-
-        # Check the material
-        self._check_material()
-
-        # Calculate how many control points are on the u and v directions
-        ctrlpts_size_u = len(self.knot_vectors[0]) - self.polynomial_orders[0] - 1
-        ctrlpts_size_v = len(self.knot_vectors[1]) - self.polynomial_orders[1] - 1
-
-        def get_ids_ctrlpts_volume(knot_span_u, knot_span_v, knot_span_w):
-            """For an interpolated patch, calculate control points involved in
-            evaluation of the surface point at the knot span (knot_span_u,
-            knot_span_v, knot_span_w)"""
-
-            id_u = knot_span_u - self.polynomial_orders[0]
-            id_v = knot_span_v - self.polynomial_orders[1]
-            id_w = knot_span_w - self.polynomial_orders[2]
-
-            element_ctrlpts_ids = []
-
-            for k in range(self.polynomial_orders[2] + 1):
-                for j in range(self.polynomial_orders[1] + 1):
-                    for i in range(self.polynomial_orders[0] + 1):
-                        # Calculating the global index of the control point, based on the paper
-                        # "Isogeometric analysis: an overview and computer implementation aspects"
-                        # of Vinh-Phu Nguyen, Mathematics and Computers in Simulation, Jun-2015.
-                        index_global = (
-                            ctrlpts_size_u * ctrlpts_size_v * (id_w + k)
-                            + ctrlpts_size_u * (id_v + j)
-                            + id_u
-                            + i
-                        )
-                        element_ctrlpts_ids.append(index_global)
-
-            return element_ctrlpts_ids
-
-        patch_elements = []
-
-        # Adding an increment to self.global to obtain the ID of an element in the patch
-        increment_ele = 0
-
-        # Loop over the knot spans to obtain the elements inside the patch
-        for knot_span_w in range(
-            self.polynomial_orders[2],
-            len(self.knot_vectors[2]) - self.polynomial_orders[2] - 1,
-        ):
-            for knot_span_v in range(
-                self.polynomial_orders[1],
-                len(self.knot_vectors[1]) - self.polynomial_orders[1] - 1,
-            ):
-                for knot_span_u in range(
-                    self.polynomial_orders[0],
-                    len(self.knot_vectors[0]) - self.polynomial_orders[0] - 1,
-                ):
-                    element_cps_ids = get_ids_ctrlpts_volume(
-                        knot_span_u, knot_span_v, knot_span_w
-                    )
-
-                    connectivity = [self.nodes[i] for i in element_cps_ids]
-
-                    num_cp_in_element = (
-                        (self.polynomial_orders[0] + 1)
-                        * (self.polynomial_orders[1] + 1)
-                        * (self.polynomial_orders[2] + 1)
-                    )
-
-                    patch_elements.append(
-                        {
-                            "id": self.i_global + increment_ele,
-                            "cell": {
-                                "type": f"NURBS{num_cp_in_element}",
-                                "connectivity": connectivity,
-                            },
-                            "data": {
-                                "type": "SOLID",
-                                "MAT": self.material,
-                                **(self.data if self.data else {}),
-                            },
-                        }
-                    )
-                    increment_ele += 1
-
-        return patch_elements
+        return self.get_element_dump_list("SOLID")
@@ -313,6 +313,8 @@ class Rotation:
             added_rotation[0] = p[0] * q[0] - _np.dot(p[1:], q[1:])
             added_rotation[1:] = p[0] * q[1:] + q[0] * p[1:] + _np.cross(p[1:], q[1:])
             return Rotation.from_quaternion(added_rotation)
+        elif isinstance(other, RotationArray):
+            return RotationArray.from_quaternion(add_rotations(self.q, other.q))
         elif isinstance(other, (list, _np.ndarray)) and len(other) == 3:
             # Apply rotation to vector.
             return _np.dot(self.get_rotation_matrix(), _np.asarray(other))
@@ -340,6 +342,265 @@ class Rotation:
         return f"Rotation:\n    q0: {self.q[0]}\n    q: {self.q[1:]}"
 
 
+class RotationArray:
+    """A class that represents an array of rotations.
+
+    Internally the rotations are stored as a (n x 4) array of
+    quaternions. All operations are performed for all rotations at once,
+    which is considerably faster than looping over Rotation objects.
+    """
+
+    def __init__(self, *args):
+        """Initialize the rotation array object.
+
+        Args
+        ----
+        *args:
+            - RotationArray(n)
+                Create n identity rotations.
+            - RotationArray(axis, phi)
+                Create rotations around the vectors axis (n x 3) with the
+                angles phi (n).
+        """
+
+        if len(args) == 1:
+            # Identity elements.
+            self.q = _np.zeros((args[0], 4))
+            self.q[:, 0] = 1
+        elif len(args) == 2:
+            # Set from rotation axis and rotation angle.
+            axis = _np.atleast_2d(args[0])
+            phi = _np.atleast_1d(args[1])
+            norm = _np.linalg.norm(axis, axis=1)
+            if _np.any(norm < _mpy.eps_quaternion):
+                raise ValueError("The rotation axis can not be a zero vector!")
+            n_rotations = max(len(axis), len(phi))
+            self.q = _np.zeros((n_rotations, 4))
+            self.q[:, 0] = _np.cos(0.5 * phi)
+            self.q[:, 1:] = (_np.sin(0.5 * phi) / norm)[:, _np.newaxis] * axis
+        else:
+            raise ValueError(f"The given arguments {args} are invalid!")
+
+    @classmethod
+    def from_quaternion(cls, q, *, normalized=False):
+        """Create the object from a quaternion float array (n x 4)
+
+        Args
+        ----
+        q: Quaternions, q0, qx,qy,qz
+        normalized: Flag if the input quaternions are normalized. If so, no
+            normalization is performed, see Rotation.from_quaternion.
+        """
+        rotation = object.__new__(cls)
+        if normalized:
+            rotation.q = _np.array(q, dtype=float)
+        else:
+            q = _np.asarray(q, dtype=float)
+            rotation.q = q / _np.linalg.norm(q, axis=-1, keepdims=True)
+        if (not rotation.q.ndim == 2) or (not rotation.q.shape[1] == 4):
+            raise ValueError("Got quaternion array with unexpected dimensions")
+        return rotation
+
+    @classmethod
+    def from_rotations(cls, rotations):
+        """Create the object from a list of Rotation objects."""
+        return cls.from_quaternion(
+            _np.array([rotation.q for rotation in rotations]).reshape(-1, 4),
+            normalized=True,
+        )
+
+    @classmethod
+    def from_rotation_matrix(cls, R):
+        """Create the object from rotation matrices (n x 3 x 3).
+
+        See Rotation.from_rotation_matrix for details on the algorithm.
+        """
+
+        R = _np.asarray(R)
+        n_rotations = len(R)
+        q = _np.zeros((n_rotations, 4))
+        trace = _np.trace(R, axis1=1, axis2=2)
+        values = _np.column_stack((_np.diagonal(R, axis1=1, axis2=2), trace))
+        arg_max = _np.argmax(values, axis=1)
+
+        index = arg_max == 3
+        R_trace = R[index]
+        q0 = _np.sqrt(trace[index] + 1) * 0.5
+        q[index, 0] = q0
+        q[index, 1] = (R_trace[:, 2, 1] - R_trace[:, 1, 2]) / (4 * q0)
+        q[index, 2] = (R_trace[:, 0, 2] - R_trace[:, 2, 0]) / (4 * q0)
+        q[index, 3] = (R_trace[:, 1, 0] - R_trace[:, 0, 1]) / (4 * q0)
+
+        for i_index in range(3):
+            index = arg_max == i_index
+            R_i = R[index]
+            j_index = (i_index + 1) % 3
+            k_index = (i_index + 2) % 3
+            q_i = _np.sqrt(R_i[:, i_index, i_index] * 0.5 + (1 - trace[index]) * 0.25)
+            q[index, 0] = (R_i[:, k_index, j_index] - R_i[:, j_index, k_index]) / (
+                4 * q_i
+            )
+            q[index, i_index + 1] = q_i
+            q[index, j_index + 1] = (
+                R_i[:, j_index, i_index] + R_i[:, i_index, j_index]
+            ) / (4 * q_i)
+            q[index, k_index + 1] = (
+                R_i[:, k_index, i_index] + R_i[:, i_index, k_index]
+            ) / (4 * q_i)
+
+        return cls.from_quaternion(q)
+
+    @classmethod
+    def from_basis(cls, t1, t2):
+        """Create the object from two arrays of basis vectors t1, t2 (n x 3).
+
+        t2 will be orthogonalized on t1, and t3 will be calculated with
+        the cross product.
+        """
+
+        t1 = _np.atleast_2d(t1)
+        t2 = _np.atleast_2d(t2)
+        t1_normal = t1 / _np.linalg.norm(t1, axis=1, keepdims=True)
+        t2_ortho = t2 - t1_normal * _np.sum(t1_normal * t2, axis=1, keepdims=True)
+        t2_normal = t2_ortho / _np.linalg.norm(t2_ortho, axis=1, keepdims=True)
+        t3_normal = _np.cross(t1_normal, t2_normal)
+
+        R = _np.stack([t1_normal, t2_normal, t3_normal], axis=2)
+        return cls.from_rotation_matrix(R)
+
+    @classmethod
+    def from_rotation_vector(cls, rotation_vector):
+        """Create the object from rotation vectors (n x 3)."""
+
+        rotation_vector = _np.atleast_2d(rotation_vector)
+        q = _np.zeros((len(rotation_vector), 4))
+        phi = _np.linalg.norm(rotation_vector, axis=1)
+        q[:, 0] = _np.cos(0.5 * phi)
+        # For small angles use the Taylor series expansion of sin(phi/2)/phi
+        # around phi=0
+        is_small = phi < _mpy.eps_quaternion
+        factor = _np.full_like(phi, 0.5)
+        factor[~is_small] = _np.sin(0.5 * phi[~is_small]) / phi[~is_small]
+        q[:, 1:] = factor[:, _np.newaxis] * rotation_vector
+        return cls.from_quaternion(q)
+
+    def __len__(self):
+        """Return the number of rotations in this object."""
+        return len(self.q)
+
+    def __getitem__(self, index):
+        """Return a single Rotation for an integer index, otherwise a
+        RotationArray with the selected rotations."""
+        if isinstance(index, (int, _np.integer)):
+            return Rotation.from_quaternion(self.q[index], normalized=True)
+        return RotationArray.from_quaternion(self.q[index], normalized=True)
+
+    def check_quaternion_constraint(self):
+        """We want to check that q.q = 1 for all rotations."""
+
+        if _np.any(_np.abs(1 - _np.linalg.norm(self.q, axis=1)) > _mpy.eps_quaternion):
+            raise ValueError("The rotation array object is corrupted. q.q != 1!")
+
+    def get_quaternions(self):
+        """Return the quaternions of this object, as numpy array (copy)."""
+        return _np.array(self.q)
+
+    def get_rotation_matrix(self):
+        """Return the rotation matrices (n x 3 x 3) for the rotations.
+
+        (Krenk (3.50))
+        """
+        q0 = self.q[:, 0]
+        q = self.q[:, 1:]
+        R = (q0**2 - _np.sum(q * q, axis=1))[:, None, None] * _np.eye(3)
+        R[:, 0, 1] -= 2 * q0 * q[:, 2]
+        R[:, 0, 2] += 2 * q0 * q[:, 1]
+        R[:, 1, 0] += 2 * q0 * q[:, 2]
+        R[:, 1, 2] -= 2 * q0 * q[:, 0]
+        R[:, 2, 0] -= 2 * q0 * q[:, 1]
+        R[:, 2, 1] += 2 * q0 * q[:, 0]
+        R += 2 * q[:, :, None] * q[:, None, :]
+        return R
+
+    def get_rotation_vector(self):
+        """Return the rotation vectors (n x 3) for the rotations.
+
+        See Rotation.get_rotation_vector for details.
+        """
+
+        self.check_quaternion_constraint()
+
+        # We always want q0 to be positive -> the range for the rotational
+        # angle is 0 <= phi <= pi.
+        q = _np.where(self.q[:, [0]] < 0, -self.q, self.q)
+
+        norm = _np.linalg.norm(q[:, 1:], axis=1)
+        phi = 2 * _np.arctan2(norm, q[:, 0])
+
+        # For small angles use the Taylor series expansion of phi/sin(phi/2)
+        is_small = phi < _mpy.eps_quaternion
+        scale_factor = _np.full_like(phi, 2.0)
+        scale_factor[~is_small] = phi[~is_small] / _np.sin(0.5 * phi[~is_small])
+
+        # For rotations of exactly +-pi the first component of the rotation
+        # axis that is not 0 has to be positive.
+        is_pi = (~is_small) & (_np.abs(_np.abs(phi) - _np.pi) < _mpy.eps_quaternion)
+        if _np.any(is_pi):
+            q_pi = q[is_pi, 1:]
+            is_non_zero = _np.abs(q_pi) > _mpy.eps_quaternion
+            first_non_zero = _np.argmax(is_non_zero, axis=1)
+            first_value = q_pi[_np.arange(len(q_pi)), first_non_zero]
+            sign = _np.where(
+                _np.any(is_non_zero, axis=1) & (first_value < 0), -1.0, 1.0
+            )
+            scale_factor[is_pi] *= sign
+
+        return q[:, 1:] * scale_factor[:, _np.newaxis]
+
+    def inv(self):
+        """Return the inverse of the rotations."""
+
+        tmp_quaternion = self.q.copy()
+        tmp_quaternion[:, 0] *= -1.0
+        return RotationArray.from_quaternion(tmp_quaternion)
+
+    def __mul__(self, other):
+        """Add these rotations to other rotations, or apply them on vectors.
+
+        The other object can be a RotationArray (of the same length), a
+        single Rotation, a single vector or an array of vectors (n x 3).
+        """
+
+        if isinstance(other, (Rotation, RotationArray)):
+            return RotationArray.from_quaternion(
+                _np.atleast_2d(add_rotations(self.q, other.q))
+            )
+        elif isinstance(other, (list, _np.ndarray)):
+            vectors = _np.broadcast_to(_np.asarray(other, dtype=float), (len(self), 3))
+            return rotate_coordinates(vectors, self.q)
+        raise NotImplementedError("Error, not implemented, does not make sense anyway!")
+
+    def __eq__(self, other):
+        """Check which rotations are equal to the other rotation(s).
+
+        Return
+        ----
+        Boolean array that is true for each rotation that is equal to
+        the corresponding other rotation.
+        """
+
+        if isinstance(other, (Rotation, RotationArray)):
+            return (_np.linalg.norm(self.q - other.q, axis=1) < _mpy.eps_quaternion) | (
+                _np.linalg.norm(self.q + other.q, axis=1) < _mpy.eps_quaternion
+            )
+        else:
+            return object.__eq__(self, other)
+
+    def copy(self):
+        """Return a copy of this object."""
+        return RotationArray.from_quaternion(self.q, normalized=True)
+
+
 def add_rotations(rotation_21, rotation_10):
     """Multiply a rotation onto another.
 
@@ -456,23 +717,32 @@ def rotate_coordinates(coordinates, rotation, *, origin=None):
     return coordinates_new
 
 
-def smallest_rotation(q: Rotation, t):
+def smallest_rotation(q: Rotation | RotationArray, t):
     """Get the triad that results from the smallest rotation (rotation without
     twist) from the triad q such that the rotated first basis vector aligns
     with t. For more details see Christoph Meier's dissertation chapter 2.1.2.
 
     Args
     ----
-    q: Rotation
-        Starting triad.
-    t: Vector in R3
-        Direction of the first basis of the rotated triad.
+    q: Rotation, RotationArray
+        Starting triad(s).
+    t: Vector in R3 or array of vectors (n x 3)
+        Direction of the first basis of the rotated triad(s).
     Return
     ----
-    q_sr: Rotation
-        The triad that results from a smallest rotation.
+    q_sr: Rotation, RotationArray
+        The triad(s) that results from a smallest rotation.
     """
 
+    if isinstance(q, RotationArray):
+        g1_old = q.get_rotation_matrix()[:, :, 0]
+        t = _np.atleast_2d(t)
+        g1 = t / _np.linalg.norm(t, axis=1, keepdims=True)
+        q_rel = _np.zeros((len(g1_old), 4))
+        q_rel[:, 0] = _np.linalg.norm(0.5 * (g1_old + g1), axis=1)
+        q_rel[:, 1:] = _np.cross(g1_old, g1) / (2.0 * q_rel[:, [0]])
+        return RotationArray.from_quaternion(q_rel) * q
+
     R_old = q.get_rotation_matrix()
     g1_old = R_old[:, 0]
     g1 = _np.asarray(t) / _np.linalg.norm(t)
@@ -487,3 +757,47 @@ def smallest_rotation(q: Rotation, t):
     q_rel[1:] = _np.cross(g1_old, g1) / (2.0 * q_rel[0])
 
     return Rotation.from_quaternion(q_rel) * q
+
+
+def smallest_rotation_transport(q: Rotation, tangents):
+    """Transport the triad q along a sequence of tangent vectors via smallest
+    rotation mappings (parallel transport).
+
+    This gives the same result as calling smallest_rotation sequentially for
+    each tangent, starting from q and always using the last resulting triad
+    as starting triad, but all rotations are computed at once.
+
+    Args
+    ----
+    q: Rotation
+        Starting triad.
+    tangents: array of vectors (n x 3)
+        Tangent vectors along the curve. The first basis vector of the n
+        resulting triads aligns with the corresponding tangent.
+    Return
+    ----
+    q_sr: _np.ndarray
+        Array with the dimensions n x 4 that contains the quaternions of the
+        resulting triads.
+    """
+
+    tangents = _np.atleast_2d(_np.asarray(tangents, dtype=float))
+    g1 = tangents / _np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    # Relative rotations between two subsequent triads. The first basis vector
+    # of each triad is the normalized tangent of the previous one.
+    g1_old = _np.concatenate([q.get_rotation_matrix()[_np.newaxis, :, 0], g1[:-1]])
+    q_rel = _np.zeros((len(g1), 4))
+    q_rel[:, 0] = _np.linalg.norm(0.5 * (g1_old + g1), axis=1)
+    q_rel[:, 1:] = _np.cross(g1_old, g1) / (2.0 * q_rel[:, [0]])
+
+    # Accumulate the relative rotations, i.e., q_i = q_rel_i * ... * q_rel_0 * q.
+    # The accumulation multiplies from the right, therefore we accumulate the
+    # conjugated relative rotations and conjugate the result.
+    q_rel_accumulated = _np.conjugate(
+        _np.multiply.accumulate(_np.conjugate(_quaternion.from_float_array(q_rel)))
+    )
+    q_sr = _quaternion.as_float_array(
+        q_rel_accumulated * _quaternion.from_float_array(q.q)
+    )
+    return q_sr / _np.linalg.norm(q_sr, axis=1, keepdims=True)
@@ -21,14 +21,41 @@
 # THE SOFTWARE.
 """This module provides a class that is used to write VTK files."""
 
-import numbers as _numbers
+import functools as _functools
 import os as _os
 import warnings as _warnings
+import xml.etree.ElementTree as _ElementTree
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from itertools import chain as _chain
 
 import numpy as _np
 import vtk as _vtk
+from vtk.util import numpy_support as _numpy_support
 
 from beamme.core.conf import mpy as _mpy
+from beamme.core.node import (
+    get_node_sets_link_incidence as _get_node_sets_link_incidence,
+)
+
+
+def _get_geometry_set_data_name(geometry_set):
+    """Return the name of the point data field for the given geometry set."""
+
+    # Get the name of the geometry type.
+    if geometry_set.geometry_type is _mpy.geo.point:
+        geometry_name = "geometry_point"
+    elif geometry_set.geometry_type is _mpy.geo.line:
+        geometry_name = "geometry_line"
+    elif geometry_set.geometry_type is _mpy.geo.surface:
+        geometry_name = "geometry_surface"
+    elif geometry_set.geometry_type is _mpy.geo.volume:
+        geometry_name = "geometry_volume"
+    else:
+        raise TypeError("The geometry type is wrong!")
+
+    return (
+        f"{geometry_name}_set_{_mpy.vtk_node_set_format.format(geometry_set.i_global)}"
+    )
 
 
 def add_point_data_node_sets(point_data, nodes, *, extra_points=0):
@@ -39,47 +66,113 @@ def add_point_data_node_sets(point_data, nodes, *, extra_points=0):
     visualization points there are, i.e., points that are not based on
     nodes, but are only used for visualization purposes.
     """
+    add_point_data_node_sets_batch(point_data, [nodes], extra_points=extra_points)
 
-    # Get list with node set indices of the given nodes
-    geometry_set_list = []
-    for node in nodes:
-        geometry_set_list.extend(node.node_sets_link)
-
-    # Remove double entries of list.
-    geometry_set_list = list(set(geometry_set_list))
-
-    # Loop over the geometry sets.
-    n_nodes = len(nodes)
-    for geometry_set in geometry_set_list:
-        # Check which nodes are connected to a geometry set.
-        data_vector = _np.zeros(n_nodes + extra_points)
-        for i, node in enumerate(nodes):
-            if geometry_set in node.node_sets_link:
-                data_vector[i] = 1
-            else:
-                data_vector[i] = _mpy.vtk_nan_int
-        for i in range(extra_points):
-            data_vector[n_nodes + i] = (
-                1 if geometry_set.geometry_type is _mpy.geo.line else _mpy.vtk_nan_int
-            )
 
-        # Get the name of the geometry type.
-        if geometry_set.geometry_type is _mpy.geo.point:
-            geometry_name = "geometry_point"
-        elif geometry_set.geometry_type is _mpy.geo.line:
-            geometry_name = "geometry_line"
-        elif geometry_set.geometry_type is _mpy.geo.surface:
-            geometry_name = "geometry_surface"
-        elif geometry_set.geometry_type is _mpy.geo.volume:
-            geometry_name = "geometry_volume"
-        else:
-            raise TypeError("The geometry type is wrong!")
+def add_point_data_node_sets_batch(point_data, element_nodes, *, extra_points=0):
+    """Add the information if a node is part of a set to the point_data vector
+    for the nodes of multiple elements.
+
+    Args
+    ----
+    point_data: dict
+        The point data is added to this dictionary.
+    element_nodes: [[Node]]
+        List with the nodes of each element. All elements have to have the
+        same number of nodes. The points of the elements are ordered element
+        wise, i.e., the nodes of the first element, followed by its extra
+        points, followed by the nodes of the second element, and so on.
+    extra_points: int
+        Number of additional visualization points per element, i.e., points
+        that are not based on nodes, but are only used for visualization
+        purposes.
+    """
+
+    n_elements = len(element_nodes)
+    n_nodes = len(element_nodes[0]) if n_elements > 0 else 0
+    n_points_element = n_nodes + extra_points
+
+    # Get the links between the element nodes and the geometry sets.
+    geometry_sets, node_ids, set_ids = _get_node_sets_link_incidence(
+        list(_chain.from_iterable(element_nodes))
+    )
+    if len(geometry_sets) == 0:
+        return
+
+    # Scatter the links to the point data vectors. Points of elements that
+    # are not connected to a geometry set keep the nan value.
+    data_vectors = _np.full(
+        (len(geometry_sets), n_elements * n_points_element), _mpy.vtk_nan_int
+    )
+    element_ids, local_node_ids = _np.divmod(node_ids, n_nodes)
+    data_vectors[set_ids, element_ids * n_points_element + local_node_ids] = 1
+
+    # The extra points of an element are part of a line set if one of the
+    # element nodes is part of the set.
+    if extra_points > 0:
+        is_line = _np.array(
+            [
+                geometry_set.geometry_type is _mpy.geo.line
+                for geometry_set in geometry_sets
+            ]
+        )[set_ids]
+        extra_point_ids = (
+            element_ids[is_line, None] * n_points_element
+            + n_nodes
+            + _np.arange(extra_points)
+        )
+        data_vectors[set_ids[is_line, None], extra_point_ids] = 1
 
-        # Add the data vector.
-        set_name = f"{geometry_name}_set_{_mpy.vtk_node_set_format.format(geometry_set.i_global)}"
+    # Add the data vectors.
+    for geometry_set, data_vector in zip(geometry_sets, data_vectors):
+        set_name = _get_geometry_set_data_name(geometry_set)
         point_data[set_name] = (data_vector, _mpy.vtk_type.int)
 
 
+def combine_data(data_list):
+    """Combine a list with data dictionaries for single items (cells) into one
+    data dictionary for all items.
+
+    Fields that are not given for an item are set to mpy.vtk_nan for this
+    item.
+
+    Args
+    ----
+    data_list: [dict]
+        List with the data dictionaries of the items, see VTKWriter.add_cell.
+
+    Return:
+    ----
+    data: dict
+        Data dictionary with the values of all items, see VTKWriter.add_cells.
+    """
+
+    n_items = len(data_list)
+    field_items = {}
+    for i_item, data in enumerate(data_list):
+        for key, item_value in data.items():
+            value, data_type = _get_data_value_and_type(item_value)
+            field_items.setdefault(key, []).append((i_item, value, data_type))
+
+    combined_data = {}
+    for key, items in field_items.items():
+        data_type = items[0][2]
+        if any(item_data_type != data_type for _, _, item_data_type in items):
+            raise ValueError(f'The data with the key "{key}" has different types!')
+        nan_value = (
+            _mpy.vtk_nan_int if data_type is _mpy.vtk_type.int else _mpy.vtk_nan_float
+        )
+        values = _np.full(
+            (n_items,) + _np.shape(items[0][1]),
+            nan_value,
+            dtype=int if data_type is _mpy.vtk_type.int else float,
+        )
+        for i_item, value, _ in items:
+            values[i_item] = value
+        combined_data[key] = (values, data_type)
+    return combined_data
+
+
 def _get_data_value_and_type(data):
     """Return the data and its type if one was given.
 
@@ -91,18 +184,273 @@ def _get_data_value_and_type(data):
         return data, _mpy.vtk_type.float
 
 
-def _get_vtk_array_type(data):
-    """Return the corresponding beamme type."""
-    data_type = data.GetDataTypeAsString()
-    if data_type == "int":
-        return _mpy.vtk_type.int
-    elif data_type == "double":
-        return _mpy.vtk_type.float
-    raise ValueError(f'Got unexpected type "{data_type}"!')
+def _get_vtk_tensor_type(data):
+    """Return the tensor type of an array with data for multiple points or
+    cells.
+
+    Check if data matches an expected case.
+    """
+    if data.ndim == 1:
+        return _mpy.vtk_tensor.scalar
+    elif data.ndim == 2:
+        if data.shape[1] == 3:
+            return _mpy.vtk_tensor.vector
+        raise IndexError(
+            f"Only 3d vectors are implemented yet! Got len(data) = {data.shape[1]}"
+        )
+    raise ValueError(f"Data {data} did not match any expected case!")
+
+
+@_functools.cache
+def _get_vtk_cell_type_id(cell_type):
+    """Return the integer VTK type id for the given VTK cell class."""
+    return cell_type().GetCellType()
+
+
+def _get_vtk_int64_array(values):
+    """Return a vtkTypeInt64Array with the given values.
+
+    This is the array type used internally by vtkCellArray.
+    """
+    vtk_array = _vtk.vtkTypeInt64Array()
+    vtk_array.SetNumberOfTuples(len(values))
+    _numpy_support.vtk_to_numpy(vtk_array)[:] = values
+    return vtk_array
+
+
+def _get_spatial_partition(points, n_pieces):
+    """Split points into spatially coherent pieces.
+
+    The pieces are created by a recursive coordinate bisection, i.e., the
+    points are recursively split along the direction with the largest extent.
+    The pieces have (almost) the same number of points.
+
+    Args
+    ----
+    points: _np.array (n_points x 3)
+        Coordinates of the points.
+    n_pieces: int
+        Number of pieces.
+
+    Return
+    ----
+    piece_ids: _np.array (n_points)
+        The index of the piece for each point.
+    """
+
+    piece_ids = _np.zeros(len(points), dtype=int)
+
+    def bisect(indices, first_piece, n_pieces):
+        """Split the given points into n_pieces pieces."""
+        if n_pieces == 1:
+            piece_ids[indices] = first_piece
+            return
+        n_pieces_left = n_pieces // 2
+        if len(indices) > 0:
+            axis = _np.argmax(_np.ptp(points[indices], axis=0))
+            indices = indices[_np.argsort(points[indices, axis], kind="stable")]
+        n_left = len(indices) * n_pieces_left // n_pieces
+        bisect(indices[:n_left], first_piece, n_pieces_left)
+        bisect(indices[n_left:], first_piece + n_pieces_left, n_pieces - n_pieces_left)
+
+    bisect(_np.arange(len(points)), 0, n_pieces)
+    return piece_ids
+
+
+def _copy_vtk_data_array(vtk_array, indices):
+    """Return a new VTK array with the given entries of a VTK array."""
+    values = _numpy_support.vtk_to_numpy(vtk_array)[indices]
+    new_array = _numpy_support.numpy_to_vtk(
+        values, deep=True, array_type=vtk_array.GetDataType()
+    )
+    new_array.SetName(vtk_array.GetName())
+    return new_array
+
+
+def _extract_cells(grid, cell_ids):
+    """Return a new grid that contains the given cells of a grid, only the
+    points of these cells, and the corresponding point and cell data."""
+
+    cells = grid.GetCells()
+    offsets = _numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+    connectivity = _numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+
+    # Get the connectivity of the extracted cells.
+    n_cell_points = offsets[cell_ids + 1] - offsets[cell_ids]
+    new_offsets = _np.zeros(len(cell_ids) + 1, dtype=int)
+    _np.cumsum(n_cell_points, out=new_offsets[1:])
+    connectivity_ids = _np.repeat(offsets[cell_ids] - new_offsets[:-1], n_cell_points)
+    connectivity_ids += _np.arange(new_offsets[-1])
+    point_ids, new_connectivity = _np.unique(
+        connectivity[connectivity_ids], return_inverse=True
+    )
+
+    # Create the new grid.
+    piece = _vtk.vtkUnstructuredGrid()
+    points = _vtk.vtkPoints()
+    points.SetData(_copy_vtk_data_array(grid.GetPoints().GetData(), point_ids))
+    piece.SetPoints(points)
+    new_cells = _vtk.vtkCellArray()
+    new_cells.SetData(
+        _get_vtk_int64_array(new_offsets), _get_vtk_int64_array(new_connectivity)
+    )
+    vtk_version = _vtk.vtkVersion()
+    if (vtk_version.GetVTKMajorVersion(), vtk_version.GetVTKMinorVersion()) < (9, 6):
+        cell_types = grid.GetCellTypesArray()
+    else:
+        cell_types = grid.GetCellTypes()
+    piece.SetCells(_copy_vtk_data_array(cell_types, cell_ids), new_cells)
+
+    # Copy the data.
+    for data, new_data, indices in (
+        (grid.GetPointData(), piece.GetPointData(), point_ids),
+        (grid.GetCellData(), piece.GetCellData(), cell_ids),
+    ):
+        for i_array in range(data.GetNumberOfArrays()):
+            new_data.AddArray(_copy_vtk_data_array(data.GetArray(i_array), indices))
+
+    return piece
+
+
+def _get_vtk_xml_data_type(vtk_array):
+    """Return the name of the data type of a VTK array in VTK XML files."""
+    dtype = _np.dtype(_numpy_support.get_numpy_array_type(vtk_array.GetDataType()))
+    return {"f": "Float", "i": "Int", "u": "UInt"}[dtype.kind] + str(8 * dtype.itemsize)
+
+
+def _write_vtk_xml_file(filepath, root):
+    """Write a VTK XML file with the given root element."""
+    tree = _ElementTree.ElementTree(root)
+    _ElementTree.indent(tree)
+    tree.write(filepath, encoding="utf-8", xml_declaration=True)
+
+
+def _write_vtu(grid, filepath, *, binary=True):
+    """Write a grid to a vtu file."""
+
+    # Initialize VTK writer.
+    writer = _vtk.vtkXMLUnstructuredGridWriter()
+
+    # Set the ascii flag.
+    if not binary:
+        writer.SetDataModeToAscii()
+
+    # Write geometry and data to file.
+    writer.SetFileName(filepath)
+    writer.SetInputData(grid)
+    writer.Write()
+
+
+def _check_vtk_file_path(filepath, extension):
+    """Check that the directory of the file exists and the file has the
+    expected extension."""
+
+    # Check if directory for file exits.
+    file_directory = _os.path.dirname(filepath)
+    if not _os.path.isdir(file_directory):
+        raise ValueError(f"Directory {file_directory} does not exist!".format())
+
+    # Check the file extension.
+    _filename, file_extension = _os.path.splitext(filepath)
+    if not file_extension.lower() == extension:
+        _warnings.warn(
+            f'The extension should be "{extension[1:]}", got {file_extension}!'
+        )
+
+
+def write_pvd(filepath, datasets):
+    """Write a ParaView collection file (pvd) for a series of VTK files.
+
+    Args
+    ----
+    filepath: str
+        Path to the output file. The file extension should be pvd.
+    datasets: [(float, str)]
+        List with the time and the path of the VTK file for each step of the
+        series. The paths are stored relative to the directory of the pvd
+        file.
+    """
+
+    _check_vtk_file_path(filepath, ".pvd")
+    file_directory = _os.path.dirname(filepath)
+
+    root = _ElementTree.Element(
+        "VTKFile", type="Collection", version="0.1", byte_order="LittleEndian"
+    )
+    collection = _ElementTree.SubElement(root, "Collection")
+    for time, dataset_filepath in datasets:
+        _ElementTree.SubElement(
+            collection,
+            "DataSet",
+            timestep=repr(float(time)),
+            group="",
+            part="0",
+            file=_os.path.relpath(dataset_filepath, file_directory),
+        )
+    _write_vtk_xml_file(filepath, root)
+
+
+class _VTKDataField:
+    """A data field (point or cell data) that is collected in NumPy arrays
+    before it is converted to a VTK array."""
+
+    def __init__(self, data_type, vtk_tensor_type):
+        """Initialize the data field.
+
+        Args
+        ----
+        data_type: mpy.vtk_type
+            Type of the data values (int or float).
+        vtk_tensor_type: mpy.vtk_tensor
+            Tensor type of the data (scalar or vector).
+        """
+        self.data_type = data_type
+        self.vtk_tensor_type = vtk_tensor_type
+
+        # List with the start index and the values of each added chunk.
+        self.chunks = []
+
+    def get_vtk_data_type_string(self):
+        """Return the name of the VTK data type of this field."""
+        return "int" if self.data_type is _mpy.vtk_type.int else "double"
+
+    def get_vtk_array(self, name, n_items):
+        """Return the VTK array for this field.
+
+        Items that have not been set in this field are filled with the
+        nan value of the data type.
+        """
+
+        if self.data_type is _mpy.vtk_type.int:
+            dtype = _np.int32
+            vtk_array_type = _vtk.VTK_INT
+            nan_value = _mpy.vtk_nan_int
+        else:
+            dtype = _np.float64
+            vtk_array_type = _vtk.VTK_DOUBLE
+            nan_value = _mpy.vtk_nan_float
+
+        if self.vtk_tensor_type == _mpy.vtk_tensor.scalar:
+            shape = (n_items,)
+        else:
+            shape = (n_items, 3)
+        values = _np.full(shape, nan_value, dtype=dtype)
+        for start, chunk in self.chunks:
+            values[start : start + len(chunk)] = chunk
+
+        vtk_array = _numpy_support.numpy_to_vtk(
+            values, deep=True, array_type=vtk_array_type
+        )
+        vtk_array.SetName(name)
+        return vtk_array
 
 
 class VTKWriter:
-    """A class that manages VTK cells and data and can also create them."""
+    """A class that manages VTK cells and data and can also create them.
+
+    The point coordinates, cell connectivity and data are collected in
+    NumPy arrays. They are passed to VTK at once in complete_data.
+    """
 
     def __init__(self):
         # Initialize VTK objects.
@@ -113,12 +461,24 @@ class VTKWriter:
         # Link points to grid.
         self.grid.SetPoints(self.points)
 
+        # Buffers for the points and cells.
+        self._n_points = 0
+        self._point_coordinates = []
+        self._n_cells = 0
+        self._cell_types = []
+        self._cell_n_points = []
+        self._cell_connectivity = []
+
         # Container for output data.
         self.data = {}
         for key1 in _mpy.vtk_geo:
             for key2 in _mpy.vtk_tensor:
                 self.data[key1, key2] = {}
 
+        # Indices of the points for nodes that are shared between cells, see
+        # add_nodes.
+        self.node_point_indices = {}
+
     def add_points(self, points, *, point_data=None):
         """Add points to the data stored in this object.
 
@@ -137,6 +497,7 @@ class VTKWriter:
             A list with the global indices of the added points.
         """
 
+        points = _np.asarray(points, dtype=float).reshape(-1, 3)
         n_points = len(points)
 
         # Check if point data containers are of the correct size
@@ -150,17 +511,39 @@ class VTKWriter:
                     )
 
         # Add point data
-        self._add_data(point_data, _mpy.vtk_geo.point, n_new_items=n_points)
+        self._add_data(point_data, _mpy.vtk_geo.point, self._n_points)
 
         # Add point coordinates
-        n_grid_points = self.points.GetNumberOfPoints()
-        for point in points:
-            # Add the coordinate to the global list of coordinates.
-            self.points.InsertNextPoint(*point)
+        indices = _np.arange(self._n_points, self._n_points + n_points, dtype=int)
+        self._point_coordinates.append(points)
+        self._n_points += n_points
+        return indices
+
+    def add_nodes(self, nodes):
+        """Add nodes as points that can be shared between multiple cells.
+
+        Each node is added once, together with the point data for the node
+        sets it is part of. The indices of the points are stored in
+        node_point_indices.
+
+        Args
+        ----
+        nodes: [Node]
+            Nodes to be added. Nodes that were already added are skipped.
+        """
 
-        return _np.array(
-            [n_grid_points + i_point for i_point in range(len(points))], dtype=int
+        nodes = [
+            node for node in dict.fromkeys(nodes) if node not in self.node_point_indices
+        ]
+        if len(nodes) == 0:
+            return
+
+        point_data = {}
+        add_point_data_node_sets_batch(point_data, [[node] for node in nodes])
+        indices = self.add_points(
+            [node.coordinates for node in nodes], point_data=point_data
         )
+        self.node_point_indices.update(zip(nodes, indices.tolist()))
 
     def add_cell(self, cell_type, topology, *, cell_data=None):
         """Create a cell and add it to the global array.
@@ -177,166 +560,149 @@ class VTKWriter:
             will be set to mpy.vtk_nan for the newly added cell.
         """
 
-        # Add the data entries.
-        self._add_data(cell_data, _mpy.vtk_geo.cell)
+        # Convert the cell data to data for a single cell.
+        if cell_data is not None:
+            single_cell_data = {}
+            for key, item_value in cell_data.items():
+                value, data_type = _get_data_value_and_type(item_value)
+                single_cell_data[key] = ([value], data_type)
+            cell_data = single_cell_data
 
-        # Create the cell.
-        geometry_item = cell_type()
-        geometry_item.GetPointIds().SetNumberOfIds(len(topology))
+        self.add_cells(cell_type, [topology], cell_data=cell_data)
 
-        # Set the connectivity
-        for i_local, i_global in enumerate(topology):
-            geometry_item.GetPointIds().SetId(i_local, i_global)
+    def add_cells(self, cell_type, topologies, *, cell_data=None):
+        """Create multiple cells of the same type and add them to the global
+        array.
+
+        Args
+        ----
+        cell_type: VTK_type
+            Type of cells that will be created.
+        topologies: [[int]]
+            The connectivity between each cell and the global points. This
+            can either be a list of connectivity arrays or a two dimensional
+            array, if all cells have the same number of points.
+        cell_data: dic
+            A dictionary containing data that will be added for the newly added
+            cells, i.e., each value has to contain one entry per cell.
+            If a field exists in the global data but not in the one added here,
+            that field will be set to mpy.vtk_nan for the newly added cells.
+        """
+
+        if isinstance(topologies, _np.ndarray) and topologies.ndim == 2:
+            n_cells = len(topologies)
+            n_points = _np.full(n_cells, topologies.shape[1], dtype=int)
+            connectivity = topologies.ravel()
+        else:
+            topologies = [_np.asarray(topology, dtype=int) for topology in topologies]
+            n_cells = len(topologies)
+            n_points = _np.array([len(topology) for topology in topologies], dtype=int)
+            connectivity = (
+                _np.concatenate(topologies) if n_cells > 0 else _np.zeros(0, dtype=int)
+            )
+
+        # Check if cell data containers are of the correct size
+        if cell_data is not None:
+            for key, item_value in cell_data.items():
+                value, _data_type = _get_data_value_and_type(item_value)
+                if not len(value) == n_cells:
+                    raise IndexError(
+                        f"The number of cells is {n_cells},"
+                        f"the length of {key} is {len(value)}, does not match!"
+                    )
+
+        # Add the data entries.
+        self._add_data(cell_data, _mpy.vtk_geo.cell, self._n_cells)
 
         # Add to global cells
-        self.grid.InsertNextCell(
-            geometry_item.GetCellType(), geometry_item.GetPointIds()
+        self._cell_types.append(
+            _np.full(n_cells, _get_vtk_cell_type_id(cell_type), dtype=_np.uint8)
         )
+        self._cell_n_points.append(n_points)
+        self._cell_connectivity.append(_np.asarray(connectivity, dtype=int))
+        self._n_cells += n_cells
 
-    def _add_data(self, data_container, vtk_geom_type, *, n_new_items=1):
+    def _add_data(self, data_container, vtk_geom_type, start_index):
         """Add a data container to the existing global data container of this
         object.
 
+        Fields that are in the global data but not in the one that is added
+        are filled up with nan values in complete_data.
+
         Args
         ----
-        data_container: see self.add_cell
+        data_container: see self.add_points and self.add_cells
         vtk_geom_type: mpy.vtk_geo
             Type of data container that is added
-        n_new_items: int
-            Number of new items added. This is needed to fill up data fields that are in the
-            global data but not in the one that is added.
+        start_index: int
+            Global index of the first point / cell the data belongs to.
         """
 
-        # Check if data container already exists. If not, add it and also add
-        # previous entries.
-        if data_container is not None:
-            if vtk_geom_type == _mpy.vtk_geo.cell:
-                n_items = self.grid.GetNumberOfCells()
-            else:
-                n_items = self.grid.GetNumberOfPoints()
+        if data_container is None:
+            return
 
-            for key, item_value in data_container.items():
-                # Get the data and the value type (int or float).
-                value, data_type = _get_data_value_and_type(item_value)
+        for key, item_value in data_container.items():
+            # Get the data and the value type (int or float).
+            value, data_type = _get_data_value_and_type(item_value)
+            value = _np.asarray(value)
+            vtk_tensor_type = _get_vtk_tensor_type(value)
 
-                # Data type.
-                if vtk_geom_type == _mpy.vtk_geo.cell:
-                    vtk_tensor_type = self._get_vtk_data_type(value)
-                else:
-                    for item in value:
-                        vtk_tensor_type = self._get_vtk_data_type(item)
-
-                # Check if key already exists.
-                if key not in self.data[vtk_geom_type, vtk_tensor_type].keys():
-                    # Set up the VTK data array.
-                    if data_type is _mpy.vtk_type.float:
-                        data = _vtk.vtkDoubleArray()
-                    else:
-                        data = _vtk.vtkIntArray()
-                    data.SetName(key)
-                    if vtk_tensor_type == _mpy.vtk_tensor.scalar:
-                        data.SetNumberOfComponents(1)
-                    else:
-                        data.SetNumberOfComponents(3)
-
-                    # Add the empty values for all previous cells / points.
-
-                    for i in range(n_items):
-                        self._add_single_data_item(data, vtk_tensor_type)
-                    self.data[vtk_geom_type, vtk_tensor_type][key] = data
-
-                else:
-                    # In this case we just check that the already existing
-                    # data has the same type.
-                    data_array = self.data[vtk_geom_type, vtk_tensor_type][key]
-                    if not _get_vtk_array_type(data_array) == data_type:
-                        raise ValueError(
-                            (
-                                'The existing data with the key "{}"'
-                                + ' is of type "{}", but the type you tried to add'
-                                + ' is "{}"!'
-                            ).format(key, data_array.GetDataTypeAsString(), data_type)
-                        )
-
-        # Add to global data. Check if there is something to be added. If not an empty value
-        # is added.
-        for key_tensor in _mpy.vtk_tensor:
-            global_data = self.data[vtk_geom_type, key_tensor]
-            if data_container is None:
-                data_container = {}
-
-            for key, value in global_data.items():
-                # Check if an existing field is also given for this function.
-                if key in data_container.keys():
-                    # Get the data and the value type (int or float).
-                    data_values, _ = _get_data_value_and_type(data_container[key])
-
-                    # Add the given data.
-                    if vtk_geom_type == _mpy.vtk_geo.cell:
-                        self._add_single_data_item(
-                            value, key_tensor, non_zero_data=data_values
-                        )
-                    else:
-                        for item in data_values:
-                            self._add_single_data_item(
-                                value, key_tensor, non_zero_data=item
-                            )
-                else:
-                    # Add empty data.
-                    if vtk_geom_type == _mpy.vtk_geo.cell:
-                        self._add_single_data_item(value, key_tensor)
-                    else:
-                        for item in range(n_new_items):
-                            self._add_single_data_item(value, key_tensor)
-
-    @staticmethod
-    def _get_vtk_data_type(data):
-        """Return the type of data.
-
-        Check if data matches an expected case.
-        """
-
-        if isinstance(data, (list, _np.ndarray)):
-            if len(data) == 3:
-                return _mpy.vtk_tensor.vector
-            raise IndexError(
-                f"Only 3d vectors are implemented yet! Got len(data) = {len(data)}"
-            )
-        elif isinstance(data, _numbers.Number):
-            return _mpy.vtk_tensor.scalar
-
-        raise ValueError(f"Data {data} did not match any expected case!")
+            # Check if key already exists.
+            global_data = self.data[vtk_geom_type, vtk_tensor_type]
+            if key not in global_data.keys():
+                global_data[key] = _VTKDataField(data_type, vtk_tensor_type)
+            else:
+                # In this case we just check that the already existing
+                # data has the same type.
+                data_field = global_data[key]
+                if not data_field.data_type == data_type:
+                    raise ValueError(
+                        (
+                            'The existing data with the key "{}"'
+                            + ' is of type "{}", but the type you tried to add'
+                            + ' is "{}"!'
+                        ).format(key, data_field.get_vtk_data_type_string(), data_type)
+                    )
 
-    @staticmethod
-    def _add_single_data_item(data, vtk_tensor_type, non_zero_data=None):
-        """Add data to a VTK data array."""
+            global_data[key].chunks.append((start_index, value))
 
-        if _get_vtk_array_type(data) == _mpy.vtk_type.int:
-            nan_value = _mpy.vtk_nan_int
-        elif _get_vtk_array_type(data) == _mpy.vtk_type.float:
-            nan_value = _mpy.vtk_nan_float
+    def complete_data(self):
+        """Add the stored points, cells and data to the vtk grid."""
 
-        if vtk_tensor_type == _mpy.vtk_tensor.scalar:
-            if non_zero_data is None:
-                data.InsertNextTuple1(nan_value)
-            else:
-                data.InsertNextTuple1(non_zero_data)
+        # Set the point coordinates.
+        if self._n_points > 0:
+            coordinates = _np.concatenate(self._point_coordinates)
         else:
-            if non_zero_data is None:
-                data.InsertNextTuple3(nan_value, nan_value, nan_value)
-            else:
-                data.InsertNextTuple3(
-                    non_zero_data[0], non_zero_data[1], non_zero_data[2]
-                )
+            coordinates = _np.zeros((0, 3))
+        self.points.SetData(_numpy_support.numpy_to_vtk(coordinates, deep=True))
+
+        # Set the cells.
+        if self._n_cells > 0:
+            offsets = _np.zeros(self._n_cells + 1, dtype=int)
+            _np.cumsum(_np.concatenate(self._cell_n_points), out=offsets[1:])
+            cells = _vtk.vtkCellArray()
+            cells.SetData(
+                _get_vtk_int64_array(offsets),
+                _get_vtk_int64_array(_np.concatenate(self._cell_connectivity)),
+            )
+            cell_types = _numpy_support.numpy_to_vtk(
+                _np.concatenate(self._cell_types),
+                deep=True,
+                array_type=_vtk.VTK_UNSIGNED_CHAR,
+            )
+            self.grid.SetCells(cell_types, cells)
 
-    def complete_data(self):
-        """Add the stored data to the vtk grid."""
+        # Set the data.
         for (key_geom, _key_data), value in self.data.items():
-            for vtk_data in value.values():
+            for name, data_field in value.items():
                 if key_geom == _mpy.vtk_geo.cell:
-                    self.grid.GetCellData().AddArray(vtk_data)
+                    self.grid.GetCellData().AddArray(
+                        data_field.get_vtk_array(name, self._n_cells)
+                    )
                 else:
-                    self.grid.GetPointData().AddArray(vtk_data)
+                    self.grid.GetPointData().AddArray(
+                        data_field.get_vtk_array(name, self._n_points)
+                    )
 
     def write_vtk(self, filepath, *, binary=True):
         """Write the VTK geometry and data to a file.
@@ -348,25 +714,95 @@ class VTKWriter:
         binary: bool
             If the data should be written encoded in binary or in human readable text.
         """
+        _check_vtk_file_path(filepath, ".vtu")
+        _write_vtu(self.grid, filepath, binary=binary)
 
-        # Check if directory for file exits.
-        file_directory = _os.path.dirname(filepath)
-        if not _os.path.isdir(file_directory):
-            raise ValueError(f"Directory {file_directory} does not exist!".format())
+    def write_pvtu(self, filepath, n_pieces, *, binary=True, n_threads=None):
+        """Write the VTK geometry and data to a partitioned file.
 
-        # Initialize VTK writer.
-        writer = _vtk.vtkXMLUnstructuredGridWriter()
+        The cells are split into n_pieces spatially coherent pieces, which
+        are written to separate vtu files in parallel. The pvtu file
+        references all pieces.
 
-        # Set the ascii flag.
-        if not binary:
-            writer.SetDataModeToAscii()
+        Args
+        ----
+        filepath: str
+            Path to output file. The file extension should be pvtu. The
+            pieces are written to the same directory with the suffix
+            "_{i_piece}.vtu".
+        n_pieces: int
+            Number of pieces.
+        binary: bool
+            If the data should be written encoded in binary or in human readable text.
+        n_threads: int
+            Number of threads used to write the pieces. Defaults to the
+            default of ThreadPoolExecutor. For 1, the pieces are written in
+            the calling thread.
+        """
 
-        # Check the file extension.
-        _filename, file_extension = _os.path.splitext(filepath)
-        if not file_extension.lower() == ".vtu":
-            _warnings.warn(f'The extension should be "vtu", got {file_extension}!')
+        _check_vtk_file_path(filepath, ".pvtu")
+        file_base, _file_extension = _os.path.splitext(filepath)
+        digits = len(str(n_pieces - 1))
+        piece_filepaths = [
+            f"{file_base}_{i_piece:0{digits}d}.vtu" for i_piece in range(n_pieces)
+        ]
+
+        # Split the cells based on their centers.
+        cell_centers = _vtk.vtkCellCenters()
+        cell_centers.SetInputData(self.grid)
+        cell_centers.Update()
+        piece_ids = _get_spatial_partition(
+            _numpy_support.vtk_to_numpy(cell_centers.GetOutput().GetPoints().GetData()),
+            n_pieces,
+        )
+        piece_cell_ids = _np.split(
+            _np.argsort(piece_ids, kind="stable"),
+            _np.cumsum(_np.bincount(piece_ids, minlength=n_pieces))[:-1],
+        )
 
-        # Write geometry and data to file.
-        writer.SetFileName(filepath)
-        writer.SetInputData(self.grid)
-        writer.Write()
+        def write_piece(i_piece):
+            """Extract and write a single piece."""
+            piece = _extract_cells(self.grid, piece_cell_ids[i_piece])
+            _write_vtu(piece, piece_filepaths[i_piece], binary=binary)
+
+        if n_threads == 1:
+            for i_piece in range(n_pieces):
+                write_piece(i_piece)
+        else:
+            with _ThreadPoolExecutor(n_threads) as executor:
+                list(executor.map(write_piece, range(n_pieces)))
+
+        # Write the file that references the pieces.
+        root = _ElementTree.Element(
+            "VTKFile",
+            type="PUnstructuredGrid",
+            version="0.1",
+            byte_order="LittleEndian",
+        )
+        grid = _ElementTree.SubElement(root, "PUnstructuredGrid", GhostLevel="0")
+        for data, data_tag in (
+            (self.grid.GetPointData(), "PPointData"),
+            (self.grid.GetCellData(), "PCellData"),
+        ):
+            data_element = _ElementTree.SubElement(grid, data_tag)
+            for i_array in range(data.GetNumberOfArrays()):
+                vtk_array = data.GetArray(i_array)
+                _ElementTree.SubElement(
+                    data_element,
+                    "PDataArray",
+                    type=_get_vtk_xml_data_type(vtk_array),
+                    Name=vtk_array.GetName(),
+                    NumberOfComponents=str(vtk_array.GetNumberOfComponents()),
+                )
+        points = _ElementTree.SubElement(grid, "PPoints")
+        _ElementTree.SubElement(
+            points,
+            "PDataArray",
+            type=_get_vtk_xml_data_type(self.grid.GetPoints().GetData()),
+            NumberOfComponents="3",
+        )
+        for piece_filepath in piece_filepaths:
+            _ElementTree.SubElement(
+                grid, "Piece", Source=_os.path.basename(piece_filepath)
+            )
+        _write_vtk_xml_file(filepath, root)
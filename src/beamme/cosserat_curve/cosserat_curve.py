@@ -37,6 +37,9 @@ from beamme.core.conf import mpy as _mpy
 from beamme.core.rotation import Rotation as _Rotation
 from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
 from beamme.core.rotation import smallest_rotation as _smallest_rotation
+from beamme.core.rotation import (
+    smallest_rotation_transport as _smallest_rotation_transport,
+)
 
 
 def get_piecewise_linear_arc_length_along_points(
@@ -50,12 +53,38 @@ def get_piecewise_linear_arc_length_along_points(
         Array containing the point coordinates
     """
 
-    n_points = len(coordinates)
     point_distance = _np.linalg.norm(coordinates[1:] - coordinates[:-1], axis=1)
-    point_arc_length = _np.zeros(n_points)
-    for i in range(1, n_points):
-        point_arc_length[i] = point_arc_length[i - 1] + point_distance[i - 1]
-    return point_arc_length
+    return _np.concatenate([[0.0], _np.cumsum(point_distance)])
+
+
+def slerp_evaluate(
+    q1: _NDArray[_quaternion.quaternion],
+    q2: _NDArray[_quaternion.quaternion],
+    tau: _np.ndarray,
+) -> _NDArray[_quaternion.quaternion]:
+    """Vectorized version of quaternion.slerp_evaluate.
+
+    Args
+    ----
+    q1, q2:
+        Arrays with the start and end quaternions of the interpolation
+    tau:
+        Array with the interpolation parameters, 0 returns q1, 1 returns q2
+        (up to the sign)
+    """
+    # Interpolate along the shortest path, as quaternion.slerp_evaluate does.
+    relative_rotation = _np.atleast_1d(q2 / q1)
+    relative_rotation[_quaternion.as_float_array(relative_rotation)[:, 0] < 0] *= -1
+    return _np.exp(tau * _np.log(relative_rotation)) * q1
+
+
+def _rotate_vectors_pointwise(
+    quaternions: _NDArray[_quaternion.quaternion], vectors: _np.ndarray
+) -> _np.ndarray:
+    """Rotate each vector with the corresponding quaternion."""
+    return _np.einsum(
+        "ijk,ik->ij", _quaternion.as_rotation_matrix(quaternions), vectors
+    )
 
 
 def get_spline_interpolation(
@@ -113,17 +142,12 @@ def get_quaternions_along_curve(
     last_rotation = _Rotation.from_basis(t0, basis(min_projection))
 
     # Get the rotation vectors along the curve. They are calculated with smallest rotation mappings.
-    n_points = len(point_arc_length)
-    quaternions = _np.zeros(n_points, dtype=_quaternion.quaternion)
+    quaternions = _np.zeros((len(point_arc_length), 4))
     quaternions[0] = last_rotation.q
-    for i in range(1, n_points):
-        rotation = _smallest_rotation(
-            last_rotation,
-            centerline_interpolation_derivative(point_arc_length[i]),
-        )
-        quaternions[i] = rotation.q
-        last_rotation = rotation
-    return quaternions
+    quaternions[1:] = _smallest_rotation_transport(
+        last_rotation, centerline_interpolation_derivative(point_arc_length[1:])
+    )
+    return _quaternion.from_float_array(quaternions)
 
 
 def get_relative_distance_and_rotations(
@@ -213,6 +237,10 @@ class CosseratCurve(object):
                 )[0]
             )
 
+        # Cache for the configurations of the curve for a given factor, see
+        # get_configuration
+        self._configurations: dict = {}
+
         # Set the interpolation of the (positional) centerline
         self.set_centerline_interpolation()
 
@@ -258,6 +286,7 @@ class CosseratCurve(object):
         self.centerline_interpolation = get_spline_interpolation(
             self.coordinates, self.point_arc_length
         )
+        self._configurations.clear()
 
     def translate(self, vector):
         """Translate the curve by the given vector."""
@@ -295,6 +324,7 @@ class CosseratCurve(object):
             * self.relative_rotations
             * material_twist_rotation
         )
+        self._configurations.clear()
 
     def get_centerline_position_and_rotation(
         self, arc_length: float, **kwargs
@@ -315,7 +345,7 @@ class CosseratCurve(object):
         Args
         ----
         points_on_arc_length: list(float)
-            A sorted list with the arc lengths along the curve centerline
+            A list with the arc lengths along the curve centerline
         factor: float
             Factor to scale the curvature along the curve.
                 factor == 1
@@ -325,118 +355,116 @@ class CosseratCurve(object):
                     the scaled curvature of the curve to obtain a intuitive wrapping
         """
 
-        # Get the points that are within the arc length of the given curve.
-        points_on_arc_length = _np.asarray(points_on_arc_length)
-        points_in_bounds = _np.logical_and(
-            points_on_arc_length > self.point_arc_length[0],
-            points_on_arc_length < self.point_arc_length[-1],
+        points_on_arc_length = _np.asarray(points_on_arc_length, dtype=float)
+        coordinates, quaternions, centerline_interpolation = self.get_configuration(
+            factor
         )
-        index_in_bound = _np.where(points_in_bounds == True)[0]
-        index_out_of_bound = _np.where(points_in_bounds == False)[0]
-        points_on_arc_length_in_bound = [
-            self.point_arc_length[0],
-            *points_on_arc_length[index_in_bound],
-            self.point_arc_length[-1],
-        ]
-
-        if factor < (1.0 - _mpy.eps_quaternion):
-            coordinates = _np.zeros_like(self.coordinates)
-            quaternions = _np.zeros_like(self.quaternions)
-            coordinates[0] = self.coordinates[0]
-            quaternions[0] = self.quaternions[0]
-            for i_segment in range(self.n_points - 1):
-                relative_distance_rotation = _quaternion.slerp_evaluate(
-                    _quaternion.quaternion(1),
-                    self.relative_distances_rotation[i_segment],
-                    factor,
-                )
-                # In the initial configuration (factor=0) we get a straight curve, so we need
-                # to use the arc length here. In the final configuration (factor=1) we want to
-                # exactly recover the input points, so we need the piecewise linear distance.
-                # Between them, we interpolate.
-                relative_distance = (factor * self.relative_distances[i_segment]) + (
-                    1.0 - factor
-                ) * (
-                    self.point_arc_length[i_segment + 1]
-                    - self.point_arc_length[i_segment]
-                )
-                coordinates[i_segment + 1] = (
-                    _quaternion.rotate_vectors(
-                        quaternions[i_segment] * relative_distance_rotation,
-                        [relative_distance, 0, 0],
-                    )
-                    + coordinates[i_segment]
-                )
-                quaternions[i_segment + 1] = quaternions[
-                    i_segment
-                ] * _quaternion.slerp_evaluate(
-                    _quaternion.quaternion(1),
-                    self.relative_rotations[i_segment],
-                    factor,
-                )
-        else:
-            coordinates = self.coordinates
-            quaternions = self.quaternions
 
-        sol_r = _np.zeros([len(points_on_arc_length_in_bound), 3])
-        sol_q = _np.zeros(
-            len(points_on_arc_length_in_bound), dtype=_quaternion.quaternion
+        # Clip the points to the arc length of the curve, outside of the curve
+        # we extrapolate from the end points.
+        arc_length_in_bound = _np.clip(
+            points_on_arc_length, self.point_arc_length[0], self.point_arc_length[-1]
         )
-        for i_point, centerline_arc_length in enumerate(points_on_arc_length_in_bound):
-            if (
-                centerline_arc_length >= self.point_arc_length[0]
-                and centerline_arc_length <= self.point_arc_length[-1]
-            ):
-                for i in range(1, self.n_points):
-                    centerline_index = i - 1
-                    if self.point_arc_length[i] > centerline_arc_length:
-                        break
-
-                # Get the two rotation vectors and arc length values
-                arc_lengths = self.point_arc_length[
-                    centerline_index : centerline_index + 2
-                ]
-                q1 = quaternions[centerline_index]
-                q2 = quaternions[centerline_index + 1]
-
-                # Linear interpolate the arc length
-                xi = (centerline_arc_length - arc_lengths[0]) / (
-                    arc_lengths[1] - arc_lengths[0]
-                )
 
-                # Perform a spline interpolation for the positions and a slerp
-                # interpolation for the rotations
-                sol_r[i_point] = get_spline_interpolation(
-                    coordinates, self.point_arc_length
-                )(centerline_arc_length)
-                sol_q[i_point] = _quaternion.slerp_evaluate(q1, q2, xi)
-            else:
-                raise ValueError("Centerline value out of bounds")
-
-        # Set the already computed results in the final data structures
-        sol_r_final = _np.zeros([len(points_on_arc_length), 3])
-        sol_q_final = _np.zeros(len(points_on_arc_length), dtype=_quaternion.quaternion)
-        if len(index_in_bound) > 0:
-            sol_r_final[index_in_bound] = sol_r[index_in_bound - index_in_bound[0] + 1]
-            sol_q_final[index_in_bound] = sol_q[index_in_bound - index_in_bound[0] + 1]
+        # Perform a spline interpolation for the positions and a slerp
+        # interpolation for the rotations
+        segment_index = _np.clip(
+            _np.searchsorted(self.point_arc_length, arc_length_in_bound, side="right")
+            - 1,
+            0,
+            self.n_points - 2,
+        )
+        arc_length_start = self.point_arc_length[segment_index]
+        xi = (arc_length_in_bound - arc_length_start) / (
+            self.point_arc_length[segment_index + 1] - arc_length_start
+        )
+        sol_r = centerline_interpolation(arc_length_in_bound)
+        sol_q = slerp_evaluate(
+            quaternions[segment_index], quaternions[segment_index + 1], xi
+        )
 
         # Perform the extrapolation at both ends of the curve
-        for i in index_out_of_bound:
-            arc_length = points_on_arc_length[i]
-            if arc_length <= self.point_arc_length[0]:
-                index = 0
-            elif arc_length >= self.point_arc_length[-1]:
-                index = -1
-            else:
-                raise ValueError("Should not happen")
-
-            length = arc_length - self.point_arc_length[index]
-            r = sol_r[index]
-            q = sol_q[index]
-            sol_r_final[i] = r + _Rotation.from_quaternion(q) * [length, 0, 0]
-            sol_q_final[i] = q
-
-        return sol_r_final, sol_q_final
+        length = points_on_arc_length - arc_length_in_bound
+        index_out_of_bound = _np.flatnonzero(length != 0.0)
+        if len(index_out_of_bound) > 0:
+            direction = _np.zeros((len(index_out_of_bound), 3))
+            direction[:, 0] = length[index_out_of_bound]
+            sol_r[index_out_of_bound] += _rotate_vectors_pointwise(
+                sol_q[index_out_of_bound], direction
+            )
+
+        return sol_r, sol_q
+
+    def get_configuration(
+        self, factor: float
+    ) -> _Tuple[_np.ndarray, _NDArray[_quaternion.quaternion], _interpolate.BSpline]:
+        """Return the configuration of the curve for a given curvature scaling
+        factor.
+
+        The configurations are cached, so repeated evaluations for the same
+        factor are cheap.
+
+        Args
+        ----
+        factor: float
+            Factor to scale the curvature along the curve, see
+            get_centerline_positions_and_rotations
+
+        Return
+        ----
+        coordinates:
+            The coordinates of the curve points
+        quaternions:
+            The quaternions at the curve points
+        centerline_interpolation:
+            The spline interpolation of the coordinates along the arc length
+        """
+
+        if factor >= (1.0 - _mpy.eps_quaternion):
+            return self.coordinates, self.quaternions, self.centerline_interpolation
+
+        if factor not in self._configurations:
+            relative_distance_rotation = slerp_evaluate(
+                _np.full(self.n_points - 1, _quaternion.one),
+                self.relative_distances_rotation,
+                factor,
+            )
+            relative_rotations = slerp_evaluate(
+                _np.full(self.n_points - 1, _quaternion.one),
+                self.relative_rotations,
+                factor,
+            )
+            quaternions = _np.multiply.accumulate(
+                _np.concatenate([self.quaternions[:1], relative_rotations])
+            )
+
+            # In the initial configuration (factor=0) we get a straight curve, so we need
+            # to use the arc length here. In the final configuration (factor=1) we want to
+            # exactly recover the input points, so we need the piecewise linear distance.
+            # Between them, we interpolate.
+            relative_distance = _np.zeros((self.n_points - 1, 3))
+            relative_distance[:, 0] = (factor * self.relative_distances) + (
+                1.0 - factor
+            ) * _np.diff(self.point_arc_length)
+            coordinates = _np.cumsum(
+                _np.concatenate(
+                    [
+                        self.coordinates[:1],
+                        _rotate_vectors_pointwise(
+                            quaternions[:-1] * relative_distance_rotation,
+                            relative_distance,
+                        ),
+                    ]
+                ),
+                axis=0,
+            )
+
+            self._configurations[factor] = (
+                coordinates,
+                quaternions,
+                get_spline_interpolation(coordinates, self.point_arc_length),
+            )
+        return self._configurations[factor]
 
     def project_point(self, p, t0=None) -> float:
         """Project a point to the curve, return the parameter coordinate for
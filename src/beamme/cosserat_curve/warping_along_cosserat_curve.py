@@ -31,30 +31,41 @@ from numpy.typing import NDArray as _NDArray
 
 from beamme.core.boundary_condition import BoundaryCondition as _BoundaryCondition
 from beamme.core.conf import mpy as _mpy
+from beamme.core.function import Function as _Function
 from beamme.core.geometry_set import GeometrySet as _GeometrySet
 from beamme.core.mesh import Mesh as _Mesh
 from beamme.core.node import Node as _Node
-from beamme.core.node import NodeCosserat as _NodeCosserat
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import add_rotations as _add_rotations
+from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
 from beamme.cosserat_curve.cosserat_curve import CosseratCurve as _CosseratCurve
+from beamme.cosserat_curve.cosserat_curve import slerp_evaluate as _slerp_evaluate
+from beamme.four_c.function_utility import (
+    create_linear_interpolation_dict as _create_linear_interpolation_dict,
+)
 from beamme.four_c.function_utility import (
     create_linear_interpolation_function as _create_linear_interpolation_function,
 )
 from beamme.geometric_search.find_close_points import (
     find_close_points as _find_close_points,
 )
+from beamme.geometric_search.find_close_points import (
+    point_partners_to_unique_indices as _point_partners_to_unique_indices,
+)
+from beamme.utils.nodes import get_nodal_coordinates as _get_nodal_coordinates
 
 
 def get_arc_length_and_cross_section_coordinates(
     coordinates: _np.ndarray, origin: _np.ndarray, reference_rotation: _Rotation
-) -> _Tuple[float, _np.ndarray]:
+) -> _Tuple[_np.ndarray, _np.ndarray]:
     """Return the arc length and the cross section coordinates for a coordinate
     system defined by the reference rotation and the origin.
 
     Args
     ----
     coordinates:
-        Point coordinates in R3
+        Point coordinates in R3, either a single point or an array of points
+        (n_points x 3)
     origin:
         Origin of the coordinate system
     reference_rotation:
@@ -62,9 +73,15 @@ def get_arc_length_and_cross_section_coordinates(
         length direction.
     """
 
-    transformed_coordinates = reference_rotation.inv() * (coordinates - origin)
-    centerline_position = transformed_coordinates[0]
-    cross_section_coordinates = [0.0, *transformed_coordinates[1:]]
+    transformed_coordinates = _rotate_coordinates(
+        _np.atleast_2d(_np.asarray(coordinates, dtype=float) - origin),
+        reference_rotation.inv(),
+    )
+    centerline_position = transformed_coordinates[:, 0].copy()
+    cross_section_coordinates = transformed_coordinates
+    cross_section_coordinates[:, 0] = 0.0
+    if _np.ndim(coordinates) == 1:
+        return centerline_position[0], cross_section_coordinates[0]
     return centerline_position, cross_section_coordinates
 
 
@@ -104,132 +121,114 @@ def get_mesh_transformation(
 
     Return
     ----
-    positions: list(_np.array(n_nodes x 3))
-        A list for each time step containing the position of all nodes for that time step
-    relative_rotations: list(list(Rotation))
-        A list for each time step containing the relative rotations for all nodes at that
-        time step
+    positions: _np.array(n_steps x n_nodes x 3)
+        The position of all nodes for each time step
+    relative_rotations: _np.array(n_steps x n_nodes)
+        The relative rotations (as quaternions) of all nodes for each time step
     """
 
     # Define the factors for which we will generate the positions and rotations
     factors = _np.linspace(0.0, 1.0, n_steps + 1)
-    if initial_configuration:
-        n_output_steps = n_steps + 1
-    else:
-        n_output_steps = n_steps
+    if not initial_configuration:
         factors = _np.delete(factors, 0)
 
-    # Create output arrays
-    n_nodes = len(nodes)
-    positions = _np.zeros((n_output_steps, n_nodes, 3))
-    relative_rotations = _np.zeros(
-        (n_output_steps, n_nodes), dtype=_quaternion.quaternion
+    for node in nodes:
+        if not isinstance(node, _Node):
+            raise TypeError(
+                "All nodes in the mesh have to be derived from the base Node object"
+            )
+
+    return _get_coordinates_transformation(
+        curve,
+        _get_nodal_coordinates(nodes),
+        factors,
+        origin=_np.asarray(origin, dtype=float),
+        reference_rotation=reference_rotation,
+        **kwargs,
     )
 
+
+def _get_coordinates_transformation(
+    curve: _CosseratCurve,
+    coordinates: _np.ndarray,
+    factors: _np.ndarray,
+    *,
+    origin: _np.ndarray,
+    reference_rotation: _Rotation,
+    **kwargs,
+) -> _Tuple[_np.ndarray, _NDArray[_quaternion.quaternion]]:
+    """Return the positions and relative rotations of points for the given
+    load factors, see get_mesh_transformation.
+
+    Args
+    ----
+    coordinates:
+        Coordinates (n_points x 3) of the points in the reference configuration
+    factors:
+        Load factors for which the configuration is evaluated
+    """
+
     # Get all arc lengths and cross section positions
-    arc_lengths = _np.zeros((n_nodes, 1))
-    cross_section_coordinates = [None] * n_nodes
-    for i_node, node in enumerate(nodes):
-        (
-            arc_lengths[i_node],
-            cross_section_coordinates[i_node],
-        ) = get_arc_length_and_cross_section_coordinates(
-            node.coordinates, origin, reference_rotation
+    arc_lengths, cross_section_coordinates = (
+        get_arc_length_and_cross_section_coordinates(
+            coordinates, origin, reference_rotation
         )
+    )
 
     # Get unique arc length points
-    has_partner, n_partner = _find_close_points(arc_lengths)
-    arc_lengths_unique = [None] * n_partner
-    has_partner_total = [-2] * len(arc_lengths)
-    for i in range(len(arc_lengths)):
-        partner_id = has_partner[i]
-        if partner_id == -1:
-            has_partner_total[i] = len(arc_lengths_unique)
-            arc_lengths_unique.append(arc_lengths[i][0])
-        else:
-            if arc_lengths_unique[partner_id] is None:
-                arc_lengths_unique[partner_id] = arc_lengths[i][0]
-            has_partner_total[i] = partner_id
-
-    n_total = len(arc_lengths_unique)
-    arc_lengths_unique = _np.array(arc_lengths_unique)
-    arc_lengths_sorted_index = _np.argsort(arc_lengths_unique)
-    arc_lengths_sorted = arc_lengths_unique[arc_lengths_sorted_index]
-    arc_lengths_sorted_index_inv = [-2 for i in range(n_total)]
-    for i in range(n_total):
-        arc_lengths_sorted_index_inv[arc_lengths_sorted_index[i]] = i
-    point_to_unique = []
-    for partner in has_partner_total:
-        point_to_unique.append(arc_lengths_sorted_index_inv[partner])
-
-    # Get all configurations for the unique points
-    positions_for_all_steps = []
-    quaternions_for_all_steps = []
-
-    for factor in factors:
-        sol_r, sol_q = curve.get_centerline_positions_and_rotations(
-            arc_lengths_sorted, factor=factor, **kwargs
-        )
-        positions_for_all_steps.append(sol_r)
-        quaternions_for_all_steps.append(sol_q)
+    unique_indices, point_to_unique = _point_partners_to_unique_indices(
+        _find_close_points(arc_lengths[:, _np.newaxis])[0]
+    )
+    arc_lengths_unique = arc_lengths[unique_indices]
+
+    # Check that the arc length coordinates match
+    if _np.any(
+        _np.abs(arc_lengths - arc_lengths_unique[point_to_unique]) > _mpy.eps_pos
+    ):
+        raise ValueError("Arc lengths do not match")
 
     # Get data required for the rigid body motion
     curve_start_pos, curve_start_rot = curve.get_centerline_position_and_rotation(0.0)
     rigid_body_translation = curve_start_pos - origin
-    rigid_body_rotation = curve_start_rot
-
-    # Loop over nodes and map them to the new configuration
-    for i_node, node in enumerate(nodes):
-        if not isinstance(node, _Node):
-            raise TypeError(
-                "All nodes in the mesh have to be derived from the base Node object"
-            )
-
-        node_unique_id = point_to_unique[i_node]
-        cross_section_position = cross_section_coordinates[i_node]
-
-        # Check that the arc length coordinates match
-        if (
-            _np.abs(arc_lengths[i_node] - arc_lengths_sorted[node_unique_id])
-            > _mpy.eps_pos
-        ):
-            raise ValueError("Arc lengths do not match")
-
-        # Create the functions that describe the deformation
-        for i_step, factor in enumerate(factors):
-            centerline_pos = positions_for_all_steps[i_step][node_unique_id]
-            centerline_relative_pos = _quaternion.rotate_vectors(
-                curve_start_rot.conjugate(), centerline_pos - curve_start_pos
-            )
-            centerline_rotation = quaternions_for_all_steps[i_step][node_unique_id]
-            centerline_relative_rotation = (
-                curve_start_rot.conjugate() * centerline_rotation
-            )
-
-            rigid_body_rotation_for_factor = _quaternion.slerp_evaluate(
-                reference_rotation.get_numpy_quaternion(), rigid_body_rotation, factor
-            )
+    reference_quaternion = reference_rotation.get_numpy_quaternion()
+    rigid_body_rotations = _slerp_evaluate(
+        _np.full(len(factors), reference_quaternion), curve_start_rot, factors
+    )
 
-            current_pos = (
-                _quaternion.rotate_vectors(
-                    rigid_body_rotation_for_factor,
-                    (
-                        centerline_relative_pos
-                        + _quaternion.rotate_vectors(
-                            centerline_relative_rotation, cross_section_position
-                        )
-                    ),
-                )
-                + origin
-                + factor * rigid_body_translation
-            )
+    # Map the points to the configuration for each step
+    positions = _np.zeros((len(factors), len(coordinates), 3))
+    relative_rotations = _np.zeros(
+        (len(factors), len(coordinates)), dtype=_quaternion.quaternion
+    )
+    for i_step, factor in enumerate(factors):
+        sol_r, sol_q = curve.get_centerline_positions_and_rotations(
+            arc_lengths_unique, factor=factor, **kwargs
+        )
+        centerline_relative_pos = _rotate_coordinates(
+            sol_r - curve_start_pos,
+            _quaternion.as_float_array(curve_start_rot.conjugate()),
+        )[point_to_unique]
+        centerline_relative_rotation = (curve_start_rot.conjugate() * sol_q)[
+            point_to_unique
+        ]
 
-            positions[i_step, i_node] = current_pos
-            relative_rotations[i_step, i_node] = (
-                rigid_body_rotation_for_factor
-                * centerline_relative_rotation
-                * reference_rotation.get_numpy_quaternion().conjugate()
+        positions[i_step] = (
+            _rotate_coordinates(
+                centerline_relative_pos
+                + _rotate_coordinates(
+                    cross_section_coordinates,
+                    _quaternion.as_float_array(centerline_relative_rotation),
+                ),
+                _quaternion.as_float_array(rigid_body_rotations[i_step]),
             )
+            + origin
+            + factor * rigid_body_translation
+        )
+        relative_rotations[i_step] = (
+            rigid_body_rotations[i_step]
+            * centerline_relative_rotation
+            * reference_quaternion.conjugate()
+        )
 
     return positions, relative_rotations
 
@@ -242,6 +241,7 @@ def create_transform_boundary_conditions(
     t_end: float = 1.0,
     n_steps: int = 10,
     n_dof_per_node: int = 3,
+    compact: bool = False,
     **kwargs,
 ) -> None:
     """Create the Dirichlet boundary conditions that enforce the warping. The
@@ -263,6 +263,14 @@ def create_transform_boundary_conditions(
         End time for applying the warping boundary conditions
     n_dof_per_node:
         Number of DOF per node in 4C (is needed to correctly define the boundary conditions)
+    compact:
+        Per default, three functions and one boundary condition are created for each
+        node. If this is true, the nodes with the same arc length share one boundary
+        condition and three functions. The displacement of a node is an affine
+        function of its cross section coordinates, which are evaluated from the
+        reference coordinates of the node in the functions of space and time.
+        Therefore, the number of functions and boundary conditions only depends on
+        the number of cross sections, i.e., unique arc lengths, of the mesh.
     kwargs:
         Keyword arguments passed to get_mesh_transformation
     """
@@ -270,44 +278,165 @@ def create_transform_boundary_conditions(
     # If no nodes are given, use all nodes in the mesh
     if nodes is None:
         nodes = mesh.nodes
+    if len(nodes) == 0:
+        return
 
     time_values = _np.linspace(0.0, t_end, n_steps + 1)
 
-    # Get positions and rotations for each step
-    positions, _ = get_mesh_transformation(curve, nodes, n_steps=n_steps, **kwargs)
+    if compact:
+        for node_set, fun_pos in _get_compact_transform_functions(
+            curve, nodes, time_values, **kwargs
+        ):
+            for fun in fun_pos:
+                mesh.add(fun)
+            mesh.add(
+                _get_transform_boundary_condition(node_set, fun_pos, n_dof_per_node)
+            )
+        return
 
-    # Loop over nodes and map them to the new configuration
+    # Get the displacement history (n_nodes x 3 x n_steps+1) for each node
+    positions, _ = get_mesh_transformation(curve, nodes, n_steps=n_steps, **kwargs)
+    displacements = _np.transpose(
+        positions - _get_nodal_coordinates(nodes), axes=(1, 2, 0)
+    )
     for i_node, node in enumerate(nodes):
         # Create the functions that describe the deformation
-        reference_position = node.coordinates
-        displacement_values = _np.array(
-            [
-                positions[i_step][i_node] - reference_position
-                for i_step in range(n_steps + 1)
-            ]
-        )
         fun_pos = [
             _create_linear_interpolation_function(
-                time_values, displacement_values[:, i_dir]
+                time_values, displacements[i_node, i_dir]
             )
             for i_dir in range(3)
         ]
         for fun in fun_pos:
             mesh.add(fun)
-        n_additional_dof = n_dof_per_node - 3
-        mesh.add(
-            _BoundaryCondition(
-                _GeometrySet(node),
-                {
-                    "NUMDOF": n_dof_per_node,
-                    "ONOFF": [1] * 3 + [0] * n_additional_dof,
-                    "VAL": [1.0] * 3 + [0.0] * n_additional_dof,
-                    "FUNCT": fun_pos + [None] * n_additional_dof,
-                    "TAG": "monitor_reaction",
-                },
-                bc_type=_mpy.bc.dirichlet,
-            )
+        mesh.add(_get_transform_boundary_condition(node, fun_pos, n_dof_per_node))
+
+
+def _get_compact_transform_functions(
+    curve: _CosseratCurve,
+    nodes: list[_Node],
+    time_values: _np.ndarray,
+    *,
+    origin=[0.0, 0.0, 0.0],
+    reference_rotation=_Rotation(),
+    **kwargs,
+) -> list[_Tuple[list[_Node], list[_Function]]]:
+    """Return the nodes with the same arc length and the functions that
+    describe their displacements.
+
+    The displacement of a node with the cross section coordinates c_2 and c_3
+    is u = u_0 + c_2 * u_2 + c_3 * u_3, where u_0, u_2 and u_3 only depend on
+    the arc length. The cross section coordinates are linear functions of the
+    reference coordinates x, y and z of the node.
+
+    Args
+    ----
+    time_values:
+        Time values for the load factors from 0 to 1
+    kwargs:
+        Keyword arguments passed to get_mesh_transformation
+
+    Return
+    ----
+    A list with a tuple for each unique arc length, containing the nodes and
+    the functions for the three displacement directions.
+    """
+
+    origin = _np.asarray(origin, dtype=float)
+    factors = _np.linspace(0.0, 1.0, len(time_values))
+
+    # Group the nodes by their arc length, nodes with arc lengths within
+    # mpy.eps_pos are grouped, as in get_mesh_transformation.
+    arc_lengths, _ = get_arc_length_and_cross_section_coordinates(
+        _get_nodal_coordinates(nodes), origin, reference_rotation
+    )
+    unique_indices, node_to_unique = _point_partners_to_unique_indices(
+        _find_close_points(arc_lengths[:, _np.newaxis])[0]
+    )
+    n_unique = len(unique_indices)
+    if _np.any(
+        _np.abs(arc_lengths - arc_lengths[unique_indices][node_to_unique])
+        > _mpy.eps_pos
+    ):
+        raise ValueError("Arc lengths do not match")
+
+    # Get the displacement of a point on the centerline and of the points with
+    # unit cross section coordinates for each unique arc length.
+    basis = reference_rotation.get_rotation_matrix()
+    centerline_points = origin + _np.outer(arc_lengths[unique_indices], basis[:, 0])
+    points = _np.concatenate(
+        [
+            centerline_points,
+            centerline_points + basis[:, 1],
+            centerline_points + basis[:, 2],
+        ]
+    )
+    positions, _ = _get_coordinates_transformation(
+        curve,
+        points,
+        factors,
+        origin=origin,
+        reference_rotation=reference_rotation,
+        **kwargs,
+    )
+    displacements = (positions - points).reshape(len(factors), 3, n_unique, 3)
+    displacements[:, 1:] -= displacements[:, :1]
+
+    # Expressions for the cross section coordinates based on the reference
+    # coordinates of a node.
+    cross_section_expressions = [
+        " + ".join(
+            [
+                f"({float(value)!r}) * {name}"
+                for value, name in zip(basis[:, i_dir], "xyz")
+            ]
+            + [f"({-float(_np.dot(basis[:, i_dir], origin))!r})"]
         )
+        for i_dir in (1, 2)
+    ]
+    expression = (
+        f"u_0 + ({cross_section_expressions[0]}) * u_2"
+        f" + ({cross_section_expressions[1]}) * u_3"
+    )
+
+    node_order = _np.argsort(node_to_unique, kind="stable")
+    node_groups = _np.split(node_order, _np.cumsum(_np.bincount(node_to_unique))[:-1])
+    result = []
+    for i_unique, node_indices in enumerate(node_groups):
+        fun_pos = [
+            _Function(
+                [{"SYMBOLIC_FUNCTION_OF_SPACE_TIME": expression}]
+                + [
+                    _create_linear_interpolation_dict(
+                        time_values,
+                        displacements[:, i_variable, i_unique, i_dir],
+                        variable_name=variable_name,
+                        variable_index=i_variable,
+                    )
+                    for i_variable, variable_name in enumerate(["u_0", "u_2", "u_3"])
+                ]
+            )
+            for i_dir in range(3)
+        ]
+        result.append(([nodes[i_node] for i_node in node_indices], fun_pos))
+    return result
+
+
+def _get_transform_boundary_condition(nodes, fun_pos, n_dof_per_node):
+    """Return the Dirichlet boundary condition that prescribes the given
+    functions for the positional DOFs of the nodes."""
+    n_additional_dof = n_dof_per_node - 3
+    return _BoundaryCondition(
+        _GeometrySet(nodes),
+        {
+            "NUMDOF": n_dof_per_node,
+            "ONOFF": [1] * 3 + [0] * n_additional_dof,
+            "VAL": [1.0] * 3 + [0.0] * n_additional_dof,
+            "FUNCT": fun_pos + [None] * n_additional_dof,
+            "TAG": "monitor_reaction",
+        },
+        bc_type=_mpy.bc.dirichlet,
+    )
 
 
 def warp_mesh_along_curve(
@@ -333,14 +462,9 @@ def warp_mesh_along_curve(
         initial_configuration=False,
     )
 
-    # Loop over nodes and map them to the new configuration
-    for i_node, node in enumerate(mesh.nodes):
-        if not isinstance(node, _Node):
-            raise TypeError(
-                "All nodes in the mesh have to be derived from the base Node object"
-            )
-
-        new_pos = pos[0, i_node]
-        node.coordinates = new_pos
-        if isinstance(node, _NodeCosserat):
-            node.rotation = _Rotation.from_quaternion(rot[0, i_node]) * node.rotation
+    # Set the new configuration for all nodes
+    _, quaternions = mesh.get_nodal_arrays()
+    mesh.set_nodal_arrays(
+        coordinates=pos[0],
+        quaternions=_add_rotations(_quaternion.as_float_array(rot[0]), quaternions),
+    )
@@ -22,6 +22,7 @@
 """This module defines the classes that are used to create an input file for
 4C."""
 
+import json as _json
 import os as _os
 import sys as _sys
 from datetime import datetime as _datetime
@@ -30,6 +31,7 @@ from typing import Dict as _Dict
 from typing import List as _List
 
 from fourcipp.fourc_input import FourCInput as _FourCInput
+from fourcipp.legacy_io import inline_legacy_section as _inline_legacy_section
 
 from beamme.core.boundary_condition import BoundaryCondition as _BoundaryCondition
 from beamme.core.conf import mpy as _mpy
@@ -109,6 +111,40 @@ def _dump_coupling(coupling):
     return {"E": coupling.geometry_set.i_global, **data}
 
 
+def _dump_mesh_items_to_list(data_list) -> _List:
+    """Return a list with the input file representation of the given items.
+
+    Either the default dump or the specialized dump_to_list is applied
+    to each list item.
+    """
+
+    list = []
+
+    for item in data_list:
+        if (
+            isinstance(item, _GeometrySet)
+            or isinstance(item, _GeometrySetNodes)
+            or isinstance(item, _NURBSPatch)
+        ):
+            list.extend(item.dump_to_list())
+        elif hasattr(item, "dump_to_list"):
+            list.append(item.dump_to_list())
+        elif isinstance(item, _BoundaryCondition):
+            list.append(
+                {
+                    "E": item.geometry_set.i_global,
+                    **item.data,
+                }
+            )
+
+        elif isinstance(item, _Coupling):
+            list.append(_dump_coupling(item))
+        else:
+            raise TypeError(f"Could not dump {item}")
+
+    return list
+
+
 class InputFile(_FourCInput):
     """An item that represents a complete 4C input file."""
 
@@ -120,6 +156,18 @@ class InputFile(_FourCInput):
         # Contents of NOX xml file.
         self.nox_xml_contents = ""
 
+        # Mesh items of the large mesh sections (nodes and elements) that are
+        # only converted and written to the input file in dump. For each
+        # streamed mesh, the items and the global indices of the materials at
+        # the time the mesh was added are stored.
+        self._streamed_mesh_sections: _Dict[str, _List] = {
+            "NODE COORDS": [],
+            "STRUCTURE ELEMENTS": [],
+        }
+        self._n_streamed_entries: _Dict[str, int] = {
+            section_name: 0 for section_name in self._streamed_mesh_sections
+        }
+
         # Register converters to directly convert non-primitive types
         # to native Python types via the FourCIPP type converter.
         self.type_converter.register_numpy_types()
@@ -197,6 +245,17 @@ class InputFile(_FourCInput):
         if add_header_information:
             self.add({"TITLE": self._get_header()})
 
+        if self._has_streamed_mesh_sections():
+            self._dump_streamed(
+                input_file_path,
+                add_header_default=add_header_default,
+                add_footer_application_script=add_footer_application_script,
+                sort_sections=sort_sections,
+                validate=validate,
+                validate_sections_only=validate_sections_only,
+            )
+            return
+
         super().dump(
             input_file_path=input_file_path,
             sort_sections=sort_sections,
@@ -221,11 +280,131 @@ class InputFile(_FourCInput):
                 with open(input_file_path, "w") as input_file:
                     input_file.writelines(lines)
 
-    def add_mesh_to_input_file(self, mesh: _Mesh):
+    def _has_streamed_mesh_sections(self) -> bool:
+        """Return if mesh items are stored for a streamed dump."""
+        return any(
+            len(item_lists) > 0 for item_lists in self._streamed_mesh_sections.values()
+        )
+
+    def _dump_streamed(
+        self,
+        input_file_path: _Path,
+        *,
+        add_header_default: bool,
+        add_footer_application_script: bool,
+        **kwargs,
+    ):
+        """Write the input file to disk and stream the large mesh sections
+        directly to the file.
+
+        All other sections are written (and validated) with FourCIPP.
+        The streamed sections are converted and written in chunks of
+        mpy.input_file_stream_chunk_size items, so the input file
+        representation of all nodes and elements never has to be kept in
+        memory at once.
+
+        Args:
+            input_file_path: Path to the input file that should be created.
+            add_header_default: See dump.
+            add_footer_application_script: See dump.
+            **kwargs: Passed to FourCInput.dump.
+        """
+
+        # Entries of the streamed sections that are already in the input
+        # file (e.g. from an imported input file) are written before the
+        # streamed mesh items.
+        existing_entries = {
+            section_name: self.pop(section_name)
+            for section_name in self._streamed_mesh_sections
+            if section_name in self.sections
+        }
+
+        try:
+            super().dump(
+                input_file_path=input_file_path,
+                convert_to_native_types=False,
+                **kwargs,
+            )
+        finally:
+            for section_name, entries in existing_entries.items():
+                self.add({section_name: entries})
+
+        # The sections written by FourCIPP are small, so they can be read
+        # into memory.
+        with open(input_file_path, "r") as input_file:
+            small_sections = input_file.read()
+
+        with open(input_file_path, "w") as input_file:
+            if add_header_default:
+                input_file.writelines(
+                    "# " + line + "\n" for line in _mpy.input_file_header
+                )
+            input_file.write(small_sections)
+
+            for section_name, item_lists in self._streamed_mesh_sections.items():
+                if len(item_lists) == 0 and section_name not in existing_entries:
+                    continue
+
+                input_file.write(f"{section_name}:\n")
+                self._write_legacy_section_lines(
+                    input_file, section_name, existing_entries.get(section_name, [])
+                )
+                chunk_size = _mpy.input_file_stream_chunk_size
+                for items, material_indices in item_lists:
+                    # Materials can be shared between meshes, so their global
+                    # index might have changed since the mesh was added.
+                    current_material_indices = {
+                        material: material.i_global for material in material_indices
+                    }
+                    for material, i_global in material_indices.items():
+                        material.i_global = i_global
+
+                    for i_start in range(0, len(items), chunk_size):
+                        self._write_legacy_section_lines(
+                            input_file,
+                            section_name,
+                            self.type_converter(
+                                _dump_mesh_items_to_list(
+                                    items[i_start : i_start + chunk_size]
+                                )
+                            ),
+                        )
+
+                    for material, i_global in current_material_indices.items():
+                        material.i_global = i_global
+
+            if add_footer_application_script:
+                application_path = _Path(_sys.argv[0]).resolve()
+                input_file.writelines(self._get_application_script(application_path))
+
+    def _write_legacy_section_lines(self, input_file, section_name, entries):
+        """Write the entries of a legacy section (e.g. NODE COORDS) as YAML
+        list items in the inline dat style to the given file.
+
+        Args:
+            input_file: Opened file the lines are written to.
+            section_name: Name of the legacy section.
+            entries: List with the entries of the section in dict form.
+        """
+        for line in _inline_legacy_section(
+            section_name, entries, self.legacy_sections_names
+        ):
+            input_file.write(f"  - {_json.dumps(line)}\n")
+
+    def add_mesh_to_input_file(self, mesh: _Mesh, *, stream_mesh_sections=False):
         """Add a mesh to the input file.
 
         Args:
             mesh: The mesh to be added to the input file.
+            stream_mesh_sections: If this is true, the nodes and elements of
+                the mesh are not converted to their input file representation
+                here. They are converted and written to the file in chunks
+                when the input file is dumped, which considerably reduces the
+                memory requirements for large meshes. The streamed sections
+                are not validated with FourCIPP and the mesh must not be
+                modified until the input file is dumped. Once a mesh has been
+                streamed to an input file, the nodes and elements of all
+                further meshes are also streamed.
         """
 
         # Perform some checks on the mesh.
@@ -253,14 +432,20 @@ class InputFile(_FourCInput):
         def _get_global_start_node():
             """Get the index for the first "real" BeamMe node."""
 
-            return len(self.sections.get("NODE COORDS", []))
+            return (
+                len(self.sections.get("NODE COORDS", []))
+                + self._n_streamed_entries["NODE COORDS"]
+            )
 
         def _get_global_start_element():
             """Get the index for the first "real" BeamMe element."""
 
-            return sum(
-                len(self.sections.get(section, []))
-                for section in ["FLUID ELEMENTS", "STRUCTURE ELEMENTS"]
+            return (
+                sum(
+                    len(self.sections.get(section, []))
+                    for section in ["FLUID ELEMENTS", "STRUCTURE ELEMENTS"]
+                )
+                + self._n_streamed_entries["STRUCTURE ELEMENTS"]
             )
 
         def _get_global_start_material():
@@ -324,6 +509,9 @@ class InputFile(_FourCInput):
                 else:
                     i += 1
 
+            # Return the number of element entries in the input file.
+            return i - start_index
+
         def _dump_mesh_items(section_name, data_list):
             """Output a section name and apply either the default dump or the
             specialized the dump_to_list for each list item."""
@@ -332,29 +520,7 @@ class InputFile(_FourCInput):
             if len(data_list) == 0:
                 return
 
-            list = []
-
-            for item in data_list:
-                if (
-                    isinstance(item, _GeometrySet)
-                    or isinstance(item, _GeometrySetNodes)
-                    or isinstance(item, _NURBSPatch)
-                ):
-                    list.extend(item.dump_to_list())
-                elif hasattr(item, "dump_to_list"):
-                    list.append(item.dump_to_list())
-                elif isinstance(item, _BoundaryCondition):
-                    list.append(
-                        {
-                            "E": item.geometry_set.i_global,
-                            **item.data,
-                        }
-                    )
-
-                elif isinstance(item, _Coupling):
-                    list.append(_dump_coupling(item))
-                else:
-                    raise TypeError(f"Could not dump {item}")
+            list = _dump_mesh_items_to_list(data_list)
 
             # If section already exists, retrieve from input file and
             # add newly. We always need to go through fourcipp to convert
@@ -378,7 +544,9 @@ class InputFile(_FourCInput):
         _set_i_global(mesh.nodes, start_index=start_index_nodes)
 
         start_index_elements = _get_global_start_element()
-        _set_i_global_elements(mesh.elements, start_index=start_index_elements)
+        n_element_entries = _set_i_global_elements(
+            mesh.elements, start_index=start_index_elements
+        )
 
         start_index_materials = _get_global_start_material()
         _set_i_global(mesh.materials, start_index=start_index_materials)
@@ -430,8 +598,25 @@ class InputFile(_FourCInput):
                 _dump_mesh_items(_INPUT_FILE_MAPPINGS["geometry_sets"][geom_key], item)
 
         # Add the nodes and elements.
-        _dump_mesh_items("NODE COORDS", mesh.nodes)
-        _dump_mesh_items("STRUCTURE ELEMENTS", mesh.elements)
+        if stream_mesh_sections or self._has_streamed_mesh_sections():
+            for section_name, items, n_entries in [
+                ("NODE COORDS", mesh.nodes, len(mesh.nodes)),
+                ("STRUCTURE ELEMENTS", mesh.elements, n_element_entries),
+            ]:
+                if len(items) > 0:
+                    self._streamed_mesh_sections[section_name].append(
+                        (
+                            list(items),
+                            {
+                                material: material.i_global
+                                for material in mesh.materials
+                            },
+                        )
+                    )
+                    self._n_streamed_entries[section_name] += n_entries
+        else:
+            _dump_mesh_items("NODE COORDS", mesh.nodes)
+            _dump_mesh_items("STRUCTURE ELEMENTS", mesh.elements)
         # TODO: reset all links and counters set in this method.
 
     def _get_header(self) -> dict:
@@ -24,9 +24,16 @@
 from pathlib import Path as _Path
 from typing import Dict as _Dict
 from typing import List as _List
+from typing import Optional as _Optional
 from typing import Tuple as _Tuple
 from typing import Union as _Union
 
+import numpy as _np
+from fourcipp.legacy_io import read_element as _read_element
+from fourcipp.legacy_io import read_node as _read_node
+from fourcipp.legacy_io import read_node_topology as _read_node_topology
+from fourcipp.utils.yaml_io import load_yaml as _load_yaml
+
 import beamme.core.conf as _conf
 from beamme.core.boundary_condition import BoundaryCondition as _BoundaryCondition
 from beamme.core.boundary_condition import (
@@ -112,6 +119,67 @@ def import_four_c_model(
         return input_file, _Mesh()
 
 
+def import_four_c_model_data(
+    input_file_path: _Path,
+) -> _Tuple[_InputFile, "ImportedMeshData"]:
+    """Import an existing 4C input file and parse the mesh sections directly
+    into NumPy arrays.
+
+    This is considerably faster than import_four_c_model with
+    convert_input_to_mesh=True for large meshes. The nodes, elements and
+    node sets are only created as BeamMe objects when
+    ImportedMeshData.mesh is accessed.
+
+    Args:
+        input_file_path: A file path to an existing 4C input file that will be
+            imported.
+
+    Returns:
+        A tuple with the input file and the imported mesh data. The sections
+        that are contained in the mesh data are removed from the input file
+        object.
+    """
+
+    sections = _load_yaml(input_file_path)
+    mesh_sections = {
+        section_name: sections.pop(section_name)
+        for section_name in list(sections.keys())
+        if section_name in ["NODE COORDS", "STRUCTURE ELEMENTS"]
+        or section_name.endswith("TOPOLOGY")
+        or section_name in _INPUT_FILE_MAPPINGS["boundary_conditions"].values()
+    }
+    return _InputFile(sections=sections), ImportedMeshData(mesh_sections)
+
+
+# Solid elements that can be created from a 4C input file.
+# TODO reuse element_type_to_four_c_string from beamme.core.element_volume
+_ELEMENT_TYPE_FROM_CELL_TYPE = {
+    "HEX8": _VolumeHEX8,
+    "HEX20": _VolumeHEX20,
+    "HEX27": _VolumeHEX27,
+    "TET4": _VolumeTET4,
+    "TET10": _VolumeTET10,
+    "WEDGE6": _VolumeWEDGE6,
+    "POINT1": _SolidRigidSphere,
+}
+
+
+def _get_element_type(element: dict):
+    """Return the solid element class for a dictionary from a 4C input file.
+
+    Args:
+        element: A dictionary with the element data.
+    Returns:
+        The solid element class.
+    """
+
+    if element["cell"]["type"] not in _ELEMENT_TYPE_FROM_CELL_TYPE:
+        raise TypeError(
+            f"Could not create a BeamMe element for {element['data']['type']} {element['cell']['type']}!"
+        )
+    return _ELEMENT_TYPE_FROM_CELL_TYPE[element["cell"]["type"]]
+
+
 def _element_from_dict(nodes: _List[_Node], element: dict):
     """Create a solid element from a dictionary from a 4C input file.
 
@@ -121,25 +189,234 @@ def _element_from_dict(nodes: _List[_Node], element: dict):
     Returns:
         A solid element object.
     """
+    return _get_element_type(element)(nodes=nodes, data=element["data"])
 
-    # Depending on the number of nodes chose which solid element to return.
-    # TODO reuse element_type_to_four_c_string from beamme.core.element_volume
-    element_type = {
-        "HEX8": _VolumeHEX8,
-        "HEX20": _VolumeHEX20,
-        "HEX27": _VolumeHEX27,
-        "TET4": _VolumeTET4,
-        "TET10": _VolumeTET10,
-        "WEDGE6": _VolumeWEDGE6,
-        "POINT1": _SolidRigidSphere,
-    }
 
-    if element["cell"]["type"] not in element_type:
-        raise TypeError(
-            f"Could not create a BeamMe element for {element['data']['type']} {element['cell']['type']}!"
+def _split_lines(lines: _List[str], n_tokens: int) -> _Optional[_np.ndarray]:
+    """Split lines with the same number of tokens into a 2D array of strings.
+
+    Args:
+        lines: List with the lines.
+        n_tokens: Expected number of tokens in each line.
+    Returns:
+        Array with the tokens of each line or None if the total number of
+        tokens does not match.
+    """
+    tokens = " ".join(lines).split()
+    if len(tokens) != n_tokens * len(lines):
+        return None
+    return _np.array(tokens).reshape(len(lines), n_tokens)
+
+
+def _parse_node_coordinates(section: _List) -> _np.ndarray:
+    """Return the coordinates of the nodes in a NODE COORDS section.
+
+    Args:
+        section: The raw entries of the section.
+    Returns:
+        Array with the nodal coordinates.
+    """
+
+    if all(isinstance(line, str) for line in section):
+        tokens = _split_lines(section, 6)
+        if (
+            tokens is not None
+            and _np.all(tokens[:, 0] == "NODE")
+            and _np.all(tokens[:, 2] == "COORD")
+        ):
+            return tokens[:, 3:].astype(float)
+
+    # Fall back to the per node parsing, e.g., for other node types.
+    nodes = [_read_node(line) if isinstance(line, str) else line for line in section]
+    return _np.array([node["COORD"] for node in nodes], dtype=float).reshape(-1, 3)
+
+
+def _parse_elements(section: _List) -> _List[_Tuple]:
+    """Group the elements in a STRUCTURE ELEMENTS section by their type and
+    data.
+
+    Args:
+        section: The raw entries of the section.
+    Returns:
+        A list with a tuple for each group of elements with the same type and
+        data. Each tuple contains the element class, the element data, the
+        connectivity of the elements (zero-based node indices) and the
+        positions of the elements in the section.
+    """
+
+    # Number of nodes and element class for each element and cell type.
+    element_types: _Dict[_Tuple[str, str], _Tuple] = {}
+
+    groups: _Dict[_Tuple, _Tuple[_List, _List]] = {}
+    for i_element, line in enumerate(section):
+        if isinstance(line, str):
+            tokens = line.split()
+            type_key = (tokens[1], tokens[2])
+            if type_key not in element_types:
+                element = _read_element(line)
+                element_types[type_key] = (
+                    len(element["cell"]["connectivity"]),
+                    _get_element_type(element),
+                )
+            n_nodes, element_type = element_types[type_key]
+            connectivity = tokens[3 : 3 + n_nodes]
+            group_key = (element_type, *type_key, *tokens[3 + n_nodes :])
+        else:
+            # This element is already given in dict form.
+            element_type = _get_element_type(line)
+            connectivity = line["cell"]["connectivity"]
+            group_key = (element_type, repr(line["data"]))
+
+        if group_key not in groups:
+            groups[group_key] = (line, [], [])
+        groups[group_key][1].append(connectivity)
+        groups[group_key][2].append(i_element)
+
+    element_groups = []
+    for (element_type, *_), (line, connectivity, indices) in groups.items():
+        element = _read_element(line) if isinstance(line, str) else line
+        element_groups.append(
+            (
+                element_type,
+                element["data"],
+                _np.array(connectivity, dtype=int) - 1,
+                _np.array(indices, dtype=int),
+            )
+        )
+    return element_groups
+
+
+def _parse_node_topology(section: _List) -> _Dict[int, _np.ndarray]:
+    """Return the node indices of each geometry set in a *-NODE TOPOLOGY
+    section.
+
+    Args:
+        section: The raw entries of the section.
+    Returns:
+        A dictionary with the geometry set IDs as keys and the zero-based node
+        indices as values. The order of the sets and nodes is the same as in
+        the section.
+    """
+
+    tokens = None
+    if all(isinstance(line, str) for line in section):
+        tokens = _split_lines(section, 4)
+    if (
+        tokens is not None
+        and _np.all(tokens[:, 0] == "NODE")
+        and _np.all(_np.char.startswith(tokens[:, 2], "D"))
+    ):
+        node_ids = tokens[:, 1].astype(int)
+        set_ids = tokens[:, 3].astype(int)
+    else:
+        # Fall back to the per entry parsing.
+        entries = [
+            _read_node_topology(line) if isinstance(line, str) else line
+            for line in section
+        ]
+        node_ids = _np.array([entry["node_id"] for entry in entries], dtype=int)
+        set_ids = _np.array([entry["d_id"] for entry in entries], dtype=int)
+
+    # Group the nodes by their set IDs, keep the order of the first
+    # appearance of each set.
+    unique_set_ids, first_index = _np.unique(set_ids, return_index=True)
+    sort_index = _np.argsort(set_ids, kind="stable")
+    split_index = _np.searchsorted(set_ids[sort_index], unique_set_ids[1:])
+    node_indices = _np.split(node_ids[sort_index] - 1, split_index)
+    return {int(unique_set_ids[i]): node_indices[i] for i in _np.argsort(first_index)}
+
+
+class ImportedMeshData:
+    """The mesh of a 4C input file, stored in NumPy arrays.
+
+    The BeamMe objects (nodes, elements, geometry sets and boundary
+    conditions) are only created when the mesh attribute is accessed for
+    the first time.
+    """
+
+    def __init__(self, mesh_sections: _Dict[str, _List]):
+        """Parse the mesh sections of a 4C input file.
+
+        Args:
+            mesh_sections: Dictionary with the raw (unparsed) entries of the
+                NODE COORDS, STRUCTURE ELEMENTS, *-TOPOLOGY and boundary
+                condition sections.
+        """
+
+        # Nodal coordinates.
+        self.node_coordinates = _parse_node_coordinates(
+            mesh_sections.get("NODE COORDS", [])
         )
 
-    return element_type[element["cell"]["type"]](nodes=nodes, data=element["data"])
+        # Groups of elements with the same type and data, see _parse_elements.
+        self.element_groups = _parse_elements(
+            mesh_sections.get("STRUCTURE ELEMENTS", [])
+        )
+
+        # Node indices of the geometry sets for each geometry type.
+        self.geometry_sets: _Dict[_conf.Geometry, _Dict[int, _np.ndarray]] = {}
+        for section_name, section in mesh_sections.items():
+            if section_name.endswith("TOPOLOGY") and len(section) > 0:
+                self.geometry_sets[_get_geometry_key(section_name)] = (
+                    _parse_node_topology(section)
+                )
+
+        # The boundary conditions are only converted when the mesh is created.
+        self._boundary_condition_sections = {
+            section_name: section
+            for section_name, section in mesh_sections.items()
+            if section_name in _INPUT_FILE_MAPPINGS["boundary_conditions"].values()
+        }
+
+        self._mesh: _Optional[_Mesh] = None
+
+    @property
+    def n_elements(self) -> int:
+        """Return the number of elements."""
+        return sum(len(indices) for _, _, _, indices in self.element_groups)
+
+    @property
+    def mesh(self) -> _Mesh:
+        """Return the mesh with the BeamMe objects.
+
+        The mesh is created when this is called for the first time.
+        """
+        if self._mesh is None:
+            self._mesh = self._create_mesh()
+        return self._mesh
+
+    def _create_mesh(self) -> _Mesh:
+        """Create the BeamMe objects from the mesh data."""
+
+        mesh = _Mesh()
+        mesh.nodes = [_Node(coordinates) for coordinates in self.node_coordinates]
+
+        elements = [None] * self.n_elements
+        for element_type, data, connectivity, indices in self.element_groups:
+            for element_connectivity, i_element in zip(connectivity, indices):
+                elements[i_element] = element_type(
+                    nodes=[mesh.nodes[i_node] for i_node in element_connectivity],
+                    data=dict(data),
+                )
+        mesh.elements = elements
+
+        geometry_sets_in_sections: dict[int, dict[int, _GeometrySetNodes]] = {
+            key: {} for key in _mpy.geo
+        }
+        for geometry_key, geometry_set_dict in self.geometry_sets.items():
+            geometry_sets_in_sections[geometry_key] = {
+                geometry_set_id: _GeometrySetNodes(
+                    geometry_key, nodes=[mesh.nodes[i_node] for i_node in node_indices]
+                )
+                for geometry_set_id, node_indices in geometry_set_dict.items()
+            }
+            mesh.geometry_sets[geometry_key] = list(
+                geometry_sets_in_sections[geometry_key].values()
+            )
+
+        input_file = _InputFile(sections=self._boundary_condition_sections)
+        _add_boundary_conditions(mesh, input_file, geometry_sets_in_sections)
+        return mesh
 
 
 def _boundary_condition_from_dict(
@@ -182,6 +459,39 @@ def _get_yaml_geometry_sets(
     return geometry_sets_in_this_section
 
 
+def _get_geometry_key(section_name: str) -> _conf.Geometry:
+    """Return the geometry key for a *-TOPOLOGY section."""
+    for key, value in _INPUT_FILE_MAPPINGS["geometry_sets"].items():
+        if value == section_name:
+            return key
+    raise ValueError(f"Could not find the set {section_name}")
+
+
+def _add_boundary_conditions(
+    mesh: _Mesh,
+    input_file: _InputFile,
+    geometry_sets_in_sections: _Dict[_conf.Geometry, _Dict[int, _GeometrySetNodes]],
+) -> None:
+    """Convert the boundary condition sections of an input file to BeamMe
+    boundary conditions and add them to the mesh.
+
+    The converted sections are removed from the input file.
+    """
+    for (
+        bc_key,
+        geometry_key,
+    ), section_name in _INPUT_FILE_MAPPINGS["boundary_conditions"].items():
+        if section_name not in input_file:
+            continue
+        for item in input_file.pop(section_name):
+            geometry_set_id = item["E"]
+            geometry_set = geometry_sets_in_sections[geometry_key][geometry_set_id]
+            mesh.boundary_conditions.append(
+                (bc_key, geometry_key),
+                _boundary_condition_from_dict(geometry_set, bc_key, item),
+            )
+
+
 def _extract_mesh_sections(input_file: _InputFile) -> _Tuple[_InputFile, _Mesh]:
     """Convert an existing input file to a BeamMe mesh with mesh items, e.g.,
     nodes, elements, element sets, node sets, boundary conditions, materials.
@@ -231,13 +541,7 @@ def _extract_mesh_sections(input_file: _InputFile) -> _Tuple[_InputFile, _Mesh]:
         if section_name.endswith("TOPOLOGY"):
             section_items = _get_section_items(section_name)
             if len(section_items) > 0:
-                # Get the geometry key for this set
-                for key, value in _INPUT_FILE_MAPPINGS["geometry_sets"].items():
-                    if value == section_name:
-                        geometry_key = key
-                        break
-                else:
-                    raise ValueError(f"Could not find the set {section_name}")
+                geometry_key = _get_geometry_key(section_name)
                 geometry_sets_in_section = _get_yaml_geometry_sets(
                     mesh.nodes, geometry_key, section_items
                 )
@@ -247,16 +551,6 @@ def _extract_mesh_sections(input_file: _InputFile) -> _Tuple[_InputFile, _Mesh]:
                 )
 
     # Add boundary conditions
-    for (
-        bc_key,
-        geometry_key,
-    ), section_name in _INPUT_FILE_MAPPINGS["boundary_conditions"].items():
-        for item in _get_section_items(section_name):
-            geometry_set_id = item["E"]
-            geometry_set = geometry_sets_in_sections[geometry_key][geometry_set_id]
-            mesh.boundary_conditions.append(
-                (bc_key, geometry_key),
-                _boundary_condition_from_dict(geometry_set, bc_key, item),
-            )
+    _add_boundary_conditions(mesh, input_file, geometry_sets_in_sections)
 
     return input_file, mesh
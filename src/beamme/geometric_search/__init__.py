@@ -46,6 +46,10 @@ search algorithm are available (depending on your installation/setup):
 The `find_close_points` function automatically chooses the fastest
 (available) implementation for the given point array.
 
+The `SpatialIndex` class in `spatial_index` can be used if multiple queries,
+e.g., radius or k-nearest neighbour queries, are performed on the same point
+cloud.
+
 Consult the `README.md` regarding install and testing options for
 different implementations.
 """
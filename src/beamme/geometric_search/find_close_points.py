@@ -25,6 +25,8 @@ tolerance of each other will be considered as unique."""
 from enum import Enum as _Enum
 from enum import auto as _auto
 
+import numpy as _np
+
 from beamme.geometric_search.scipy import (
     find_close_points_scipy as _find_close_points_scipy,
 )
@@ -56,60 +58,93 @@ def point_partners_to_unique_indices(point_partners):
 
     Returns
     ----
-    unique_indices: list(int)
+    unique_indices: _np.array(int)
         Indices that result in the unique point coordinate array.
-    inverse_indices: list(int)
+    inverse_indices: _np.array(int)
         Indices of the unique array that can be used to reconstruct of the original points coordinates.
     """
 
-    unique_indices = []
-    inverse_indices = [-1 for i in range(len(point_partners))]
-    partner_id_to_unique_map = {}
-    i_partner = 0
-    for i_point, partner_index in enumerate(point_partners):
-        if partner_index == -1:
-            # This point does not have any partners, i.e., it is already a unique point.
-            unique_indices.append(i_point)
-            my_inverse_index = len(unique_indices) - 1
-        elif partner_index == i_partner:
-            # This point has partners and this is the first time that this partner index
-            # appears in the input list.
-            unique_indices.append(i_point)
-            my_inverse_index = len(unique_indices) - 1
-            partner_id_to_unique_map[partner_index] = my_inverse_index
-            i_partner += 1
-        elif partner_index < i_partner:
-            # This point has partners and the partner index has been previously found.
-            my_inverse_index = partner_id_to_unique_map[partner_index]
-        else:
-            raise ValueError(
-                "This should not happen, as the partners should be provided in order"
-            )
-        inverse_indices[i_point] = my_inverse_index
+    point_partners = _np.asarray(point_partners, dtype=int)
+    n_points = len(point_partners)
+
+    # The first point with a certain partner index is the unique point for all
+    # points with this partner index.
+    has_partner = point_partners != -1
+    partner_points = _np.flatnonzero(has_partner)
+    partners, first_index = _np.unique(
+        point_partners[partner_points], return_index=True
+    )
+    first_points = partner_points[first_index]
+    if not _np.array_equal(
+        partners[_np.argsort(first_points)], _np.arange(len(partners))
+    ):
+        raise ValueError(
+            "This should not happen, as the partners should be provided in order"
+        )
+
+    is_unique = ~has_partner
+    is_unique[first_points] = True
+    unique_indices = _np.flatnonzero(is_unique)
+
+    # Index of the representing unique point for each point.
+    representing_points = _np.arange(n_points)
+    representing_points[partner_points] = first_points[point_partners[partner_points]]
+    inverse_indices = (_np.cumsum(is_unique) - 1)[representing_points]
 
     return unique_indices, inverse_indices
 
 
 def point_partners_to_partner_indices(point_partners, n_partners):
-    """Convert the partner indices for each point to a list of lists with the
+    """Convert the partner indices for each point to a list of arrays with the
     indices for all partners."""
-    partner_indices = [[] for i in range(n_partners)]
-    for i, partner_index in enumerate(point_partners):
-        if partner_index != -1:
-            partner_indices[partner_index].append(i)
-    return partner_indices
+    if n_partners == 0:
+        return []
+    point_partners = _np.asarray(point_partners, dtype=int)
+    partner_points = _np.flatnonzero(point_partners != -1)
+    partner_points = partner_points[
+        _np.argsort(point_partners[partner_points], kind="stable")
+    ]
+    n_points_per_partner = _np.bincount(
+        point_partners[partner_points], minlength=n_partners
+    )
+    return _np.split(partner_points, _np.cumsum(n_points_per_partner)[:-1])
 
 
 def partner_indices_to_point_partners(partner_indices, n_points):
-    """Convert the list of lists with the indices for all partners to the
+    """Convert the list of arrays with the indices for all partners to the
     partner indices for each point."""
-    point_partners = [-1 for _i in range(n_points)]
-    for i_partner, partners in enumerate(partner_indices):
-        for index in partners:
-            point_partners[index] = i_partner
+    point_partners = _np.full(n_points, -1, dtype=int)
+    if len(partner_indices) > 0:
+        point_partners[_np.concatenate(partner_indices).astype(int)] = _np.repeat(
+            _np.arange(len(partner_indices)),
+            [len(partners) for partners in partner_indices],
+        )
     return point_partners, len(partner_indices)
 
 
+def get_default_algorithm(n_points: int) -> FindClosePointAlgorithm:
+    """Return the fastest available find_close_point algorithm for the given
+    number of points.
+
+    Args:
+        n_points: Number of points in the point cloud.
+
+    Returns:
+        The algorithm that should be used.
+    """
+
+    if n_points < 200 and _cython_is_available():
+        # For around 200 points the brute force cython algorithm is the fastest one
+        return FindClosePointAlgorithm.brute_force_cython
+    elif _arborx_is_available():
+        # For general problems with n_points > 200 the ArborX implementation is the fastest one
+        return FindClosePointAlgorithm.boundary_volume_hierarchy_arborx
+    else:
+        # The scipy implementation is slower than ArborX by a factor of about 2, but is scales
+        # the same
+        return FindClosePointAlgorithm.kd_tree_scipy
+
+
 def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
     """Find unique points in a point cloud, i.e., points that are within a
     certain tolerance of each other will be considered as unique.
@@ -137,20 +172,8 @@ def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
         Largest partner index.
     """
 
-    n_points = len(point_coordinates)
-
     if algorithm is None:
-        # Decide which algorithm to use
-        if n_points < 200 and _cython_is_available():
-            # For around 200 points the brute force cython algorithm is the fastest one
-            algorithm = FindClosePointAlgorithm.brute_force_cython
-        elif _arborx_is_available():
-            # For general problems with n_points > 200 the ArborX implementation is the fastest one
-            algorithm = FindClosePointAlgorithm.boundary_volume_hierarchy_arborx
-        else:
-            # The scipy implementation is slower than ArborX by a factor of about 2, but is scales
-            # the same
-            algorithm = FindClosePointAlgorithm.kd_tree_scipy
+        algorithm = get_default_algorithm(len(point_coordinates))
 
     # Get list of closest pairs
     if algorithm is FindClosePointAlgorithm.kd_tree_scipy:
@@ -22,37 +22,42 @@
 """This file defines the interface to the Scipy spatial geometric search
 functionality."""
 
+import numpy as _np
+from scipy.sparse import coo_array as _coo_array
+from scipy.sparse.csgraph import connected_components as _connected_components
 from scipy.spatial import KDTree as _KDTree
 
 
 def pairs_to_partner_list(pairs, n_points):
-    """Convert the pairs to a partner list."""
-
-    # Sort the pairs by the first column
-    pairs = pairs[pairs[:, 0].argsort()]
-
-    n_partners = 0
-    partner_index_list = [-1 for i in range(n_points)]
-    for pair in pairs:
-        pair_partners = [partner_index_list[pair[i]] for i in range(2)]
-        if pair_partners[0] == -1 and pair_partners[1] == -1:
-            # We have a new partner index
-            for i in range(2):
-                partner_index_list[pair[i]] = n_partners
-            n_partners += 1
-        elif pair_partners[0] == -1:
-            partner_index_list[pair[0]] = pair_partners[1]
-        elif pair_partners[1] == -1:
-            partner_index_list[pair[1]] = pair_partners[0]
-        else:
-            # Both points already have a partner index. Since we order
-            # the pairs this one has to be equal to each other or we
-            # have multiple clusters.
-            if not pair_partners[0] == pair_partners[1]:
-                raise ValueError(
-                    "Two points are connected to different partner indices."
-                )
-    return partner_index_list, n_partners
+    """Convert the pairs to a partner list.
+
+    Pairs that are transitively connected are merged into a single cluster.
+    The partner indices are numbered in the order of the first point of
+    each cluster.
+    """
+
+    partner_index_list = _np.full(n_points, -1, dtype=int)
+    if len(pairs) == 0:
+        return partner_index_list, 0
+
+    # Get the clusters as connected components of the graph defined by the
+    # pairs.
+    graph = _coo_array(
+        (_np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+        shape=(n_points, n_points),
+    )
+    _, labels = _connected_components(graph, directed=False)
+
+    # Renumber the clusters in the order of their first point.
+    has_partner = _np.zeros(n_points, dtype=bool)
+    has_partner[pairs.ravel()] = True
+    _, first_index, inverse = _np.unique(
+        labels[has_partner], return_index=True, return_inverse=True
+    )
+    cluster_order = _np.empty_like(first_index)
+    cluster_order[_np.argsort(first_index)] = _np.arange(len(first_index))
+    partner_index_list[has_partner] = cluster_order[inverse]
+    return partner_index_list, len(first_index)
 
 
 def find_close_points_scipy(point_coordinates, tol):
@@ -0,0 +1,392 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""A persistent spatial index over a point cloud, that can be queried
+multiple times."""
+
+from typing import List as _List
+from typing import Optional as _Optional
+from typing import Tuple as _Tuple
+
+import numpy as _np
+from scipy.spatial import KDTree as _KDTree
+
+from beamme.geometric_search.find_close_points import (
+    FindClosePointAlgorithm as _FindClosePointAlgorithm,
+)
+from beamme.geometric_search.find_close_points import (
+    find_close_points as _find_close_points,
+)
+from beamme.geometric_search.find_close_points import (
+    get_default_algorithm as _get_default_algorithm,
+)
+
+
+class SpatialIndex:
+    """A spatial index over a point cloud.
+
+    The index is built once and can then be queried multiple times. Points
+    can be inserted and removed, each point is identified by the integer ID
+    returned from insert. The IDs of removed points are not reused.
+
+    The search backend is chosen with the same FindClosePointAlgorithm as in
+    find_close_points. The Cython and ArborX bindings only provide the search
+    for close points within the index (find_close_points). For the radius and
+    k-nearest neighbour queries, the brute_force_cython algorithm uses a
+    vectorized NumPy brute force search and the other algorithms use a scipy
+    KD-tree.
+
+    The KD-tree is not rebuilt after each insert or remove. Points inserted
+    after the tree was built are stored in a second, smaller KD-tree, removed
+    points are filtered from the results. The main tree is rebuilt once the
+    number of changes exceeds rebuild_fraction times the number of points in
+    the tree.
+    """
+
+    # Maximum number of entries in the distance arrays of the brute force
+    # search. The query points are processed in chunks to stay below this
+    # number.
+    max_brute_force_entries = 2**22
+
+    def __init__(
+        self,
+        point_coordinates: _Optional[_np.ndarray] = None,
+        *,
+        algorithm: _Optional[_FindClosePointAlgorithm] = None,
+        n_dim: int = 3,
+        rebuild_fraction: float = 0.25,
+    ):
+        """Initialize the spatial index.
+
+        Args:
+            point_coordinates: Coordinates (n_points x n_dim) of the initial
+                points in the index. They get the IDs 0 to n_points-1.
+            algorithm: Type of geometric search algorithm that should be used.
+                If this is None, the algorithm is chosen based on the number
+                of points at each query.
+            n_dim: Number of spatial dimensions, only used if no initial
+                points are given.
+            rebuild_fraction: Relative number of inserted or removed points
+                after which the KD-tree is rebuilt.
+        """
+
+        if point_coordinates is not None:
+            n_dim = _np.shape(point_coordinates)[1]
+
+        self.algorithm = algorithm
+        self.rebuild_fraction = rebuild_fraction
+
+        # The coordinates and the active flags of all IDs are stored in
+        # buffers with additional capacity, so points can be inserted without
+        # copying the existing points. _coordinates and _active are views into
+        # the used part of the buffers.
+        self._coordinates_buffer = _np.zeros((0, n_dim))
+        self._active_buffer = _np.zeros(0, dtype=bool)
+        self._n_ids = 0
+        self._set_buffer_views()
+        self._n_active = 0
+
+        # The KD-tree, the IDs of the points in the tree, the number of IDs at
+        # the time the tree was built and the number of points removed from
+        # the tree since then.
+        self._tree: _Optional[_KDTree] = None
+        self._tree_ids = _np.zeros(0, dtype=int)
+        self._n_tree_built = 0
+        self._n_tree_removed = 0
+
+        # The KD-tree for the points inserted after the main tree was built
+        # and the IDs of the points in this tree.
+        self._pending_tree: _Optional[_KDTree] = None
+        self._pending_tree_ids = _np.zeros(0, dtype=int)
+
+        if point_coordinates is not None:
+            self.insert(point_coordinates)
+
+    def __len__(self) -> int:
+        """Return the number of points in the index."""
+        return self._n_active
+
+    @property
+    def ids(self) -> _np.ndarray:
+        """Return the (sorted) IDs of all points in the index."""
+        return _np.flatnonzero(self._active)
+
+    @property
+    def coordinates(self) -> _np.ndarray:
+        """Return the coordinates of all points in the index, in the order of
+        ids."""
+        return self._coordinates[self._active]
+
+    def insert(self, point_coordinates: _np.ndarray) -> _np.ndarray:
+        """Insert points into the index.
+
+        The capacity of the internal arrays is doubled if it is not
+        sufficient, i.e., inserting points one after another has an amortized
+        constant cost per point.
+
+        Args:
+            point_coordinates: Coordinates (n_points x n_dim) of the points.
+
+        Returns:
+            The IDs of the inserted points.
+        """
+
+        point_coordinates = self._check_points(point_coordinates)
+        n_old = self._n_ids
+        n_new = n_old + len(point_coordinates)
+
+        capacity = len(self._active_buffer)
+        if n_new > capacity:
+            capacity = max(n_new, 2 * capacity)
+            coordinates_buffer = _np.zeros((capacity, self._coordinates.shape[1]))
+            coordinates_buffer[:n_old] = self._coordinates
+            active_buffer = _np.zeros(capacity, dtype=bool)
+            active_buffer[:n_old] = self._active
+            self._coordinates_buffer = coordinates_buffer
+            self._active_buffer = active_buffer
+
+        self._coordinates_buffer[n_old:n_new] = point_coordinates
+        self._active_buffer[n_old:n_new] = True
+        self._n_ids = n_new
+        self._set_buffer_views()
+        self._n_active += n_new - n_old
+        return _np.arange(n_old, n_new)
+
+    def remove(self, ids) -> None:
+        """Remove points from the index.
+
+        Args:
+            ids: The IDs of the points that should be removed.
+        """
+
+        ids = _np.unique(_np.asarray(ids, dtype=int))
+        if len(ids) == 0:
+            return
+        if ids[0] < 0 or ids[-1] >= len(self._active) or not _np.all(self._active[ids]):
+            raise ValueError("Only points that are in the index can be removed!")
+
+        self._active[ids] = False
+        self._n_active -= len(ids)
+        self._n_tree_removed += _np.count_nonzero(ids < self._n_tree_built)
+
+    def query_radius(
+        self, point_coordinates: _np.ndarray, r: float
+    ) -> _List[_np.ndarray]:
+        """Find all points in the index within a distance of the given
+        points.
+
+        Args:
+            point_coordinates: Coordinates (n_points x n_dim) of the query
+                points, e.g., from an external point cloud.
+            r: Maximum distance of the points in the index to the query
+                point.
+
+        Returns:
+            A list with the sorted IDs of the points within r for each query
+            point.
+        """
+
+        point_coordinates = self._check_points(point_coordinates)
+
+        if self._use_brute_force():
+            ids = self.ids
+            result = []
+            for chunk in self._get_query_chunks(len(point_coordinates), len(ids)):
+                distances = self._get_distances(point_coordinates[chunk], ids)
+                result.extend(ids[row <= r] for row in distances)
+            return result
+
+        trees = self._get_trees()
+        tree_results = [
+            tree.query_ball_point(point_coordinates, r) for tree, _ in trees
+        ]
+
+        result = []
+        for i_point in range(len(point_coordinates)):
+            ids = _np.concatenate(
+                [
+                    tree_ids[_np.asarray(tree_result[i_point], dtype=int)]
+                    for (_, tree_ids), tree_result in zip(trees, tree_results)
+                ]
+            )
+            result.append(_np.sort(ids[self._active[ids]]))
+        return result
+
+    def query_knn(
+        self, point_coordinates: _np.ndarray, k: int
+    ) -> _Tuple[_np.ndarray, _np.ndarray]:
+        """Find the k nearest points in the index for the given points.
+
+        Args:
+            point_coordinates: Coordinates (n_points x n_dim) of the query
+                points, e.g., from an external point cloud.
+            k: Number of nearest neighbours.
+
+        Returns:
+            distances: Array (n_points x k) with the distances to the
+                nearest neighbours, sorted by the distance.
+            ids: Array (n_points x k) with the IDs of the nearest neighbours.
+        """
+
+        point_coordinates = self._check_points(point_coordinates)
+        if k > self._n_active:
+            raise ValueError(
+                f"Can not find {k} nearest neighbours in an index with "
+                f"{self._n_active} points!"
+            )
+
+        if self._use_brute_force():
+            ids = self.ids
+            distances = _np.zeros((len(point_coordinates), k))
+            nearest_ids = _np.zeros((len(point_coordinates), k), dtype=int)
+            for chunk in self._get_query_chunks(len(point_coordinates), len(ids)):
+                chunk_distances = self._get_distances(point_coordinates[chunk], ids)
+                nearest = _np.argsort(chunk_distances, axis=1, kind="stable")[:, :k]
+                distances[chunk] = _np.take_along_axis(chunk_distances, nearest, axis=1)
+                nearest_ids[chunk] = ids[nearest]
+            return distances, nearest_ids
+
+        # Query the k nearest neighbours in each tree. Additional neighbours are
+        # queried for the removed points in the trees, removed points get an
+        # infinite distance.
+        candidate_distances = []
+        candidate_ids = []
+        for tree, tree_ids in self._get_trees():
+            n_tree = len(tree_ids)
+            n_removed = n_tree - _np.count_nonzero(self._active[tree_ids])
+            k_tree = min(k + n_removed, n_tree)
+            tree_distances, tree_indices = tree.query(
+                point_coordinates, k=list(range(1, k_tree + 1))
+            )
+
+            # Missing neighbours already have an infinite distance.
+            ids = tree_ids[_np.minimum(tree_indices, n_tree - 1)]
+            tree_distances[~self._active[ids]] = _np.inf
+            candidate_distances.append(tree_distances)
+            candidate_ids.append(ids)
+        distances = _np.hstack(candidate_distances)
+        candidate_ids = _np.hstack(candidate_ids)
+
+        nearest = _np.argsort(distances, axis=1, kind="stable")[:, :k]
+        return (
+            _np.take_along_axis(distances, nearest, axis=1),
+            _np.take_along_axis(candidate_ids, nearest, axis=1),
+        )
+
+    def find_close_points(self, *, tol: float = 1e-8, **kwargs):
+        """Find points in the index that are within a certain tolerance of
+        each other.
+
+        Args:
+            tol: Tolerance for two points to be considered as close.
+            kwargs: Passed on to find_close_points.
+
+        Returns:
+            ids: The IDs of the points in the index.
+            has_partner: An array with the partner index of each point in
+                ids. A partner index of -1 means that the point does not have
+                a partner.
+            n_partner: Number of partner clusters.
+        """
+        return self.ids, *_find_close_points(
+            self.coordinates, algorithm=self.algorithm, tol=tol, **kwargs
+        )
+
+    def _set_buffer_views(self) -> None:
+        """Set the coordinates and active flags to the used part of the
+        buffers."""
+        self._coordinates = self._coordinates_buffer[: self._n_ids]
+        self._active = self._active_buffer[: self._n_ids]
+
+    def _check_points(self, point_coordinates: _np.ndarray) -> _np.ndarray:
+        """Return the given points as float array and check the
+        dimensions."""
+        point_coordinates = _np.asarray(point_coordinates, dtype=float)
+        if point_coordinates.ndim != 2 or (
+            point_coordinates.shape[1] != self._coordinates.shape[1]
+        ):
+            raise ValueError(
+                f"Expected points with shape (n, {self._coordinates.shape[1]}), "
+                f"got {point_coordinates.shape}!"
+            )
+        return point_coordinates
+
+    def _use_brute_force(self) -> bool:
+        """Check if the queries should be performed with a brute force
+        search."""
+        algorithm = self.algorithm
+        if algorithm is None:
+            algorithm = _get_default_algorithm(self._n_active)
+        return algorithm is _FindClosePointAlgorithm.brute_force_cython
+
+    def _get_trees(self) -> _List[_Tuple[_KDTree, _np.ndarray]]:
+        """Return the KD-trees with the IDs of their points.
+
+        The main tree is built if it does not exist or is outdated, the
+        tree for the points inserted after the main tree was built is
+        updated if points were inserted since the last query. Empty trees
+        are not returned.
+        """
+
+        n_changes = self._n_ids - self._n_tree_built + self._n_tree_removed
+        if self._tree is None or n_changes > self.rebuild_fraction * len(
+            self._tree_ids
+        ):
+            self._tree_ids = self.ids
+            self._tree = _KDTree(self._coordinates[self._tree_ids])
+            self._n_tree_built = self._n_ids
+            self._n_tree_removed = 0
+
+        pending_ids = _np.arange(self._n_tree_built, self._n_ids)
+        if not _np.array_equal(pending_ids, self._pending_tree_ids):
+            self._pending_tree_ids = pending_ids
+            self._pending_tree = (
+                _KDTree(self._coordinates[pending_ids])
+                if len(pending_ids) > 0
+                else None
+            )
+
+        return [
+            (tree, tree_ids)
+            for tree, tree_ids in (
+                (self._tree, self._tree_ids),
+                (self._pending_tree, self._pending_tree_ids),
+            )
+            if len(tree_ids) > 0
+        ]
+
+    def _get_query_chunks(self, n_query: int, n_ids: int) -> _List[slice]:
+        """Return slices of the query points, so that the distance arrays of
+        the brute force search stay below max_brute_force_entries."""
+        n_dim = self._coordinates.shape[1]
+        chunk_size = max(1, self.max_brute_force_entries // max(1, n_ids * n_dim))
+        return [
+            slice(start, start + chunk_size) for start in range(0, n_query, chunk_size)
+        ]
+
+    def _get_distances(
+        self, point_coordinates: _np.ndarray, ids: _np.ndarray
+    ) -> _np.ndarray:
+        """Return the distances between the query points and the given points
+        in the index."""
+        return _np.linalg.norm(
+            point_coordinates[:, _np.newaxis, :] - self._coordinates[ids], axis=2
+        )
@@ -210,9 +210,11 @@ def create_stent_column(
         unit_cell.translate([0, i * height, 0])
         mesh_column.add(unit_cell)
 
-    column_copy = mesh_column.copy()
-    column_copy.reflect(normal_vector=[1, 0, 0], origin=[width, 0, 0])
-    mesh_column.add(column_copy)
+    mesh_column.add(
+        mesh_column.replicate(
+            [0, 0, 0], reflection_normal=[1, 0, 0], origin=[width, 0, 0]
+        )
+    )
 
     return mesh_column
 
@@ -251,10 +253,9 @@ def create_beam_mesh_stent_flat(
     column_mesh = create_stent_column(
         beam_class, material, width, height, n_height, n_el=n_el, **kwargs
     )
-    for i in range(n_column):
-        column_copy = column_mesh.copy()
-        column_copy.translate([2 * width * i, 0, 0])
-        mesh_flat.add(column_copy)
+    mesh_flat.add(
+        column_mesh.replicate([[2 * width * i, 0, 0] for i in range(n_column)])
+    )
 
     for i in range(n_column // 2):
         for j in range(n_height - 1):
@@ -25,6 +25,7 @@ import numpy as _np
 
 from beamme.core.conf import mpy as _mpy
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.mesh_creation_functions.beam_generic import (
     create_beam_mesh_generic as _create_beam_mesh_generic,
 )
@@ -162,27 +163,21 @@ def create_beam_mesh_arc_segment_via_axis(
         _np.transpose(_np.array([tangent, -distance / radius, axis]))
     )
 
-    def get_beam_geometry(alpha, beta):
-        """Return a function for the position and rotation along the beam
-        axis."""
-
-        def beam_function(xi):
-            """Return a point and the triad on the beams axis for a given
-            parameter coordinate xi."""
-            phi = 0.5 * (xi + 1) * (beta - alpha) + alpha
-            arc_rotation = _Rotation(axis, phi)
-            rot = arc_rotation * start_rotation
-            pos = center + arc_rotation * distance
-            return (pos, rot, phi * radius)
-
-        return beam_function
+    def get_beam_geometry(alpha, beta, xi):
+        """Return the points and triads on the beams axis for the given
+        arrays of element parameters and local parameter coordinates xi."""
+        phi = 0.5 * (xi + 1) * (beta - alpha) + alpha
+        arc_rotation = _RotationArray(axis, phi)
+        rot = arc_rotation * start_rotation
+        pos = center + arc_rotation * distance
+        return (pos, rot.q, phi * radius)
 
     # Create the beam in the mesh
     return _create_beam_mesh_generic(
         mesh,
         beam_class=beam_class,
         material=material,
-        function_generator=get_beam_geometry,
+        function_generator_vectorized=get_beam_geometry,
         interval=[0.0, angle],
         interval_length=angle * radius,
         **kwargs,
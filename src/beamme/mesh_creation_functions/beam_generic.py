@@ -38,6 +38,8 @@ from beamme.core.geometry_set import GeometrySet as _GeometrySet
 from beamme.core.material import MaterialBeamBase as _MaterialBeamBase
 from beamme.core.mesh import Mesh as _Mesh
 from beamme.core.node import NodeCosserat as _NodeCosserat
+from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import add_rotations as _add_rotations
 from beamme.utils.nodes import get_single_node as _get_single_node
 
 
@@ -46,7 +48,8 @@ def create_beam_mesh_generic(
     *,
     beam_class: _Type[_Beam],
     material: _MaterialBeamBase,
-    function_generator: _Callable,
+    function_generator: _Optional[_Callable] = None,
+    function_generator_vectorized: _Optional[_Callable] = None,
     interval: _Tuple[float, float],
     n_el: _Optional[int] = None,
     l_el: _Optional[float] = None,
@@ -83,6 +86,17 @@ def create_beam_mesh_generic(
             Usually, the Jacobian of the returned position field should be a unit
             vector. Otherwise, the nodes may be spaced in an undesired way. All
             standard mesh creation functions fulfill this property.
+
+            Mutually exclusive with function_generator_vectorized.
+        function_generator_vectorized:
+            Vectorized alternative to function_generator. This function has to
+            take three arrays point_a, point_b and xi (all of the same length)
+            and return a tuple with the positions (n x 3), the quaternions
+            (n x 4) and the arc lengths (n, or None) at the local coordinates xi
+            of the beams between point_a and point_b. If this function is given,
+            the nodes of all elements are evaluated in a single call and the
+            elements are created in bulk, which is considerably faster for
+            large numbers of elements.
         interval:
             Start and end values for interval that will be used to create the
             beam.
@@ -148,6 +162,12 @@ def create_beam_mesh_generic(
             'The arguments "n_el", "l_el" and "node_positions_of_elements" are mutually exclusive'
         )
 
+    if (function_generator is None) == (function_generator_vectorized is None):
+        raise ValueError(
+            'Exactly one of the arguments "function_generator" and '
+            '"function_generator_vectorized" has to be given'
+        )
+
     if close_beam and end_node is not None:
         raise ValueError(
             'The arguments "close_beam" and "end_node" are mutually exclusive'
@@ -209,9 +229,7 @@ def create_beam_mesh_generic(
     # Make sure the material is in the mesh.
     mesh.add_material(material)
 
-    # List with nodes and elements that will be added in the creation of
-    # this beam.
-    elements = []
+    # List with nodes that will be added in the creation of this beam.
     nodes = []
 
     def check_given_node(node):
@@ -250,7 +268,22 @@ def create_beam_mesh_generic(
                 )
 
     # Position and rotation at the start and end of the interval
-    function_over_whole_interval = function_generator(*interval)
+    if function_generator is not None:
+        function_over_whole_interval = function_generator(*interval)
+    else:
+
+        def function_over_whole_interval(xi):
+            """Evaluate the vectorized function for a single point xi of the
+            whole interval."""
+            positions, quaternions, arc_lengths = function_generator_vectorized(
+                _np.array([interval[0]]), _np.array([interval[1]]), _np.array([xi])
+            )
+            return (
+                positions[0],
+                _Rotation.from_quaternion(quaternions[0]),
+                None if arc_lengths is None else arc_lengths[0],
+            )
+
     relative_twist_start = None
     relative_twist_end = None
 
@@ -301,20 +334,42 @@ def create_beam_mesh_generic(
     else:
         relative_twist = None
 
-    # Create the beams.
-    for i_el in range(n_el):
+    # Create the beam elements.
+    elements = [beam_class(material=material) for _i_el in range(n_el)]
+
+    if function_generator_vectorized is not None:
+        # Evaluate the nodal values for all elements at once. Consecutive
+        # elements share their boundary node, i.e., the first node of each
+        # element (except the first one) is not evaluated again.
+        xi_local = _np.asarray(elements[0].nodes_create, dtype=float)
+        n_nodes_element = len(xi_local)
+        n_nodes_created = n_nodes_element - 1
+        points_a = interval_node_positions_of_elements[:-1]
+        points_b = interval_node_positions_of_elements[1:]
+        (
+            nodal_positions,
+            nodal_quaternions,
+            nodal_arc_lengths,
+        ) = function_generator_vectorized(
+            _np.concatenate([points_a[:1], _np.repeat(points_a, n_nodes_created)]),
+            _np.concatenate([points_b[:1], _np.repeat(points_b, n_nodes_created)]),
+            _np.concatenate([xi_local[:1], _np.tile(xi_local[1:], n_el)]),
+        )
+        if relative_twist is not None:
+            nodal_quaternions = _add_rotations(nodal_quaternions, relative_twist)
+        if set_nodal_arc_length:
+            nodal_arc_lengths = nodal_arc_lengths + nodal_arc_length_offset
+        else:
+            nodal_arc_lengths = None
+
+    # Create the nodes of the beams.
+    for i_el, element in enumerate(elements):
         # If the beam is closed with itself, set the end node to be the
         # first node of the beam. This is done when the second element is
         # created, as the first node already exists here.
         if i_el == 1 and close_beam:
             end_node = nodes[0]
 
-        # Get the function to create this beam element.
-        function = function_generator(
-            interval_node_positions_of_elements[i_el],
-            interval_node_positions_of_elements[i_el + 1],
-        )
-
         # Set the start node for the created beam.
         if start_node is not None or i_el > 0:
             first_node = nodes[-1]
@@ -327,10 +382,13 @@ def create_beam_mesh_generic(
         else:
             last_node = None
 
-        element = beam_class(material=material)
-        elements.append(element)
-        nodes.extend(
-            element.create_beam(
+        if function_generator_vectorized is None:
+            # Get the function to create this beam element.
+            function = function_generator(
+                interval_node_positions_of_elements[i_el],
+                interval_node_positions_of_elements[i_el + 1],
+            )
+            created_nodes = element.create_beam(
                 function,
                 start_node=first_node,
                 end_node=last_node,
@@ -338,7 +396,18 @@ def create_beam_mesh_generic(
                 set_nodal_arc_length=set_nodal_arc_length,
                 nodal_arc_length_offset=nodal_arc_length_offset,
             )
-        )
+        else:
+            nodal_range = slice(
+                i_el * n_nodes_created, i_el * n_nodes_created + n_nodes_element
+            )
+            created_nodes = element.create_beam_from_arrays(
+                nodal_positions[nodal_range],
+                nodal_quaternions[nodal_range],
+                None if nodal_arc_lengths is None else nodal_arc_lengths[nodal_range],
+                start_node=first_node,
+                end_node=last_node,
+            )
+        nodes.extend(created_nodes)
 
     # Set vtk cell data on created elements.
     if vtk_cell_data is not None:
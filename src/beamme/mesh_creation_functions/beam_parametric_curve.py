@@ -21,20 +21,194 @@
 # THE SOFTWARE.
 """This file has functions to create a beam from a parametric curve."""
 
-import autograd.numpy as _npAD
 import numpy as _np
-import scipy.integrate as _integrate
-import scipy.optimize as _optimize
+from autograd import elementwise_grad as _elementwise_grad
 from autograd import jacobian as _jacobian
+from scipy.interpolate import PchipInterpolator as _PchipInterpolator
 
 from beamme.core.conf import mpy as _mpy
 from beamme.core.rotation import Rotation as _Rotation
-from beamme.core.rotation import smallest_rotation as _smallest_rotation
+from beamme.core.rotation import RotationArray as _RotationArray
+from beamme.core.rotation import (
+    smallest_rotation_transport as _smallest_rotation_transport,
+)
 from beamme.mesh_creation_functions.beam_generic import (
     create_beam_mesh_generic as _create_beam_mesh_generic,
 )
 
 
+class ArcLengthTable:
+    """Tabulated arc length along a parametric curve.
+
+    The arc length is integrated once with an adaptive Gauss-Legendre
+    quadrature. The parameter coordinate for a given arc length is obtained
+    from a monotone interpolation of the inverted table, which is then refined
+    with a Newton iteration.
+    """
+
+    # Gauss-Legendre points and weights on the interval [0, 1].
+    _gauss_points, _gauss_weights = _np.polynomial.legendre.leggauss(5)
+    _gauss_points = 0.5 * (_gauss_points + 1.0)
+    _gauss_weights = 0.5 * _gauss_weights
+
+    def __init__(self, ds, t_start, t_end, *, tol=1e-12, n_initial_segments=16):
+        """Create the arc length table.
+
+        Args
+        ----
+        ds: function(t) -> _np.array
+            Increment along the curve, i.e., the norm of the tangent vector,
+            for an array of parameter coordinates t.
+        t_start, t_end: float
+            Start and end values of the parameter coordinate. The arc length
+            is measured from t_start. t_end can be smaller than t_start.
+        tol: float
+            Relative tolerance for the integrated length of the curve.
+        n_initial_segments: int
+            Number of equally spaced segments that are refined adaptively.
+        """
+
+        self.ds = ds
+        self.direction = 1.0 if t_end >= t_start else -1.0
+
+        # Integrate the initial segments.
+        t_initial = _np.linspace(t_start, t_end, n_initial_segments + 1)
+        segments = [
+            (a, b, self._integrate(a, b)) for a, b in zip(t_initial[:-1], t_initial[1:])
+        ]
+        self.abs_tol = tol * max(sum(abs(length) for _, _, length in segments), 1.0)
+
+        # Bisect the segments until the local error estimate is small enough.
+        t_table = [t_start]
+        length_table = [0.0]
+        segments.reverse()
+        while segments:
+            a, b, length = segments.pop()
+            t_mid = 0.5 * (a + b)
+            length_left = self._integrate(a, t_mid)
+            length_right = self._integrate(t_mid, b)
+            segment_tol = self.abs_tol * abs(b - a) / abs(t_end - t_start)
+            if abs(length_left + length_right - length) <= segment_tol or abs(
+                b - a
+            ) <= _mpy.eps_pos * abs(t_end - t_start):
+                t_table.extend([t_mid, b])
+                length_table.extend(
+                    [
+                        length_table[-1] + length_left,
+                        length_table[-1] + length_left + length_right,
+                    ]
+                )
+            else:
+                segments.extend([(t_mid, b, length_right), (a, t_mid, length_left)])
+
+        self.t_table = _np.array(t_table)
+        self.length_table = _np.array(length_table)
+        self.length = self.length_table[-1]
+        self._t_interpolation = _PchipInterpolator(self.length_table, self.t_table)
+
+    def _integrate(self, a, b):
+        """Integrate ds between the parameter coordinates a and b, in the
+        direction of the curve.
+
+        a and b can be arrays, in this case ds is evaluated for the Gauss
+        points of all intervals at once.
+        """
+        a = _np.asarray(a, dtype=float)
+        b = _np.asarray(b, dtype=float)
+        points = a[..., _np.newaxis] + _np.multiply.outer(b - a, self._gauss_points)
+        ds = _np.reshape(self.ds(points.ravel()), points.shape)
+        return self.direction * (b - a) * (ds @ self._gauss_weights)
+
+    def get_t(self, arc_lengths, *, max_iter=20):
+        """Return the parameter coordinates for the given arc lengths.
+
+        Args
+        ----
+        arc_lengths: float, _np.array
+            Arc length(s) along the curve.
+        max_iter: int
+            Maximum number of Newton iterations.
+        """
+
+        arc_lengths = _np.asarray(arc_lengths, dtype=float)
+        arc_lengths_flat = arc_lengths.ravel()
+        t = _np.atleast_1d(self._t_interpolation(arc_lengths_flat))
+
+        # Refine the interpolated values with a Newton iteration, the arc length
+        # is integrated starting from the closest table entry. Each Newton step
+        # updates all arc lengths that are not converged yet at once.
+        index = _np.clip(
+            _np.searchsorted(self.length_table, arc_lengths_flat, side="right") - 1,
+            0,
+            len(self.t_table) - 1,
+        )
+        t_start = self.t_table[index]
+        length_start = self.length_table[index]
+        active = _np.arange(len(t))
+        for _ in range(max_iter):
+            residuum = (
+                length_start[active]
+                + self._integrate(t_start[active], t[active])
+                - arc_lengths_flat[active]
+            )
+            update = residuum != 0.0
+            if _np.any(update):
+                t[active[update]] -= (
+                    self.direction * residuum[update] / self.ds(t[active[update]])
+                )
+            active = active[_np.abs(residuum) > self.abs_tol]
+            if len(active) == 0:
+                break
+        else:
+            raise ValueError(
+                f"Newton iteration for arc lengths {arc_lengths_flat[active]} did "
+                "not converge!"
+            )
+
+        if arc_lengths.ndim == 0:
+            return t[0]
+        return t.reshape(arc_lengths.shape)
+
+
+def _evaluate_vectorized(function, t):
+    """Evaluate a function of the parameter coordinate for an array of
+    parameter coordinates.
+
+    The function is called once with the whole array. If the function does
+    not support arrays, i.e., it raises an error, does not return the values
+    for all parameter coordinates along the last axis or the values do not
+    match a single evaluation, it is called for each parameter coordinate.
+
+    Args
+    ----
+    function: function(t) -> _np.array
+        Function of the parameter coordinate.
+    t: _np.array
+        Parameter coordinates.
+
+    Return
+    ----
+    values: _np.array
+        Values of the function, the first axis corresponds to the parameter
+        coordinates.
+    """
+
+    t = _np.asarray(t, dtype=float)
+    try:
+        values = _np.asarray(function(t), dtype=float)
+    except (TypeError, ValueError, IndexError):
+        values = None
+    if (
+        values is not None
+        and values.shape[-1:] == t.shape
+        and _np.allclose(
+            values[..., 0], function(t[0]), rtol=_mpy.eps_pos, atol=_mpy.eps_pos
+        )
+    ):
+        return _np.moveaxis(values, -1, 0)
+    return _np.array([function(t_i) for t_i in t], dtype=float)
+
+
 def create_beam_mesh_parametric_curve(
     mesh,
     beam_class,
@@ -47,9 +221,15 @@ def create_beam_mesh_parametric_curve(
     function_rotation=None,
     **kwargs,
 ):
-    """Generate a beam from a parametric curve. Integration along the beam is
-    performed with scipy, and if the gradient is not explicitly provided, it is
-    calculated with the numpy wrapper autograd.
+    """Generate a beam from a parametric curve. The arc length along the beam
+    is tabulated once with an adaptive Gauss-Legendre quadrature, and if the
+    gradient is not explicitly provided, it is calculated with the numpy
+    wrapper autograd.
+
+    The functions are evaluated for all required parameter coordinates at
+    once, if they support arrays of parameter coordinates (see
+    _evaluate_vectorized). Otherwise, they are evaluated for each parameter
+    coordinate.
 
     Args
     ----
@@ -78,7 +258,8 @@ def create_beam_mesh_parametric_curve(
         If no function_rotation is given, the rotation of the first node
         is calculated automatically and all subsequent nodal rotations
         are calculated based on a smallest rotation mapping onto the curve
-        tangent vector.
+        tangent vector. For an array of parameter coordinates, the function
+        can return a RotationArray.
 
     **kwargs (for all of them look into create_beam_mesh_function)
     ----
@@ -122,7 +303,19 @@ def create_beam_mesh_parametric_curve(
     # Get the derivative of the position function and the increment along
     # the curve.
     if function_derivative is None:
-        rp = _jacobian(function)
+        rp_scalar = _jacobian(function)
+        rp_components = [
+            _elementwise_grad(lambda t, i=i: function(t)[i])
+            for i in range(len(function(interval[0])))
+        ]
+
+        def rp(t):
+            """Return the tangent vector, for an array of parameter
+            coordinates the components are stacked along the first axis."""
+            if _np.ndim(t) == 0:
+                return rp_scalar(t)
+            return _np.array([rp_component(t) for rp_component in rp_components])
+
     else:
         rp = function_derivative
 
@@ -136,130 +329,69 @@ def create_beam_mesh_parametric_curve(
             return -(rp_positive(t))
 
     def ds(t):
-        """Increment along the curve."""
-        return _npAD.linalg.norm(rp(t))
-
-    def S(t, start_t=None, start_S=None):
-        """Function that integrates the length until a parameter value.
-
-        A speedup can be achieved by giving start_t and start_S, the
-        parameter and Length at a known point.
-        """
-        if start_t is None and start_S is None:
-            st = interval[0]
-            sS = 0
-        elif start_t is not None and start_S is not None:
-            st = start_t
-            sS = start_S
+        """Increment along the curve for an array of parameter
+        coordinates."""
+        return _np.linalg.norm(_evaluate_vectorized(rp, t), axis=1)
+
+    # Tabulate the arc length along the curve.
+    arc_length_table = ArcLengthTable(ds, interval[0], interval[1])
+
+    # Starting triad for the smallest rotation mapping along the curve.
+    if is_3d_curve and not is_rot_funct:
+        r_prime = rp(interval[0])
+        if abs(_np.dot(r_prime, [0, 0, 1])) < abs(_np.dot(r_prime, [0, 1, 0])):
+            t2_temp = [0, 0, 1]
         else:
-            raise ValueError("Input parameters are wrong!")
-        return _integrate.quad(ds, st, t)[0] + sS
+            t2_temp = [0, 1, 0]
+        start_triad = _Rotation.from_basis(r_prime, t2_temp)
 
-    def get_t_along_curve(arc_length, t0, **kwargs):
-        """Calculate the parameter t where the length along the curve is
-        arc_length.
+    def get_beam_geometry(length_a, length_b, xi):
+        """Return the points and triads on the beams axis for the given arrays
+        of element arc length intervals and local parameter coordinates xi.
 
-        t0 is the start point for the Newton iteration.
+        If no rotation function is given, the triads are calculated via
+        smallest rotation mappings from the starting triad along the given
+        points, i.e., the points have to be ordered along the curve.
         """
-        t_root = _optimize.newton(lambda t: S(t, **kwargs) - arc_length, t0, fprime=ds)
-        return t_root
 
-    class BeamFunctions:
-        """This object manages the creation of functions which are used to
-        create the beam nodes.
+        # Parameter coordinates along the curve.
+        S = length_a + 0.5 * (xi + 1) * (length_b - length_a)
+        t = arc_length_table.get_t(S)
 
-        By wrapping this in this object, we can store some data and
-        speed up the numerical integration along the curve.
-        """
-
-        def __init__(self):
-            """Initialize the object."""
-            self._reset_start_values()
-            self.last_triad = None
+        # Positions.
+        pos = _np.zeros((len(t), 3))
+        if is_3d_curve:
+            pos[:] = _evaluate_vectorized(function, t)
+        else:
+            pos[:, :2] = _evaluate_vectorized(function, t)
 
+        # Rotations.
+        if is_rot_funct:
+            quaternions = _evaluate_vectorized(
+                lambda t: _np.transpose(function_rotation(t).q), t
+            )
+        else:
+            r_prime = _evaluate_vectorized(rp, t)
             if is_3d_curve:
-                r_prime = rp(interval[0])
-                if abs(_np.dot(r_prime, [0, 0, 1])) < abs(_np.dot(r_prime, [0, 1, 0])):
-                    t2_temp = [0, 0, 1]
-                else:
-                    t2_temp = [0, 1, 0]
-                self.last_triad = _Rotation.from_basis(r_prime, t2_temp)
-
-        def _reset_start_values(self):
-            """Reset the stored start values for the next Newton iteration."""
-            self.t_start_newton = interval[0]
-            self.S_start_newton = 0.0
-
-        def __call__(self, length_a, length_b):
-            """This object is called with the interval limits.
-
-            This method returns a function that evaluates the position
-            and rotation within this interval.
-            """
-
-            # In case the interval is not continuous with the last one, we reset the start
-            # values for the Newton iteration here
-            if length_a < self.S_start_newton - _mpy.eps_pos:
-                self._reset_start_values()
-
-            # Length of the beam element in physical space.
-            L = length_b - length_a
-
-            def get_beam_position_and_rotation_at_xi(xi):
-                """Evaluate the beam position and rotation at xi.
-
-                xi is the beam element parameter coordinate, i.e., xi =
-                [-1, 1].
-                """
-                # Parameter for xi.
-                S = length_a + 0.5 * (xi + 1) * L
-                t = get_t_along_curve(
-                    S,
-                    self.t_start_newton,
-                    start_t=self.t_start_newton,
-                    start_S=self.S_start_newton,
-                )
+                quaternions = _smallest_rotation_transport(start_triad, r_prime)
+            else:
+                # The rotation simplifies in the 2d case.
+                quaternions = _RotationArray(
+                    [0, 0, 1], _np.arctan2(r_prime[:, 1], r_prime[:, 0])
+                ).get_quaternions()
 
-                # Position at xi.
-                if is_3d_curve:
-                    pos = function(t)
-                else:
-                    pos = _np.zeros(3)
-                    pos[:2] = function(t)
-
-                # Rotation at xi.
-                if is_rot_funct:
-                    rot = function_rotation(t)
-                else:
-                    r_prime = rp(t)
-                    if is_3d_curve:
-                        # Create the next triad via the smallest rotation mapping based
-                        # on the last triad.
-                        rot = _smallest_rotation(self.last_triad, r_prime)
-                        self.last_triad = rot.copy()
-                    else:
-                        # The rotation simplifies in the 2d case.
-                        rot = _Rotation([0, 0, 1], _np.arctan2(r_prime[1], r_prime[0]))
-
-                # Set start values for the next iteration
-                self.t_start_newton = t
-                self.S_start_newton = S
-
-                # Return the needed values for beam creation.
-                return (pos, rot, S)
-
-            return get_beam_position_and_rotation_at_xi
+        return (pos, quaternions, S)
 
     # Now create the beam.
     # Get the length of the whole segment.
-    length = S(interval[1])
+    length = arc_length_table.length
 
     # Create the beam in the mesh
     created_sets = _create_beam_mesh_generic(
         mesh,
         beam_class=beam_class,
         material=material,
-        function_generator=BeamFunctions(),
+        function_generator_vectorized=get_beam_geometry,
         interval=[0.0, length],
         interval_length=length,
         **kwargs,
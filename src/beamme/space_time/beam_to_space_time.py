@@ -21,9 +21,14 @@
 # THE SOFTWARE.
 """Convert a beam to a space time surface mesh."""
 
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from itertools import repeat as _repeat
+from pathlib import Path as _Path
+from typing import Any as _Any
 from typing import Callable as _Callable
 from typing import Dict as _Dict
 from typing import List as _List
+from typing import Optional as _Optional
 from typing import Tuple as _Tuple
 from typing import Type as _Type
 from typing import Union as _Union
@@ -43,7 +48,10 @@ from beamme.core.mesh_utils import (
     get_coupled_nodes_to_master_map as _get_coupled_nodes_to_master_map,
 )
 from beamme.core.node import NodeCosserat as _NodeCosserat
+from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.utils.nodes import get_nodal_coordinates as _get_nodal_coordinates
+from beamme.utils.nodes import get_nodal_quaternions as _get_nodal_quaternions
 
 
 class NodeCosseratSpaceTime(_NodeCosserat):
@@ -78,35 +86,72 @@ class SpaceTimeElementQuad9(SpaceTimeElement):
     vtk_topology = list(range(9))
 
 
-def beam_to_space_time(
+# Local node indices of the space-time elements. The first entry is the
+# index of the spatial mesh copy within the time slab of the element, the
+# second entry is the local node index of the spatial beam element.
+_SPACE_TIME_ELEMENT_NODE_INDICES = {
+    SpaceTimeElementQuad4: _np.array([[0, 0], [0, 1], [1, 1], [1, 0]]),
+    SpaceTimeElementQuad9: _np.array(
+        [[0, 0], [0, 2], [2, 2], [2, 0], [0, 1], [1, 2], [2, 1], [1, 0], [1, 1]]
+    ),
+}
+
+
+def _get_nodal_data(
+    mesh: _Mesh,
+) -> _Tuple[_np.ndarray, _np.ndarray, _List[_Optional[float]], int]:
+    """Return the nodal coordinates, quaternions and arc lengths as well as
+    the number of elements of a spatial mesh."""
+    return (
+        _get_nodal_coordinates(mesh.nodes),
+        _get_nodal_quaternions(mesh.nodes),
+        [node.arc_length for node in mesh.nodes],
+        len(mesh.elements),
+    )
+
+
+def _get_nodal_data_from_generator(
+    mesh_space_generator: _Callable[[float], _Mesh], time: float
+) -> _Tuple[_np.ndarray, _np.ndarray, _List[_Optional[float]], int]:
+    """Return the nodal data (see _get_nodal_data) of the spatial mesh at the
+    given time.
+
+    This is a module level function, so it can be used in worker
+    processes.
+    """
+    return _get_nodal_data(mesh_space_generator(time))
+
+
+def _get_space_time_nodal_data(
     mesh_space_or_generator: _Union[_Mesh, _Callable[[float], _Mesh]],
     time_duration: float,
     number_of_elements_in_time: int,
     *,
-    time_start: float = 0.0,
-) -> _Tuple[_Mesh, _GeometryName]:
-    """Convert a beam mesh to a surface space-time mesh.
+    time_start: float,
+    n_processes: _Optional[int],
+) -> _Tuple[
+    _Mesh,
+    _Union[_Type[SpaceTimeElementQuad4], _Type[SpaceTimeElementQuad9]],
+    _np.ndarray,
+    _List[_Tuple[_np.ndarray, _np.ndarray, _List[_Optional[float]], int]],
+]:
+    """Get the nodal data of the spatial meshes at all times of the space-time
+    discretization.
+
+    For a description of the arguments, see beam_to_space_time. The
+    nodes of the reference mesh are numbered consecutively.
 
-    Args:
-        mesh_space_or_generator:
-            Either a fixed spatial Mesh object or a function that returns the
-            spatial mesh for a given time. If this is a generator, the topology
-            of the mesh at the initial time is chosen for all times, only the
-            positions and rotations are updated.
-        time_duration:
-            Total time increment to be solved with the space-time mesh
-        number_of_elements_in_time:
-            Number of elements in time direction
-        time_start:
-            Starting time for the space-time mesh. Can be used to create time slaps.
     Returns:
-        Tuple (space_time_mesh, return_set)
-        - space_time_mesh:
-            The space time mesh. Be aware that translating / rotating this mesh
-            might lead to unexpected results.
-        - return_set:
-            The nodes sets to be returned for the space time mesh:
-                "start", "end", "left", "right", "surface"
+        Tuple (mesh_space_reference, space_time_element_type, times, nodal_data)
+        - mesh_space_reference:
+            The spatial mesh at the start time.
+        - space_time_element_type:
+            The type of the space-time elements.
+        - times:
+            Array with the time of each copy of the spatial mesh.
+        - nodal_data:
+            List with the nodal data (see _get_nodal_data) for each copy of the
+            spatial mesh.
     """
 
     # Get the "reference" spatial mesh
@@ -144,111 +189,173 @@ def beam_to_space_time(
     for i_node, node in enumerate(mesh_space_reference.nodes):
         node.i_global = i_node
 
-    # Get the nodes for the final space-time mesh
-    left_nodes = []
-    right_nodes = []
-    space_time_nodes = []
-    for i_mesh_space in range(number_of_copies_in_time):
-        time = time_increment_between_nodes * i_mesh_space + time_start
-
-        if callable(mesh_space_or_generator):
-            mesh_space_current_time = mesh_space_or_generator(time)
-            if (not len(mesh_space_current_time.nodes) == number_of_nodes_in_space) or (
-                not len(mesh_space_current_time.elements) == number_of_elements_in_space
+    # Get the nodal data of the spatial meshes at all times
+    times = time_increment_between_nodes * _np.arange(number_of_copies_in_time)
+    times += time_start
+    nodal_data_reference = _get_nodal_data(mesh_space_reference)
+    if callable(mesh_space_or_generator):
+        if n_processes is None:
+            nodal_data_other_times = [
+                _get_nodal_data_from_generator(mesh_space_or_generator, time)
+                for time in times[1:]
+            ]
+        else:
+            with _ProcessPoolExecutor(max_workers=n_processes) as executor:
+                nodal_data_other_times = list(
+                    executor.map(
+                        _get_nodal_data_from_generator,
+                        _repeat(mesh_space_or_generator),
+                        times[1:],
+                    )
+                )
+        nodal_data = [nodal_data_reference] + nodal_data_other_times
+        for coordinates, _, _, number_of_elements in nodal_data:
+            if (not len(coordinates) == number_of_nodes_in_space) or (
+                not number_of_elements == number_of_elements_in_space
             ):
                 raise ValueError(
                     "The number of nodes and elements does not match for the generated "
                     "space time meshes."
                 )
-        else:
-            mesh_space_current_time = mesh_space_reference
+    else:
+        nodal_data = [nodal_data_reference] * number_of_copies_in_time
 
-        space_time_nodes_to_add = [
-            NodeCosseratSpaceTime(
-                node.coordinates, node.rotation, time, arc_length=node.arc_length
-            )
-            for node in mesh_space_current_time.nodes
+    return mesh_space_reference, space_time_element_type, times, nodal_data
+
+
+def _get_space_time_connectivity(
+    mesh_space_reference: _Mesh,
+    space_time_element_type: _Union[
+        _Type[SpaceTimeElementQuad4], _Type[SpaceTimeElementQuad9]
+    ],
+    number_of_elements_in_time: int,
+) -> _np.ndarray:
+    """Get the connectivity of all space-time elements.
+
+    The node indices refer to the space-time nodes, which are ordered
+    by the copy of the spatial mesh first, see _get_space_time_nodal_data.
+    The elements are also ordered by time first.
+    """
+
+    number_of_nodes_in_space = len(mesh_space_reference.nodes)
+    element_node_ids = _np.array(
+        [
+            [node.i_global for node in element.nodes]
+            for element in mesh_space_reference.elements
         ]
-        space_time_nodes.extend(space_time_nodes_to_add)
+    )
+    local_node_indices = _SPACE_TIME_ELEMENT_NODE_INDICES[space_time_element_type]
+    number_of_copies_per_element = local_node_indices[:, 0].max()
+    time_copy_indices = (
+        number_of_copies_per_element
+        * _np.arange(number_of_elements_in_time)[:, _np.newaxis]
+        + local_node_indices[:, 0]
+    )
+    connectivity = (
+        time_copy_indices[:, _np.newaxis, :] * number_of_nodes_in_space
+        + element_node_ids[:, local_node_indices[:, 1]][_np.newaxis, :, :]
+    ).reshape(-1, len(local_node_indices))
+    return connectivity
 
-        if i_mesh_space == 0:
-            start_nodes = space_time_nodes_to_add
-        elif i_mesh_space == number_of_copies_in_time - 1:
-            end_nodes = space_time_nodes_to_add
 
-        left_nodes.append(space_time_nodes_to_add[0])
-        right_nodes.append(space_time_nodes_to_add[-1])
+def beam_to_space_time(
+    mesh_space_or_generator: _Union[_Mesh, _Callable[[float], _Mesh]],
+    time_duration: float,
+    number_of_elements_in_time: int,
+    *,
+    time_start: float = 0.0,
+    n_processes: _Optional[int] = None,
+) -> _Tuple[_Mesh, _GeometryName]:
+    """Convert a beam mesh to a surface space-time mesh.
 
-    # Create the space time elements
-    space_time_elements = []
-    for i_element_time in range(number_of_elements_in_time):
-        for element in mesh_space_reference.elements:
-            element_node_ids = [node.i_global for node in element.nodes]
-            if space_time_element_type == SpaceTimeElementQuad4:
-                # Create the indices for the linear element
-                first_time_row_start_index = i_element_time * number_of_nodes_in_space
-                second_time_row_start_index = (
-                    1 + i_element_time
-                ) * number_of_nodes_in_space
-                element_node_indices = [
-                    first_time_row_start_index + element_node_ids[0],
-                    first_time_row_start_index + element_node_ids[1],
-                    second_time_row_start_index + element_node_ids[1],
-                    second_time_row_start_index + element_node_ids[0],
-                ]
-            elif space_time_element_type == SpaceTimeElementQuad9:
-                # Create the indices for the quadratic element
-                first_time_row_start_index = (
-                    2 * i_element_time * number_of_nodes_in_space
-                )
-                second_time_row_start_index = (
-                    2 * i_element_time + 1
-                ) * number_of_nodes_in_space
-                third_time_row_start_index = (
-                    2 * i_element_time + 2
-                ) * number_of_nodes_in_space
-                element_node_indices = [
-                    first_time_row_start_index + element_node_ids[0],
-                    first_time_row_start_index + element_node_ids[2],
-                    third_time_row_start_index + element_node_ids[2],
-                    third_time_row_start_index + element_node_ids[0],
-                    first_time_row_start_index + element_node_ids[1],
-                    second_time_row_start_index + element_node_ids[2],
-                    third_time_row_start_index + element_node_ids[1],
-                    second_time_row_start_index + element_node_ids[0],
-                    second_time_row_start_index + element_node_ids[1],
-                ]
-            else:
-                raise TypeError(
-                    f"Got unexpected space time element type {space_time_element_type}"
-                )
+    Args:
+        mesh_space_or_generator:
+            Either a fixed spatial Mesh object or a function that returns the
+            spatial mesh for a given time. If this is a generator, the topology
+            of the mesh at the initial time is chosen for all times, only the
+            positions and rotations are updated.
+        time_duration:
+            Total time increment to be solved with the space-time mesh
+        number_of_elements_in_time:
+            Number of elements in time direction
+        time_start:
+            Starting time for the space-time mesh. Can be used to create time slaps.
+        n_processes:
+            If this is given and mesh_space_or_generator is a generator, the
+            spatial meshes for the different times are created in parallel
+            with this number of worker processes. In this case, the generator
+            has to be picklable, e.g., a module level function.
+    Returns:
+        Tuple (space_time_mesh, return_set)
+        - space_time_mesh:
+            The space time mesh. Be aware that translating / rotating this mesh
+            might lead to unexpected results.
+        - return_set:
+            The nodes sets to be returned for the space time mesh:
+                "start", "end", "left", "right", "surface"
+    """
 
-            # Add the element to the mesh
-            space_time_elements.append(
-                space_time_element_type(
-                    [space_time_nodes[i_node] for i_node in element_node_indices]
-                )
-            )
+    (
+        mesh_space_reference,
+        space_time_element_type,
+        times,
+        nodal_data,
+    ) = _get_space_time_nodal_data(
+        mesh_space_or_generator,
+        time_duration,
+        number_of_elements_in_time,
+        time_start=time_start,
+        n_processes=n_processes,
+    )
+    number_of_nodes_in_space = len(mesh_space_reference.nodes)
+    number_of_copies_in_time = len(times)
+
+    # Create the nodes for the final space-time mesh
+    space_time_nodes = [
+        NodeCosseratSpaceTime(
+            coordinates,
+            _Rotation.from_quaternion(quaternion, normalized=True),
+            time,
+            arc_length=arc_length,
+        )
+        for time, (coordinates_time, quaternions_time, arc_lengths_time, _) in zip(
+            times.tolist(), nodal_data
+        )
+        for coordinates, quaternion, arc_length in zip(
+            coordinates_time, quaternions_time, arc_lengths_time
+        )
+    ]
+    start_nodes = space_time_nodes[:number_of_nodes_in_space]
+    end_nodes = space_time_nodes[-number_of_nodes_in_space:]
+    left_nodes = space_time_nodes[::number_of_nodes_in_space]
+    right_nodes = space_time_nodes[
+        number_of_nodes_in_space - 1 :: number_of_nodes_in_space
+    ]
+
+    # Get the connectivity of the space time elements
+    connectivity = _get_space_time_connectivity(
+        mesh_space_reference, space_time_element_type, number_of_elements_in_time
+    )
+
+    # Create the space time elements
+    space_time_elements = [
+        space_time_element_type([space_time_nodes[i_node] for i_node in element_nodes])
+        for element_nodes in connectivity.tolist()
+    ]
 
     # Add joints to the space time mesh
     space_time_couplings = []
     for coupling in mesh_space_reference.boundary_conditions[
         _mpy.bc.point_coupling, _mpy.geo.point
     ]:
-        for i_mesh_space in range(number_of_copies_in_time):
-            coupling_node_ids = [
-                node.i_global for node in coupling.geometry_set.get_points()
-            ]
-            space_time_couplings.append(
-                _Coupling(
-                    [
-                        space_time_nodes[node_id + number_of_nodes_in_space]
-                        for node_id in coupling_node_ids
-                    ],
-                    coupling.bc_type,
-                    coupling.data,
-                )
-            )
+        coupling_nodes = [
+            space_time_nodes[node.i_global + number_of_nodes_in_space]
+            for node in coupling.geometry_set.get_points()
+        ]
+        space_time_couplings.extend(
+            _Coupling(coupling_nodes, coupling.bc_type, coupling.data)
+            for _ in range(number_of_copies_in_time)
+        )
 
     # Create the new mesh and add all the mesh items
     space_time_mesh = _Mesh()
@@ -336,3 +443,144 @@ def mesh_to_data_arrays(mesh: _Mesh):
         return_dict["arc_length"] = arc_length
 
     return return_dict
+
+
+def beam_to_space_time_data_arrays(
+    mesh_space_or_generator: _Union[_Mesh, _Callable[[float], _Mesh]],
+    time_duration: float,
+    number_of_elements_in_time: int,
+    *,
+    time_start: float = 0.0,
+    n_processes: _Optional[int] = None,
+) -> _Dict[str, _Any]:
+    """Get the data arrays of a space-time mesh directly from the spatial beam
+    mesh.
+
+    The returned arrays are the same as the ones returned by
+    mesh_to_data_arrays for the space-time mesh created with
+    beam_to_space_time, where the returned sets are added to the space-time
+    mesh. However, the nodes and elements of the space-time mesh are never
+    created, the arrays are directly assembled from the nodal data of the
+    spatial meshes.
+
+    For a description of the arguments, see beam_to_space_time.
+    """
+
+    (
+        mesh_space_reference,
+        space_time_element_type,
+        times,
+        nodal_data,
+    ) = _get_space_time_nodal_data(
+        mesh_space_or_generator,
+        time_duration,
+        number_of_elements_in_time,
+        time_start=time_start,
+        n_processes=n_processes,
+    )
+    number_of_nodes_in_space = len(mesh_space_reference.nodes)
+    number_of_copies_in_time = len(times)
+    number_of_nodes = number_of_nodes_in_space * number_of_copies_in_time
+
+    # Nodal data of all space-time nodes, the nodes are ordered by time first
+    coordinates = _np.concatenate([data[0] for data in nodal_data])
+    quaternions = _np.concatenate([data[1] for data in nodal_data])
+    arc_lengths = [arc_length for data in nodal_data for arc_length in data[2]]
+    time = _np.repeat(times, number_of_nodes_in_space)
+    connectivity = _get_space_time_connectivity(
+        mesh_space_reference, space_time_element_type, number_of_elements_in_time
+    )
+
+    # Get the nodes that are replaced by the coupling "master" nodes, for details
+    # see beam_to_space_time and get_coupled_nodes_to_master_map.
+    master_node_ids = _np.arange(number_of_nodes)
+    coupling_node_ids = []
+    for coupling in mesh_space_reference.boundary_conditions[
+        _mpy.bc.point_coupling, _mpy.geo.point
+    ]:
+        if coupling.data is not _mpy.coupling_dof.fix:
+            raise ValueError(
+                "This function is only implemented for rigid joints at the DOFs"
+            )
+        node_ids = (
+            _np.array([node.i_global for node in coupling.geometry_set.get_points()])
+            + number_of_nodes_in_space
+        )
+        master_node_ids[node_ids[1:]] = node_ids[0]
+        coupling_node_ids.extend([node_ids] * number_of_copies_in_time)
+    is_replaced = master_node_ids != _np.arange(number_of_nodes)
+    if _np.any(is_replaced[master_node_ids[is_replaced]]):
+        raise ValueError(
+            "A replaced node is also a master nodes. This is not supported"
+        )
+
+    # Global indices of the unique nodes
+    is_unique = ~is_replaced
+    i_global = _np.cumsum(is_unique) - 1
+    i_global = i_global[master_node_ids]
+
+    # Node sets in the order of Mesh.get_unique_geometry_sets
+    node_ids = _np.arange(number_of_nodes).reshape(number_of_copies_in_time, -1)
+    node_sets_ids = [
+        node_ids[-1],
+        node_ids[:, 0],
+        node_ids[:, -1],
+        node_ids[0],
+        *coupling_node_ids,
+        node_ids.ravel(),
+    ]
+
+    return_dict = {
+        "coordinates": coordinates[is_unique],
+        "time": time[is_unique],
+        "connectivity": i_global[connectivity],
+        "element_rotation_vectors": _RotationArray.from_quaternion(
+            quaternions, normalized=True
+        ).get_rotation_vector()[connectivity],
+        "node_sets": {
+            str(i_set + 1): i_global[ids] for i_set, ids in enumerate(node_sets_ids)
+        },
+    }
+
+    nodes_have_arc_length = {arc_length is not None for arc_length in arc_lengths}
+    if len(nodes_have_arc_length) > 1:
+        raise ValueError(
+            "Some nodes have an arc length, some don't. This is not supported."
+        )
+    if nodes_have_arc_length.pop():
+        return_dict["arc_length"] = _np.array(arc_lengths)[connectivity]
+
+    return return_dict
+
+
+def save_data_arrays(file_path: _Union[str, _Path], data_arrays: _Dict) -> None:
+    """Save the data arrays of a space-time mesh to a compressed NPZ file.
+
+    Args:
+        file_path: Path to the NPZ file.
+        data_arrays: The data arrays, see mesh_to_data_arrays and
+            beam_to_space_time_data_arrays.
+    """
+
+    arrays = {key: value for key, value in data_arrays.items() if key != "node_sets"}
+    for name, node_set in data_arrays["node_sets"].items():
+        arrays[f"node_sets/{name}"] = node_set
+    _np.savez_compressed(file_path, **arrays)
+
+
+def load_data_arrays(file_path: _Union[str, _Path]) -> _Dict[str, _Any]:
+    """Load the data arrays of a space-time mesh from a NPZ file created with
+    save_data_arrays.
+
+    Args:
+        file_path: Path to the NPZ file.
+    """
+
+    data_arrays: _Dict[str, _Any] = {"node_sets": {}}
+    with _np.load(file_path) as npz_file:
+        for key in npz_file.files:
+            if key.startswith("node_sets/"):
+                data_arrays["node_sets"][key.split("/", 1)[1]] = npz_file[key]
+            else:
+                data_arrays[key] = npz_file[key]
+    return data_arrays
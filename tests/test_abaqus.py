@@ -125,3 +125,34 @@ def test_abaqus_frame(
         input_file.get_input_file_string(normal_definition),
         atol=1e-15,
     )
+
+
+def test_abaqus_write_input_file_blocks(monkeypatch, tmp_path):
+    """Check that the input file is the same when it is written in (small)
+    blocks to a file."""
+
+    mesh = Mesh()
+    mat = AbaqusBeamMaterial("beam_material")
+    line_set = create_beam_mesh_line(
+        mesh, generate_abaqus_beam("B32H"), mat, [0, 0, 0], [1, 2, 3], n_el=20
+    )
+    line_set["line"].name = "beam_elements"
+    mesh.add(line_set["line"])
+
+    input_file = AbaqusInputFile(mesh)
+    input_file_string = input_file.get_input_file_string(
+        AbaqusBeamNormalDefinition.normal_and_extra_node
+    )
+
+    monkeypatch.setattr("beamme.abaqus.input_file.LINES_PER_BLOCK", 3)
+    file_path = tmp_path / "blocks.inp"
+    input_file.write_input_file(file_path)
+    with open(file_path, "r") as file:
+        assert file.read() == input_file_string + "\n"
+
+    lines = input_file_string.split("\n")
+    assert len(lines) == 115
+    assert lines[lines.index("*Elset, elset=beam_elements") + 1 :] == [
+        ", ".join(f"{i:6d}" for i in range(1, 17)),
+        ", ".join(f"{i:6d}" for i in range(17, 21)),
+    ]
@@ -21,9 +21,11 @@
 # THE SOFTWARE.
 """This script is used to test the functionality of the core modules."""
 
+import copy
 import os
 import random
 import warnings
+from xml.etree import ElementTree
 
 import autograd.numpy as npAD
 import numpy as np
@@ -40,7 +42,7 @@ from beamme.core.material import MaterialBeamBase
 from beamme.core.mesh import Mesh
 from beamme.core.node import Node, NodeCosserat
 from beamme.core.rotation import Rotation
-from beamme.core.vtk_writer import VTKWriter
+from beamme.core.vtk_writer import VTKWriter, add_point_data_node_sets_batch
 from beamme.four_c.element_beam import (
     Beam3eb,
     Beam3k,
@@ -313,6 +315,110 @@ def test_mesh_transformations_with_solid(
         )
 
 
+def test_mesh_transformations_node_store(assert_results_equal):
+    """Check that the mesh transformations give the same results with and
+    without the array based node store."""
+
+    rotation = Rotation([1, 2, 3], np.pi * 17.0 / 27.0)
+    rotations = np.array(
+        [Rotation([1, 0.1 * i, 0], 0.1 * i).get_quaternion() for i in range(12)]
+    )
+
+    meshes = []
+    for use_node_store in [False, True]:
+        mesh = Mesh(use_node_store=use_node_store)
+        mat = MaterialReissner(radius=0.05)
+        create_beam_mesh_line(
+            mesh, Beam3rHerm2Line3, mat, [0.2, 0, 0], [0.2, 2 * np.pi, 4], n_el=2
+        )
+
+        mesh.wrap_around_cylinder()
+        mesh.translate([1, 2, 3])
+        mesh.rotate(rotation, origin=[0.1, 0.2, 0.3])
+
+        # Add further nodes after the first transformations, the node store has
+        # to be updated automatically.
+        create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 1, 0], n_el=3)
+        mesh.rotate(rotations)
+        mesh.reflect([0.1, -2, 1], flip_beams=True)
+        meshes.append(mesh)
+
+    assert_results_equal(meshes[0], meshes[1])
+
+    # The nodes in the store are views into the arrays of the store.
+    mesh = meshes[1]
+    node_store = mesh.get_node_store()
+    assert len(node_store) == len(mesh.nodes)
+    for i, node in enumerate(mesh.nodes):
+        assert np.shares_memory(node.coordinates, node_store.coordinates)
+        assert np.array_equal(node.coordinates, node_store.coordinates[i])
+        assert np.array_equal(node.rotation.q, node_store.quaternions[i])
+
+    # Setting the nodal data directly updates the store.
+    mesh.nodes[0].coordinates = [1.0, 2.0, 3.0]
+    mesh.nodes[0].rotation = rotation
+    assert np.array_equal(node_store.coordinates[0], [1.0, 2.0, 3.0])
+    assert np.array_equal(node_store.quaternions[0], rotation.q)
+
+    # In-place modifications of the rotation of a node are written to the store,
+    # copies of the rotation are independent of the store.
+    node_rotation = mesh.nodes[1].rotation
+    rotation_copy = node_rotation.copy()
+    mesh.nodes[1].rotation.q = rotation.q
+    assert np.array_equal(node_store.quaternions[1], rotation.q)
+    assert node_rotation == rotation
+    mesh.nodes[1].rotation.q[:] = rotation_copy.q
+    assert np.array_equal(node_store.quaternions[1], rotation_copy.q)
+    rotation_deep_copy = copy.deepcopy(mesh.nodes[1].rotation)
+    node_store.quaternions[1] = rotation.q
+    assert type(rotation_deep_copy) is Rotation
+    assert rotation_deep_copy == rotation_copy
+    assert not rotation_copy == rotation
+    node_store.quaternions[1] = rotation_copy.q
+
+    # Nodes appended to the mesh are added to the existing node store, the
+    # store is only recreated if nodes are removed.
+    n_nodes = len(mesh.nodes)
+    new_nodes = [NodeCosserat([i, 0, 0], rotation) for i in range(20)]
+    for node in new_nodes[:10]:
+        mesh.add(node)
+        assert mesh.get_node_store() is node_store
+    mesh.nodes.extend(new_nodes[10:])
+    assert mesh.get_node_store() is node_store
+    assert np.array_equal(node_store.coordinates[-1], [19, 0, 0])
+    assert np.array_equal(node_store.quaternions[-20:], [rotation.q] * 20)
+    mesh.add(Node([0, 0, 5]))
+    assert mesh.get_node_store() is node_store
+    assert len(node_store) == n_nodes + 21
+    assert not node_store.is_cosserat[-1]
+    assert np.array_equal(node_store.quaternions[-1], [2, 0, 0, 0])
+    for i, node in enumerate(mesh.nodes):
+        assert np.array_equal(node.coordinates, node_store.coordinates[i])
+    mesh.translate([1.0, 0.0, 0.0])
+    assert np.array_equal(new_nodes[-1].coordinates, [20, 0, 0])
+    mesh.translate([-1.0, 0.0, 0.0])
+    mesh.nodes.remove(new_nodes[0])
+    new_node_store = mesh.get_node_store()
+    assert new_node_store is not node_store
+    assert new_nodes[0]._node_store is None
+    assert len(new_node_store) == n_nodes + 20
+    mesh.nodes = mesh.nodes[:n_nodes]
+    node_store = mesh.get_node_store()
+    assert len(node_store) == n_nodes
+
+    # A copied mesh has its own node store.
+    mesh_copy = mesh.copy()
+    mesh_copy.translate([1.0, 0.0, 0.0])
+    assert np.array_equal(mesh.nodes[0].coordinates, [1.0, 2.0, 3.0])
+    assert np.array_equal(mesh_copy.nodes[0].coordinates, [2.0, 2.0, 3.0])
+
+    # Releasing the store copies the data back to the nodes.
+    node_store.release()
+    assert mesh.nodes[0]._node_store is None
+    assert np.array_equal(mesh.nodes[0].coordinates, [1.0, 2.0, 3.0])
+    assert mesh.nodes[0].rotation == rotation
+
+
 def test_fluid_element_section(
     assert_results_equal,
     get_corresponding_reference_file_path,
@@ -1558,6 +1664,47 @@ def test_vtk_writer(
     assert_results_equal(ref_file, vtk_file)
 
 
+def test_vtk_writer_add_cells(assert_results_equal, tmp_path):
+    """Test that adding multiple cells at once gives the same output as adding
+    them one by one."""
+
+    coordinates = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+    topologies = np.array([[0, 1, 2, 3], [1, 4, 5, 2]])
+    cell_values = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    writer_single = VTKWriter()
+    indices = writer_single.add_points(coordinates[:4])
+    writer_single.add_cell(vtk.vtkQuad, indices, cell_data={"cell": cell_values[0]})
+    indices = writer_single.add_points(
+        coordinates[4:], point_data={"point": ([1, 2], mpy.vtk_type.int)}
+    )
+    writer_single.add_cell(
+        vtk.vtkQuad, topologies[1], cell_data={"cell": cell_values[1]}
+    )
+    writer_single.add_cell(vtk.vtkLine, [0, 4])
+
+    writer_bulk = VTKWriter()
+    writer_bulk.add_points(coordinates[:4])
+    writer_bulk.add_points(
+        coordinates[4:], point_data={"point": (np.array([1, 2]), mpy.vtk_type.int)}
+    )
+    writer_bulk.add_cells(vtk.vtkQuad, topologies, cell_data={"cell": cell_values})
+    writer_bulk.add_cells(vtk.vtkLine, [[0, 4]])
+
+    vtk_files = []
+    for i_writer, writer in enumerate([writer_single, writer_bulk]):
+        writer.complete_data()
+        vtk_files.append(tmp_path / f"writer_{i_writer}.vtu")
+        writer.write_vtk(vtk_files[-1], binary=False)
+    assert_results_equal(vtk_files[0], vtk_files[1])
+
+    # Check the nan values for fields that are not given for all items.
+    point_data = writer_bulk.grid.GetPointData().GetArray("point")
+    assert [point_data.GetValue(i) for i in range(6)] == [-1, -1, -1, -1, 1, 2]
+    cell_data = writer_bulk.grid.GetCellData().GetArray("cell")
+    assert cell_data.GetTuple3(2) == (0.0, 0.0, 0.0)
+
+
 def test_vtk_writer_beam(
     assert_results_equal, get_corresponding_reference_file_path, tmp_path
 ):
@@ -1611,6 +1758,45 @@ def test_vtk_writer_beam(
     assert_results_equal(ref_file, vtk_file, atol=mpy.eps_pos)
 
 
+def test_vtk_writer_beam_batch(assert_results_equal, tmp_path):
+    """Check that the VTK output for multiple beams at once is the same as the
+    one created element by element."""
+
+    mesh = Mesh()
+    mat = MaterialBeamBase(radius=0.05)
+    create_beam_mesh_honeycomb(
+        mesh, Beam3rHerm2Line3, mat, 2.0, 2, 3, n_el=2, add_sets=True
+    )
+    create_beam_mesh_line(
+        mesh,
+        Beam3rLine2Line2,
+        MaterialBeamBase(radius=0.1),
+        [0, 0, 0],
+        [1, 2, 3],
+        n_el=3,
+        vtk_cell_data={"cell_data": (1, mpy.vtk_type.int)},
+    )
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [0, 0, 1], [1, 2, 3], n_el=2)
+
+    # The representation of the mesh is created with the batch evaluation of
+    # consecutive beams of the same type. This also sets the node set links
+    # that are required for the element wise output.
+    vtk_writer_batch, _ = mesh.get_vtk_representation(
+        coupling_sets=True, beam_centerline_visualization_segments=3
+    )
+    vtk_writer_single = VTKWriter()
+    for element in mesh.elements:
+        element.get_vtk(
+            vtk_writer_single, None, beam_centerline_visualization_segments=3
+        )
+    vtk_writer_single.complete_data()
+
+    vtk_files = [tmp_path / "beams_batch.vtu", tmp_path / "beams_single.vtu"]
+    vtk_writer_batch.write_vtk(vtk_files[0], binary=False)
+    vtk_writer_single.write_vtk(vtk_files[1], binary=False)
+    assert_results_equal(vtk_files[0], vtk_files[1])
+
+
 def test_vtk_writer_solid(
     assert_results_equal, get_corresponding_reference_file_path, tmp_path
 ):
@@ -1667,6 +1853,183 @@ def test_vtk_writer_solid_elements(
     assert_results_equal(ref_file, vtk_file)
 
 
+def test_vtk_writer_solid_elements_shared_points(
+    get_corresponding_reference_file_path,
+):
+    """Check that the solid VTK output with shared points contains the same
+    cells and point data as the output with points for each element."""
+
+    _, mesh = import_four_c_model(
+        input_file_path=get_corresponding_reference_file_path(
+            reference_file_base_name="test_vtk_writer_solid_elements",
+            additional_identifier="import",
+        ),
+        convert_input_to_mesh=True,
+    )
+
+    _, vtk_writer_solid = mesh.get_vtk_representation()
+    _, vtk_writer_shared = mesh.get_vtk_representation(solid_shared_points=True)
+    grid = vtk_writer_solid.grid
+    grid_shared = vtk_writer_shared.grid
+
+    n_nodes = len({node for element in mesh.elements for node in element.nodes})
+    assert grid_shared.GetNumberOfPoints() == n_nodes
+    assert grid.GetNumberOfPoints() > n_nodes
+    assert grid_shared.GetNumberOfCells() == grid.GetNumberOfCells()
+
+    point_data = grid.GetPointData()
+    point_data_shared = grid_shared.GetPointData()
+    assert point_data_shared.GetNumberOfArrays() == point_data.GetNumberOfArrays()
+    for i_cell in range(grid.GetNumberOfCells()):
+        assert grid_shared.GetCellType(i_cell) == grid.GetCellType(i_cell)
+        point_ids = grid.GetCell(i_cell).GetPointIds()
+        point_ids_shared = grid_shared.GetCell(i_cell).GetPointIds()
+        for i in range(point_ids.GetNumberOfIds()):
+            point_id = point_ids.GetId(i)
+            point_id_shared = point_ids_shared.GetId(i)
+            assert np.array_equal(
+                grid_shared.GetPoint(point_id_shared), grid.GetPoint(point_id)
+            )
+            for i_array in range(point_data.GetNumberOfArrays()):
+                name = point_data.GetArrayName(i_array)
+                assert point_data_shared.GetArray(name).GetTuple(
+                    point_id_shared
+                ) == point_data.GetArray(name).GetTuple(point_id)
+
+
+def test_vtk_writer_node_set_point_data():
+    """Check the point data for node sets for nodes linked to the adjacency of
+    the mesh and nodes with explicit link lists."""
+
+    mesh = Mesh()
+    mat = MaterialReissner()
+    beam_set_1 = create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0], n_el=2
+    )
+    beam_set_2 = create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [2, 0, 0], n_el=1
+    )
+    mesh.add(beam_set_1, beam_set_2)
+    mesh.couple_nodes(reuse_matching_nodes=True)
+    mesh.get_unique_geometry_sets(link_to_nodes="all_nodes")
+
+    # Add a set to the explicit link list of one node.
+    point_set = GeometrySet(mesh.nodes[1])
+    point_set.i_global = 10
+    mesh.nodes[1].node_sets_link.append(point_set)
+
+    point_data = {}
+    add_point_data_node_sets_batch(
+        point_data, [element.nodes for element in mesh.elements], extra_points=1
+    )
+    # The points of each element are its three nodes and one extra point.
+    nan = mpy.vtk_nan_int
+    assert {name: data.tolist() for name, (data, _) in point_data.items()} == {
+        "geometry_point_set_00001": [nan] * 6 + [1, nan, 1] + [nan] * 3,
+        "geometry_point_set_00002": [1] + [nan] * 11,
+        "geometry_point_set_00003": [nan] * 10 + [1, nan],
+        "geometry_point_set_00004": [nan] * 6 + [1, nan, 1] + [nan] * 3,
+        "geometry_line_set_00001": [1] * 9 + [nan, nan, 1],
+        "geometry_line_set_00002": [nan] * 6 + [1] * 6,
+        "geometry_point_set_00010": [nan, 1] + [nan] * 10,
+    }
+
+
+def test_vtk_writer_pvtu_and_series(
+    get_corresponding_reference_file_path, tmp_path, monkeypatch
+):
+    """Check the partitioned VTK output and the output of a series of
+    configurations."""
+
+    _, mesh = import_four_c_model(
+        input_file_path=get_corresponding_reference_file_path(
+            reference_file_base_name="test_vtk_writer_solid_elements",
+            additional_identifier="import",
+        ),
+        convert_input_to_mesh=True,
+    )
+    create_beam_mesh_line(
+        mesh,
+        Beam3rHerm2Line3,
+        MaterialBeamBase(radius=0.1),
+        [0, 0, 0],
+        [2, 0, 0],
+        n_el=4,
+    )
+
+    def read_vtu(filepath):
+        """Read a vtu file."""
+        reader = vtk.vtkXMLUnstructuredGridReader()
+        reader.SetFileName(str(filepath))
+        reader.Update()
+        return reader.GetOutput()
+
+    # Partitioned output.
+    _, vtk_writer_solid = mesh.get_vtk_representation()
+    grid = vtk_writer_solid.grid
+    mesh.write_vtk(
+        output_name="pieces", output_directory=tmp_path, n_pieces=3, n_threads=2
+    )
+    for suffix in ["beam", "solid"]:
+        sources = [
+            piece.get("Source")
+            for piece in ElementTree.parse(tmp_path / f"pieces_{suffix}.pvtu").iter(
+                "Piece"
+            )
+        ]
+        assert sources == [f"pieces_{suffix}_{i}.vtu" for i in range(3)]
+    pieces = [read_vtu(tmp_path / f"pieces_solid_{i}.vtu") for i in range(3)]
+    assert [piece.GetNumberOfCells() for piece in pieces] == [58, 58, 59]
+    assert sum(piece.GetNumberOfCells() for piece in pieces) == grid.GetNumberOfCells()
+    for piece in pieces:
+        assert piece.GetPointData().GetNumberOfArrays() == (
+            grid.GetPointData().GetNumberOfArrays()
+        )
+        assert piece.GetCellData().GetNumberOfArrays() == (
+            grid.GetCellData().GetNumberOfArrays()
+        )
+
+    # Output of a series of configurations.
+    coordinates = mesh.get_node_store().coordinates.copy()
+    positions = [coordinates + [0, 0, i_step] for i_step in range(3)]
+    mesh.write_vtk_series(
+        positions, "series", tmp_path, times=[0.0, 0.5, 1.0], n_threads=2
+    )
+    assert np.array_equal(mesh.get_node_store().coordinates, coordinates)
+    for suffix in ["beam", "solid"]:
+        datasets = list(
+            ElementTree.parse(tmp_path / f"series_{suffix}.pvd").iter("DataSet")
+        )
+        assert [dataset.get("timestep") for dataset in datasets] == [
+            "0.0",
+            "0.5",
+            "1.0",
+        ]
+        assert [dataset.get("file") for dataset in datasets] == [
+            f"series_{suffix}_{i_step}.vtu" for i_step in range(3)
+        ]
+    for i_step in range(3):
+        bounds = read_vtu(tmp_path / f"series_solid_{i_step}.vtu").GetBounds()
+        assert np.allclose(bounds[4:], np.array(grid.GetBounds()[4:]) + i_step)
+
+    # Partitioned output of a series, the pieces of each step are written by
+    # the thread writing the step.
+    write_pvtu = VTKWriter.write_pvtu
+    pvtu_n_threads = []
+
+    def write_pvtu_spy(self, *args, n_threads=None, **kwargs):
+        """Record the number of threads used to write the pieces."""
+        pvtu_n_threads.append(n_threads)
+        write_pvtu(self, *args, n_threads=n_threads, **kwargs)
+
+    monkeypatch.setattr(VTKWriter, "write_pvtu", write_pvtu_spy)
+    mesh.write_vtk_series(positions, "series_pieces", tmp_path, n_pieces=2, n_threads=2)
+    assert pvtu_n_threads == [1] * 6
+    for i_step in range(3):
+        for i_piece in range(2):
+            assert (tmp_path / f"series_pieces_solid_{i_step}_{i_piece}.vtu").exists()
+
+
 def test_vtk_curve_cell_data(
     assert_results_equal, get_corresponding_reference_file_path, tmp_path
 ):
@@ -1797,6 +2160,70 @@ def test_deep_copy(get_bc_data, assert_results_equal):
     assert_results_equal(mesh, mesh_copy)
 
 
+def test_mesh_replicate(get_bc_data, assert_results_equal):
+    """Test that replicating a mesh gives the same result as copying and
+    transforming it, and that materials and functions are not copied."""
+
+    mat = MaterialReissner(youngs_modulus=1, radius=1)
+    fun = Function("COMPONENT 0 SYMBOLIC_FUNCTION_OF_SPACE_TIME t")
+
+    mesh = Mesh()
+    mesh.add(fun, mat)
+    set1 = create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0])
+    set2 = create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [1, 1, 0])
+    mesh.add(set1)
+    mesh.add(
+        BoundaryCondition(
+            set2["line"], get_bc_data(identifier=1), bc_type=mpy.bc.neumann
+        )
+    )
+    mesh.couple_nodes()
+
+    translations = [[0.0, 0.0, 0.0], [1.0, 2.34535435, 3.345353]]
+    rotations = [
+        Rotation([1, 0.2342342423, -2.234234], np.pi / 15 * 27),
+        Rotation([0, 1, 1], np.pi / 6),
+    ]
+    origin = [0.5, -1.0, 0.25]
+    reflection_normal = [1.0, 2.0, 0.5]
+
+    mesh_ref = Mesh()
+    for translation, rotation in zip(translations, rotations):
+        mesh_copy = mesh.copy()
+        mesh_copy.reflect(reflection_normal, origin=origin, flip_beams=True)
+        mesh_copy.rotate(rotation, origin=origin)
+        mesh_copy.translate(translation)
+        mesh_ref.add(mesh_copy)
+
+    mesh_replicated = mesh.replicate(
+        translations,
+        rotations=[rotation.get_quaternion() for rotation in rotations],
+        origin=origin,
+        reflection_normal=reflection_normal,
+        flip_beams=True,
+    )
+    assert mesh_replicated.materials == [mat]
+    assert mesh_replicated.functions == [fun]
+    assert len(mesh_replicated.nodes) == 2 * len(mesh.nodes)
+    assert set(mesh_replicated.nodes).isdisjoint(mesh.nodes)
+    assert set(mesh_replicated.elements).isdisjoint(mesh.elements)
+
+    # The geometry sets of each copy contain the items of that copy.
+    n_elements = len(mesh.elements)
+    for i_copy, bc in enumerate(
+        mesh_replicated.boundary_conditions[mpy.bc.neumann, mpy.geo.line]
+    ):
+        assert (
+            bc.geometry_set.get_geometry_objects()
+            == (
+                mesh_replicated.elements[
+                    i_copy * n_elements + 1 : (i_copy + 1) * n_elements
+                ]
+            )
+        )
+    assert_results_equal(mesh_ref, mesh_replicated)
+
+
 def test_mesh_add_checks():
     """This test checks that Mesh raises an error when double objects are added
     to the mesh."""
@@ -1834,6 +2261,189 @@ def test_mesh_add_checks():
         mesh.add(geometry_set)
 
 
+def test_mesh_node_element_index():
+    """Test that the index of the node and element lists in the mesh is kept
+    consistent when the mesh is modified."""
+
+    mesh = Mesh()
+    nodes = [Node([i, 0.0, 0.0]) for i in range(6)]
+    mesh.add(nodes[:3])
+    mesh.nodes.append(nodes[3])
+    mesh.nodes.extend(nodes[4:])
+    element = Beam(nodes=nodes[:2])
+    mesh.add(element)
+
+    assert all(node in mesh.nodes for node in nodes)
+    assert [mesh.nodes.index(node) for node in nodes] == list(range(6))
+    assert element in mesh.elements
+    assert Node([0.0, 0.0, 0.0]) not in mesh.nodes
+
+    # Adding a list that contains an existing node does not modify the mesh.
+    with pytest.raises(ValueError, match="already existing in the Mesh"):
+        mesh.add([Node([0.0, 0.0, 0.0]), nodes[2]])
+    assert len(mesh.nodes) == 6
+
+    # Replace a node and check the index.
+    mesh.replace_node(nodes[2], nodes[0])
+    assert nodes[2] not in mesh.nodes
+    remaining_nodes = [node for node in nodes if node is not nodes[2]]
+    assert [mesh.nodes.index(node) for node in remaining_nodes] == list(range(5))
+    with pytest.raises(ValueError, match="not in the mesh"):
+        mesh.replace_node(nodes[2], nodes[0])
+
+    # Deleting single nodes keeps the positions of the other nodes, also for
+    # nodes added afterwards.
+    positions = mesh.nodes._positions
+    mesh.replace_node(nodes[4], nodes[0])
+    new_node = Node([6.0, 0.0, 0.0])
+    mesh.nodes.append(new_node)
+    del mesh.nodes[1]
+    assert mesh.nodes._positions is positions
+    remaining_nodes = [nodes[0], nodes[3], nodes[5], new_node]
+    assert list(mesh.nodes) == remaining_nodes
+    assert [mesh.nodes.index(node) for node in remaining_nodes] == list(range(4))
+
+    # Setting the lists directly and copying the mesh keeps the index.
+    mesh.nodes = nodes[::-1]
+    assert mesh.nodes.index(nodes[0]) == 5
+    mesh_copy = mesh.copy()
+    assert all(node in mesh_copy.nodes for node in mesh_copy.elements[0].nodes)
+    assert all(node not in mesh_copy.nodes for node in nodes)
+    assert mesh_copy.nodes.index(mesh_copy.nodes[1]) == 1
+
+
+def test_mesh_geometry_set_and_boundary_condition_index():
+    """Test that the geometry sets and boundary conditions are numbered in the
+    order they are added to the mesh, also when they are stored in hashed
+    containers."""
+
+    mesh = Mesh()
+    nodes = [Node([i, 0.0, 0.0]) for i in range(4)]
+    mesh.add(nodes)
+    geometry_sets = [GeometrySet(node) for node in nodes]
+    mesh.add(geometry_sets[1], geometry_sets[3])
+    for geometry_set in [geometry_sets[2], geometry_sets[1], geometry_sets[0]]:
+        mesh.add(BoundaryCondition(geometry_set, {}, bc_type=mpy.bc.dirichlet))
+
+    with pytest.raises(ValueError, match="already in this container"):
+        mesh.add(geometry_sets[1])
+
+    unique_geometry_sets = mesh.get_unique_geometry_sets()
+    assert unique_geometry_sets[mpy.geo.point] == [
+        geometry_sets[i] for i in [1, 3, 2, 0]
+    ]
+    assert [geometry_set.i_global for geometry_set in geometry_sets] == [4, 1, 3, 2]
+    assert len(mesh.geometry_sets[mpy.geo.point]) == 2
+
+
+def test_mesh_node_links():
+    """Test the links from the nodes to the elements and geometry sets, also
+    after the topology of the mesh changed."""
+
+    mesh = Mesh()
+    mat = MaterialReissner()
+    beam_set_1 = create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0], n_el=2
+    )
+    beam_set_2 = create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [2, 0, 0], n_el=1
+    )
+    mesh.add(beam_set_1, beam_set_2)
+    mesh.set_node_links()
+    mesh.get_unique_geometry_sets(link_to_nodes="all_nodes")
+
+    elements = mesh.elements
+    end_node = beam_set_1["end"].get_points()[0]
+    assert end_node.element_link == [elements[1]]
+    assert end_node.node_sets_link == [beam_set_1["end"], beam_set_1["line"]]
+    assert mesh.nodes[2].element_link == elements[:2]
+    assert end_node.mesh is mesh
+
+    # Replace the start node of the second beam, the links have to be updated.
+    mesh.couple_nodes(reuse_matching_nodes=True)
+    assert len(mesh.nodes) == 7
+    mesh.set_node_links()
+    mesh.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
+    assert end_node.element_link == [elements[1], elements[2]]
+    assert end_node.node_sets_link == [
+        beam_set_1["end"],
+        beam_set_2["start"],
+    ]
+
+    # Nodes added directly to the node list and nodes replaced in a single
+    # element also have to update the links.
+    new_node = NodeCosserat([1, 0, 0], Rotation())
+    mesh.nodes.append(new_node)
+    mesh.set_node_links()
+    assert new_node.mesh is mesh
+    assert new_node.element_link == []
+    elements[2].replace_node(end_node, new_node)
+    mesh.set_node_links()
+    assert end_node.element_link == [elements[1]]
+    assert new_node.element_link == [elements[2]]
+
+    # Adding a link to a single node does not change the links of other nodes.
+    mesh.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
+    other_node = beam_set_1["start"].get_points()[0]
+    other_node_sets_link = other_node.node_sets_link.copy()
+    point_set = GeometrySet(end_node)
+    point_set.link_to_nodes()
+    assert end_node.node_sets_link[-1] is point_set
+    assert other_node.node_sets_link == other_node_sets_link
+
+    # The links to the geometry sets are only recreated if a geometry set
+    # changed.
+    key = ("_node_sets_link", "explicitly_contained_nodes")
+    mesh.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
+    adjacency = mesh._node_adjacencies[key][1]
+    mesh.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
+    assert mesh._node_adjacencies[key][1] is adjacency
+    assert new_node.node_sets_link == []
+    beam_set_2["end"].add(new_node)
+    mesh.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
+    assert mesh._node_adjacencies[key][1] is not adjacency
+    assert new_node.node_sets_link == [beam_set_2["end"]]
+
+    mesh.unlink_nodes()
+    assert end_node.element_link == []
+    assert end_node.node_sets_link == []
+    assert end_node.mesh is None
+
+
+def test_mesh_replace_nodes():
+    """Test that multiple nodes are replaced in the elements, geometry sets
+    and nodes of a mesh at once."""
+
+    mesh = Mesh()
+    mat = MaterialReissner()
+    beam_sets = [
+        create_beam_mesh_line(
+            mesh, Beam3rHerm2Line3, mat, [i, 0, 0], [i + 1, 0, 0], n_el=1
+        )
+        for i in range(3)
+    ]
+    for beam_set in beam_sets:
+        mesh.add(beam_set)
+    start_nodes = [beam_set["start"].get_points()[0] for beam_set in beam_sets]
+    end_nodes = [beam_set["end"].get_points()[0] for beam_set in beam_sets]
+
+    with pytest.raises(ValueError, match="can not be replaced itself"):
+        mesh.replace_nodes({start_nodes[1]: end_nodes[0], end_nodes[0]: start_nodes[2]})
+
+    mesh.replace_nodes({start_nodes[1]: end_nodes[0], start_nodes[2]: end_nodes[1]})
+    assert len(mesh.nodes) == 7
+    assert start_nodes[1] not in mesh.nodes
+    assert mesh.elements[1].nodes[0] is end_nodes[0]
+    assert mesh.elements[2].nodes[0] is end_nodes[1]
+    assert beam_sets[2]["start"].get_points() == [end_nodes[1]]
+    assert start_nodes[2].get_master_node() is end_nodes[1]
+
+    # There are no coincident nodes left in the mesh.
+    mesh.couple_nodes(reuse_matching_nodes=True)
+    assert len(mesh.nodes) == 7
+    assert len(mesh.boundary_conditions[mpy.bc.point_coupling, mpy.geo.point]) == 0
+
+
 def test_check_two_couplings(
     assert_results_equal, get_corresponding_reference_file_path
 ):
@@ -2020,3 +2630,4 @@ def test_display_pyvista(get_corresponding_reference_file_path):
     )
 
     mesh.display_pyvista(resolution=3)
+    mesh.display_pyvista(resolution=3, solid_shared_points=False)
@@ -26,8 +26,11 @@ import pytest
 import pyvista as pv
 import quaternion
 
+from beamme.core.conf import mpy
+from beamme.core.mesh import Mesh
+from beamme.core.node import Node
 from beamme.core.rotation import Rotation
-from beamme.cosserat_curve.cosserat_curve import CosseratCurve
+from beamme.cosserat_curve.cosserat_curve import CosseratCurve, slerp_evaluate
 from beamme.cosserat_curve.warping_along_cosserat_curve import (
     create_transform_boundary_conditions,
     get_mesh_transformation,
@@ -140,6 +143,64 @@ def test_cosserat_curve_translate_and_rotate(
     assert np.allclose(sol_full_q, get_compare_rot_with_twist("q_full_ref"), rtol=1e-14)
 
 
+def test_cosserat_curve_evaluation_cache(get_corresponding_reference_file_path):
+    """Test that the configurations of the curve are cached and the evaluation
+    does not depend on the order of the evaluation points."""
+
+    curve = load_cosserat_curve_from_file(get_corresponding_reference_file_path)
+
+    configuration = curve.get_configuration(0.5)
+    assert curve.get_configuration(0.5) is configuration
+    assert curve.get_configuration(1.0)[0] is curve.coordinates
+
+    t = np.array([25.0, -10.0, 3.0, 0.0, 12.5, 7.0])
+    pos, q = curve.get_centerline_positions_and_rotations(t, factor=0.5)
+    for i, t_point in enumerate(t):
+        pos_point, q_point = curve.get_centerline_position_and_rotation(
+            t_point, factor=0.5
+        )
+        assert np.allclose(pos[i], pos_point, rtol=0.0, atol=1e-14)
+        assert q[i] == q_point
+
+    # Changing the curve resets the cache.
+    curve.translate([1.0, 0.0, 0.0])
+    assert curve.get_configuration(0.5) is not configuration
+    assert np.allclose(
+        curve.get_centerline_positions_and_rotations(t, factor=0.5)[0],
+        pos + [1.0, 0.0, 0.0],
+        rtol=0.0,
+        atol=1e-12,
+    )
+
+
+def test_cosserat_curve_slerp_evaluate():
+    """Test that the vectorized slerp interpolation matches
+    quaternion.slerp_evaluate, also for quaternions with a negative inner
+    product."""
+
+    q1 = quaternion.from_rotation_vector([[0.1, 0.2, 0.3], [0.5, -0.1, 0.2]])
+    q2 = quaternion.from_rotation_vector([[0.3, 0.1, -0.2], [-0.4, 0.3, 0.1]])
+    tau = np.array([0.3, 0.7])
+    for sign in [1, -1]:
+        q_interpolated = slerp_evaluate(q1, sign * q2, tau)
+        for i in range(len(tau)):
+            assert np.allclose(
+                quaternion.as_float_array(q_interpolated[i]),
+                quaternion.as_float_array(
+                    quaternion.slerp_evaluate(q1[i], sign * q2[i], tau[i])
+                ),
+                rtol=0.0,
+                atol=1e-14,
+            )
+
+    assert np.allclose(
+        quaternion.as_float_array(slerp_evaluate(q1[0], -q2[0], 0.3)),
+        [0.99030476, 0.08026669, 0.08511946, 0.07488944],
+        rtol=0.0,
+        atol=1e-8,
+    )
+
+
 def test_cosserat_curve_bad_guess_triad(get_corresponding_reference_file_path):
     """Check that an error is thrown for a bad guess triad."""
     with pytest.raises(ValueError):
@@ -216,6 +277,93 @@ def test_cosserat_curve_mesh_transformation(
     )
 
 
+def test_cosserat_curve_mesh_transformation_per_node(
+    get_corresponding_reference_file_path,
+):
+    """Compare the vectorized get_mesh_transformation function with a per-node
+    evaluation of the transformation."""
+
+    curve = load_cosserat_curve_from_file(get_corresponding_reference_file_path)
+    pos, _ = curve.get_centerline_position_and_rotation(0)
+    curve.translate(-pos)
+    curve.translate([1, 2, 3])
+
+    origin = np.array([0.5, 1.0, -1.0])
+    reference_rotation = Rotation([0, 0, 1], -0.5 * np.pi) * Rotation(
+        [0, 1, 0], -0.5 * np.pi
+    )
+    reference_quaternion = reference_rotation.get_numpy_quaternion()
+
+    # Small mesh with beam nodes and nodes without rotations, some of them
+    # sharing the same arc length.
+    mesh = Mesh()
+    create_beam_mesh_helix(
+        mesh,
+        Beam3rHerm2Line3,
+        MaterialReissner(radius=0.05),
+        [0, 0, 1],
+        [0, 0, 0],
+        [0.2, 0, 0],
+        helix_angle=0.4,
+        turns=1,
+        n_el=2,
+    )
+    mesh.add(
+        Node([0.1, 0.2, 0.3]),
+        Node([-0.1, 0.2, 0.3]),
+        Node([0.3, -0.1, 1.2]),
+    )
+
+    n_steps = 3
+    pos, rot = get_mesh_transformation(
+        curve,
+        mesh.nodes,
+        origin=origin,
+        reference_rotation=reference_rotation,
+        n_steps=n_steps,
+    )
+
+    # Evaluate the transformation for each node and step individually.
+    curve_start_pos, curve_start_rot = curve.get_centerline_position_and_rotation(0.0)
+    for i_step, factor in enumerate(np.linspace(0.0, 1.0, n_steps + 1)):
+        rigid_body_rotation = quaternion.slerp_evaluate(
+            reference_quaternion, curve_start_rot, factor
+        )
+        for i_node, node in enumerate(mesh.nodes):
+            local_coordinates = reference_rotation.inv() * (node.coordinates - origin)
+            centerline_pos, centerline_rot = curve.get_centerline_position_and_rotation(
+                local_coordinates[0], factor=factor
+            )
+            centerline_relative_pos = quaternion.rotate_vectors(
+                curve_start_rot.conjugate(), centerline_pos - curve_start_pos
+            )
+            centerline_relative_rot = curve_start_rot.conjugate() * centerline_rot
+            node_pos = (
+                quaternion.rotate_vectors(
+                    rigid_body_rotation,
+                    centerline_relative_pos
+                    + quaternion.rotate_vectors(
+                        centerline_relative_rot, [0.0, *local_coordinates[1:]]
+                    ),
+                )
+                + origin
+                + factor * (curve_start_pos - origin)
+            )
+            node_rot = (
+                rigid_body_rotation
+                * centerline_relative_rot
+                * reference_quaternion.conjugate()
+            )
+
+            assert np.allclose(pos[i_step, i_node], node_pos, rtol=0.0, atol=1e-12)
+            assert np.allclose(
+                quaternion.as_float_array(rot[i_step, i_node]),
+                quaternion.as_float_array(node_rot),
+                rtol=0.0,
+                atol=1e-12,
+            )
+
+
 def test_cosserat_curve_mesh_warp(
     get_corresponding_reference_file_path,
     assert_results_equal,
@@ -273,3 +421,67 @@ def test_cosserat_curve_mesh_warp_transform_boundary_conditions(
     assert_results_equal(
         get_corresponding_reference_file_path(), mesh, rtol=1e-8, atol=1e-8
     )
+
+
+def test_cosserat_curve_mesh_warp_transform_boundary_conditions_compact(
+    get_corresponding_reference_file_path,
+):
+    """Test that the compact transform boundary conditions prescribe the same
+    displacements as the default ones with fewer functions."""
+
+    curve = load_cosserat_curve_from_file(get_corresponding_reference_file_path)
+    pos, _ = curve.get_centerline_position_and_rotation(0)
+    curve.translate(-pos)
+    curve.translate([1, 2, 3])
+
+    mesh = create_beam_solid_input_file(get_corresponding_reference_file_path)
+
+    def get_prescribed_displacements(compact):
+        """Return the prescribed displacement values for each node and the
+        number of created functions and boundary conditions."""
+        mesh_bc = Mesh()
+        create_transform_boundary_conditions(
+            mesh_bc,
+            curve,
+            nodes=mesh.nodes,
+            n_steps=3,
+            compact=compact,
+            origin=[2, 3, 0.5],
+            reference_rotation=(
+                Rotation([0, 0, 1], -0.5 * np.pi) * Rotation([0, 1, 0], -0.5 * np.pi)
+            ),
+        )
+        bcs = mesh_bc.boundary_conditions[mpy.bc.dirichlet, mpy.geo.point]
+        displacements = {}
+        for bc in bcs:
+            for node in bc.geometry_set.get_all_nodes():
+                # Evaluate the functions at the reference coordinates of the
+                # node, the padding of the interpolation values is skipped.
+                values = []
+                for fun in bc.data["FUNCT"]:
+                    variables = {
+                        variable["NAME"]: np.array(variable["VALUES"][1:-1])
+                        for variable in fun.data[1:]
+                    }
+                    if compact:
+                        variables.update(zip("xyz", node.coordinates))
+                        values.append(
+                            eval(
+                                fun.data[0]["SYMBOLIC_FUNCTION_OF_SPACE_TIME"],
+                                variables,
+                            )
+                        )
+                    else:
+                        values.append(variables["var"])
+                assert node not in displacements
+                displacements[node] = values
+        return displacements, len(mesh_bc.functions), len(bcs)
+
+    displacements_ref, n_functions_ref, n_bcs_ref = get_prescribed_displacements(False)
+    displacements, n_functions, n_bcs = get_prescribed_displacements(True)
+    assert (n_functions_ref, n_bcs_ref) == (3 * len(mesh.nodes), len(mesh.nodes))
+    assert (n_functions_ref, n_bcs_ref) == (297, 99)
+    assert (n_functions, n_bcs) == (63, 21)
+    assert displacements.keys() == displacements_ref.keys()
+    for node, values in displacements.items():
+        assert np.allclose(values, displacements_ref[node], rtol=0.0, atol=1e-10)
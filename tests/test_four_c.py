@@ -37,7 +37,10 @@ from beamme.four_c.element_beam import Beam3rHerm2Line3
 from beamme.four_c.input_file import InputFile
 from beamme.four_c.locsys_condition import LocSysCondition
 from beamme.four_c.material import MaterialReissner
-from beamme.four_c.model_importer import import_four_c_model
+from beamme.four_c.model_importer import (
+    import_four_c_model,
+    import_four_c_model_data,
+)
 from beamme.four_c.solid_shell_thickness_direction import (
     get_visualization_third_parameter_direction_hex8,
     set_solid_shell_thickness_direction,
@@ -760,3 +763,94 @@ def test_four_c_import_non_consecutive_geometry_sets(
         ),
         input_file,
     )
+
+
+def test_four_c_import_model_data(get_corresponding_reference_file_path):
+    """Test that the array based import of a 4C input file gives the same mesh
+    as the full import."""
+
+    input_file_path = get_corresponding_reference_file_path(
+        reference_file_base_name="test_create_cubit_input_tube"
+    )
+    input_file_ref, mesh_ref = import_four_c_model(
+        input_file_path=input_file_path, convert_input_to_mesh=True
+    )
+    input_file, mesh_data = import_four_c_model_data(input_file_path)
+
+    assert input_file.sections.keys() == input_file_ref.sections.keys()
+    assert mesh_data.node_coordinates.shape == (66, 3)
+    assert mesh_data.n_elements == 20
+
+    # The mesh is only created once.
+    mesh = mesh_data.mesh
+    assert mesh is mesh_data.mesh
+
+    assert np.allclose(
+        [node.coordinates for node in mesh.nodes],
+        [node.coordinates for node in mesh_ref.nodes],
+        rtol=0.0,
+        atol=1e-14,
+    )
+    for element, element_ref in zip(mesh.elements, mesh_ref.elements, strict=True):
+        assert type(element) is type(element_ref)
+        assert element.data == element_ref.data
+        assert [mesh.nodes.index(node) for node in element.nodes] == [
+            mesh_ref.nodes.index(node) for node in element_ref.nodes
+        ]
+    for geometry_key, geometry_sets_ref in mesh_ref.geometry_sets.items():
+        assert [
+            [mesh.nodes.index(node) for node in geometry_set.get_all_nodes()]
+            for geometry_set in mesh.geometry_sets[geometry_key]
+        ] == [
+            [mesh_ref.nodes.index(node) for node in geometry_set.get_all_nodes()]
+            for geometry_set in geometry_sets_ref
+        ]
+    for bc_key, boundary_conditions_ref in mesh_ref.boundary_conditions.items():
+        assert [bc.data for bc in mesh.boundary_conditions[bc_key]] == [
+            bc.data for bc in boundary_conditions_ref
+        ]
+
+
+def test_four_c_input_file_stream_mesh_sections(
+    get_corresponding_reference_file_path, assert_results_equal, tmp_path
+):
+    """Test that streaming the nodes and elements to the input file gives the
+    same input file as the default dump."""
+
+    # Use a small chunk size to test the chunk wise output.
+    mpy.input_file_stream_chunk_size = 3
+
+    input_files = []
+    for stream_mesh_sections in [False, True]:
+        input_file, _ = import_four_c_model(
+            input_file_path=get_corresponding_reference_file_path(
+                reference_file_base_name="4C_input_solid_cuboid"
+            )
+        )
+
+        material = MaterialReissner()
+        for i in range(2):
+            mesh = Mesh()
+            beam_set = create_beam_mesh_line(
+                mesh, Beam3rHerm2Line3, material, [0, 0, i], [1, 2, 3], n_el=4
+            )
+            mesh.add(
+                BoundaryCondition(
+                    beam_set["start"],
+                    {"NUMDOF": 9, "ONOFF": [1] * 9, "VAL": [0] * 9, "FUNCT": [0] * 9},
+                    bc_type=mpy.bc.dirichlet,
+                )
+            )
+            # The second mesh is streamed automatically, since the nodes and
+            # elements of the first one are streamed.
+            input_file.add(mesh, stream_mesh_sections=stream_mesh_sections and i == 0)
+
+        input_files.append(tmp_path / f"stream_{stream_mesh_sections}.4C.yaml")
+        input_file.dump(
+            input_files[-1],
+            add_header_information=False,
+            add_footer_application_script=False,
+            validate=False,
+        )
+
+    assert_results_equal(input_files[0], input_files[1])
@@ -38,6 +38,8 @@ from beamme.geometric_search.find_close_points import (
     point_partners_to_partner_indices,
     point_partners_to_unique_indices,
 )
+from beamme.geometric_search.scipy import pairs_to_partner_list
+from beamme.geometric_search.spatial_index import SpatialIndex
 from beamme.mesh_creation_functions.applications.beam_honeycomb import (
     create_beam_mesh_honeycomb_flat,
 )
@@ -82,8 +84,8 @@ def assert_unique_id_coordinates(
     assert np.max(np.linalg.norm(coords - reconstructed_coords, axis=1)) <= tol
 
     # Check the IDs
-    assert unique_indices == unique_indices_ref
-    assert inverse_indices == inverse_indices_ref
+    assert np.array_equal(unique_indices, unique_indices_ref)
+    assert np.array_equal(inverse_indices, inverse_indices_ref)
 
 
 @pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
@@ -426,7 +428,9 @@ def test_find_close_points_binning_flat(algorithm):
         has_partners, n_partner = partner_indices_to_point_partners(partners, n_points)
 
         # Compare results with the reference.
-        assert partners == reference_partners
+        assert len(partners) == len(reference_partners)
+        for partner, reference_partner in zip(partners, reference_partners):
+            assert np.array_equal(partner, reference_partner)
         assert list(has_partners) == reference_partners_list
         assert n_partner == 66
 
@@ -549,6 +553,99 @@ def test_find_close_points_tolerance_precision(algorithm):
     assert np.array_equal(has_partner, [0, 0, 1, 1])
 
 
+def test_find_close_points_pairs_to_partner_list():
+    """Test that transitively connected pairs are merged into one cluster and
+    the clusters are numbered in the order of their first point."""
+
+    # The clusters of the pairs (3, 5) and (1, 2) are merged by the pair
+    # (2, 5).
+    pairs = np.array([[6, 7], [3, 5], [1, 2], [2, 5], [0, 8]])
+    point_partners, n_partners = pairs_to_partner_list(pairs, 10)
+    assert np.array_equal(point_partners, [0, 1, 1, 1, -1, 1, 2, 2, 0, -1])
+    assert n_partners == 3
+
+    partner_indices = point_partners_to_partner_indices(point_partners, n_partners)
+    assert [list(partners) for partners in partner_indices] == [
+        [0, 8],
+        [1, 2, 3, 5],
+        [6, 7],
+    ]
+    assert np.array_equal(
+        partner_indices_to_point_partners(partner_indices, 10)[0], point_partners
+    )
+
+    unique_indices, inverse_indices = point_partners_to_unique_indices(point_partners)
+    assert np.array_equal(unique_indices, [0, 1, 4, 6, 9])
+    assert np.array_equal(inverse_indices, [0, 1, 1, 1, 2, 1, 3, 3, 0, 4])
+
+    # Point clouds without partners.
+    assert point_partners_to_partner_indices([-1, -1, -1], 0) == []
+    assert np.array_equal(partner_indices_to_point_partners([], 3)[0], [-1, -1, -1])
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_spatial_index(algorithm):
+    """Test the queries of the spatial index after inserting and removing
+    points."""
+
+    rng = np.random.default_rng(seed=1)
+    spatial_index = SpatialIndex(rng.random((300, 3)), algorithm=algorithm)
+    query_points = rng.random((20, 3))
+
+    def check_queries():
+        """Compare the queries with a brute force search."""
+        ids = spatial_index.ids
+        assert len(spatial_index) == len(ids)
+        distances = np.linalg.norm(
+            query_points[:, np.newaxis] - spatial_index.coordinates, axis=2
+        )
+
+        for i_point, result in enumerate(spatial_index.query_radius(query_points, 0.2)):
+            assert np.array_equal(result, ids[distances[i_point] <= 0.2])
+
+        knn_distances, knn_ids = spatial_index.query_knn(query_points, 4)
+        nearest = np.argsort(distances, axis=1)[:, :4]
+        assert np.allclose(
+            knn_distances,
+            np.take_along_axis(distances, nearest, axis=1),
+            rtol=0.0,
+            atol=1e-14,
+        )
+        assert np.array_equal(knn_ids, ids[nearest])
+
+    for _ in range(3):
+        new_ids = spatial_index.insert(rng.random((40, 3)))
+        assert new_ids[-1] == len(spatial_index._coordinates) - 1
+        spatial_index.remove(spatial_index.ids[::9])
+        check_queries()
+
+    # Insert single points, the internal arrays grow with a doubling capacity.
+    n_ids = len(spatial_index._coordinates)
+    for i_point, point in enumerate(rng.random((30, 3))):
+        assert spatial_index.insert([point]) == [n_ids + i_point]
+        if i_point % 10 == 0:
+            spatial_index.remove([n_ids + i_point])
+        check_queries()
+    assert len(spatial_index._coordinates_buffer) < 2 * len(spatial_index._coordinates)
+
+    # Split the queries of the brute force search into chunks.
+    spatial_index.max_brute_force_entries = 1000
+    check_queries()
+
+    with pytest.raises(ValueError, match="Only points that are in the index"):
+        spatial_index.remove([0])
+
+    # Find close points within the index.
+    spatial_index = SpatialIndex(algorithm=algorithm)
+    spatial_index.insert([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    spatial_index.insert([[1.0, 0.0, 1e-10], [3.0, 0.0, 0.0]])
+    spatial_index.remove([0])
+    ids, has_partner, n_partner = spatial_index.find_close_points()
+    assert np.array_equal(ids, [1, 2, 3, 4])
+    assert list(has_partner) == [0, -1, 0, -1]
+    assert n_partner == 1
+
+
 @pytest.mark.performance
 def test_performance_find_close_points_brute_force_cython(
     evaluate_execution_time,
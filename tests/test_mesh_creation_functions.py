@@ -55,6 +55,7 @@ from beamme.mesh_creation_functions.beam_node_continuation import (
     create_beam_mesh_line_at_node,
 )
 from beamme.mesh_creation_functions.beam_parametric_curve import (
+    ArcLengthTable,
     create_beam_mesh_parametric_curve,
 )
 from beamme.mesh_creation_functions.beam_splinepy import (
@@ -736,6 +737,64 @@ def test_mesh_creation_functions_element_length_option(
     )
 
 
+def test_mesh_creation_functions_generic_vectorized():
+    """Test that the vectorized function generator in the generic mesh creation
+    function gives the same results as the scalar one."""
+
+    rotation = Rotation([1, 2, 3], 0.3)
+    radius = 2.0
+
+    def get_geometry(alpha, beta, xi):
+        """Return the arc geometry for the given parameter coordinates."""
+        phi = 0.5 * (1 - xi) * alpha + 0.5 * (1 + xi) * beta
+        pos = radius * np.array([np.sin(phi), 1.0 - np.cos(phi), 0.0])
+        return pos, rotation * Rotation([0, 0, 1], phi), phi * radius
+
+    def function_generator(alpha, beta):
+        """Scalar version of the arc geometry."""
+        return lambda xi: get_geometry(alpha, beta, xi)
+
+    def function_generator_vectorized(alpha, beta, xi):
+        """Vectorized version of the arc geometry."""
+        values = [get_geometry(a, b, x) for a, b, x in zip(alpha, beta, xi)]
+        return (
+            np.array([value[0] for value in values]),
+            np.array([value[1].get_quaternion() for value in values]),
+            np.array([value[2] for value in values]),
+        )
+
+    meshes = []
+    for generator_kwargs in [
+        {"function_generator": function_generator},
+        {"function_generator_vectorized": function_generator_vectorized},
+    ]:
+        mesh = Mesh()
+        start_node = NodeCosserat(
+            [0, 0, 0], rotation * Rotation([1, 0, 0], 0.2), arc_length=1.0
+        )
+        mesh.add(start_node)
+        create_beam_mesh_generic(
+            mesh,
+            beam_class=Beam3rHerm2Line3,
+            material=MaterialReissner(),
+            interval=[0.0, 1.5],
+            n_el=4,
+            start_node=start_node,
+            set_nodal_arc_length=True,
+            nodal_arc_length_offset=1.0,
+            **generator_kwargs,
+        )
+        meshes.append(mesh)
+
+    assert len(meshes[0].nodes) == len(meshes[1].nodes) == 9
+    assert meshes[1].nodes[0] is meshes[1].elements[0].nodes[0]
+    for node_ref, node in zip(*[mesh.nodes for mesh in meshes]):
+        assert np.allclose(node_ref.coordinates, node.coordinates, rtol=0, atol=1e-14)
+        assert node_ref.rotation == node.rotation
+        assert np.isclose(node_ref.arc_length, node.arc_length, rtol=0, atol=1e-14)
+        assert node_ref.is_middle_node == node.is_middle_node
+
+
 def test_mesh_creation_functions_argument_checks():
     """Test that wrong input values leads to failure."""
 
@@ -1226,6 +1285,75 @@ def test_mesh_creation_functions_curve_3d_helix_length(assert_results_equal):
     assert_results_equal(mesh_1, mesh_2)
 
 
+def test_mesh_creation_functions_curve_arc_length_table():
+    """Test the tabulated arc length along a parametric curve with a
+    parametrization that is not proportional to the arc length."""
+
+    def ds(t):
+        """Increment along the curve r(t) = [t**2, 0, 0]."""
+        return 2.0 * abs(t)
+
+    arc_lengths = np.array([0.0, 0.5, 1.5, 3.0, 4.0])
+    t_ref = np.sqrt(arc_lengths)
+
+    # Positive direction of the parameter coordinate.
+    table = ArcLengthTable(ds, 0.0, 2.0)
+    assert np.isclose(table.length, 4.0, rtol=1e-14, atol=0.0)
+    assert np.allclose(table.get_t(arc_lengths), t_ref, rtol=1e-12, atol=1e-14)
+    assert np.isclose(table.get_t(1.0), 1.0, rtol=1e-12, atol=0.0)
+
+    # Negative direction of the parameter coordinate.
+    table = ArcLengthTable(ds, 0.0, -2.0)
+    assert np.isclose(table.length, 4.0, rtol=1e-14, atol=0.0)
+    assert np.allclose(table.get_t(arc_lengths), -t_ref, rtol=1e-12, atol=1e-14)
+
+
+def test_mesh_creation_functions_curve_vectorized_evaluation():
+    """Test that a parametric curve that supports arrays of parameter
+    coordinates is evaluated for all nodes at once and gives the same beam as
+    a curve that is evaluated for each node."""
+
+    helix = create_helix_function(
+        2.0, 4.0, transformation_factor=2.0, number_of_turns=1
+    )
+    array_evaluations = []
+
+    def helix_vectorized(t):
+        """Helix function that supports arrays of parameter coordinates."""
+        if np.ndim(t) > 0:
+            array_evaluations.append(np.size(t))
+        return helix(t)
+
+    def helix_scalar(t):
+        """Helix function that only supports a single parameter coordinate."""
+        if np.ndim(t) > 0:
+            raise TypeError("Only scalar parameter coordinates are supported")
+        return helix(t)
+
+    meshes = []
+    for function in (helix_vectorized, helix_scalar):
+        mesh = Mesh()
+        create_beam_mesh_parametric_curve(
+            mesh,
+            Beam3rHerm2Line3,
+            MaterialReissner(),
+            function,
+            [0.0, 2.0 * np.pi],
+            n_el=5,
+        )
+        meshes.append(mesh)
+
+    assert 11 in array_evaluations
+    assert np.allclose(
+        get_nodal_coordinates(meshes[0].nodes),
+        get_nodal_coordinates(meshes[1].nodes),
+        rtol=0.0,
+        atol=1e-12,
+    )
+    for node_vectorized, node_scalar in zip(meshes[0].nodes, meshes[1].nodes):
+        assert node_vectorized.rotation == node_scalar.rotation
+
+
 def test_mesh_creation_functions_curve_2d_sin(
     assert_results_equal, get_corresponding_reference_file_path
 ):
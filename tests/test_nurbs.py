@@ -25,6 +25,8 @@ import numpy as np
 import splinepy
 
 from beamme.core.mesh import Mesh
+from beamme.core.node import ControlPoint
+from beamme.core.nurbs_patch import NURBSSurface, NURBSVolume
 from beamme.core.rotation import Rotation
 from beamme.four_c.material import MaterialSolid, MaterialStVenantKirchhoff
 from beamme.mesh_creation_functions.nurbs_generic import (
@@ -479,3 +481,54 @@ def test_nurbs_torus_surface(
 
     # Compare with the reference file
     assert_results_equal(get_corresponding_reference_file_path(), mesh)
+
+
+def test_nurbs_patch_element_connectivity():
+    """Test the element connectivity of NURBS patches with repeated knots."""
+
+    mat = MaterialStVenantKirchhoff()
+
+    # Surface with a repeated knot in u direction, i.e., with a zero length knot
+    # span that does not define an element.
+    control_points = [ControlPoint([i, 0, 0], 1.0) for i in range(15)]
+    surface = NURBSSurface(
+        [[0, 0, 0, 0.5, 0.5, 1, 1, 1], [0, 0, 1, 2, 2]],
+        [2, 1],
+        material=mat,
+        nodes=control_points,
+    )
+    surface.i_global = 3
+    elements = surface.dump_to_list()
+    assert surface.get_number_elements() == 4
+    assert [element["id"] for element in elements] == [3, 4, 5, 6]
+    assert [element["cell"]["type"] for element in elements] == 4 * ["NURBS6"]
+    assert [
+        [control_points.index(node) for node in element["cell"]["connectivity"]]
+        for element in elements
+    ] == [
+        [0, 1, 2, 5, 6, 7],
+        [2, 3, 4, 7, 8, 9],
+        [5, 6, 7, 10, 11, 12],
+        [7, 8, 9, 12, 13, 14],
+    ]
+
+    # Volume with a repeated knot in w direction.
+    volume = NURBSVolume(
+        [[0, 0, 0, 1, 2, 2, 2], [0, 0, 1, 2, 3, 3], [0, 0, 1, 1, 2, 2]],
+        [2, 1, 1],
+        material=mat,
+        nodes=[ControlPoint([i, 0, 0], 1.0) for i in range(4 * 4 * 4)],
+    )
+    control_point_ids = [
+        [
+            16 * (w + k) + 4 * (v + j) + u + i
+            for k in [0, 1]
+            for j in [0, 1]
+            for i in [0, 1, 2]
+        ]
+        for w in [0, 2]
+        for v in [0, 1, 2]
+        for u in [0, 1]
+    ]
+    assert volume.get_number_elements() == 12
+    assert np.array_equal(volume.get_element_control_point_ids(), control_point_ids)
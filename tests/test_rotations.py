@@ -24,7 +24,12 @@
 import numpy as np
 
 from beamme.core.conf import mpy
-from beamme.core.rotation import Rotation, smallest_rotation
+from beamme.core.rotation import (
+    Rotation,
+    RotationArray,
+    smallest_rotation,
+    smallest_rotation_transport,
+)
 
 
 def get_rotation_matrix(axis, alpha):
@@ -337,3 +342,84 @@ def test_error_accumulation_smallest_rotation():
         0.5644581887089211,
     ]
     assert np.allclose(q_ref, rotation_new.q, atol=1e-14)
+
+
+def test_smallest_rotation_transport():
+    """Test that the transport of a triad along tangent vectors gives the same
+    results as successive smallest rotation mappings."""
+
+    np.random.seed(0)
+    tangents = [1.0, 0.5, -0.2] + np.cumsum(np.random.rand(50, 3) - 0.5, axis=0)
+    rotation = Rotation([1, 2, 3], 0.3)
+
+    quaternions = smallest_rotation_transport(rotation, tangents)
+
+    assert quaternions.shape == (len(tangents), 4)
+    for tangent, quaternion in zip(tangents, quaternions):
+        rotation = smallest_rotation(rotation, tangent)
+        assert np.allclose(rotation.q, quaternion, rtol=0.0, atol=1e-14)
+
+
+def test_rotation_array():
+    """Check that the batch operations of RotationArray give the same results
+    as the corresponding operations on single Rotation objects."""
+
+    np.random.seed(0)
+    n_rotations = 20
+    rotations = [
+        Rotation(np.random.rand(3) - 0.5, 2.0 * np.pi * (np.random.rand() - 0.5))
+        for _ in range(n_rotations)
+    ]
+
+    # Add special cases: identity, small rotation and rotations of pi.
+    rotations.append(Rotation())
+    rotations.append(Rotation([1, 2, 3], 0.1 * mpy.eps_quaternion))
+    rotations.append(Rotation([0, -1, 1], np.pi))
+    rotations.append(Rotation([-1, 0, 0], np.pi))
+    rotations.append(Rotation([0, 1, 0], 0.9 * np.pi).inv())
+    rotation_array = RotationArray.from_rotations(rotations)
+    other_array = RotationArray.from_rotations(rotations[::-1])
+    vectors = np.random.rand(len(rotations), 3)
+
+    assert len(rotation_array) == len(rotations)
+    assert np.all(RotationArray.from_quaternion(-rotation_array.q) == rotation_array)
+    assert not np.any(rotation_array[:n_rotations] == RotationArray(n_rotations).inv())
+
+    product = rotation_array * other_array
+    product_single = rotations[0] * other_array
+    inverse = rotation_array.inv()
+    rotation_matrices = rotation_array.get_rotation_matrix()
+    rotation_vectors = rotation_array.get_rotation_vector()
+    rotated_vectors = rotation_array * vectors
+    smallest_rotations = smallest_rotation(rotation_array, vectors)
+    for i, (rotation, other) in enumerate(zip(rotations, rotations[::-1])):
+        assert rotation_array[i] == rotation
+        assert product[i] == rotation * other
+        assert product_single[i] == rotations[0] * other
+        assert inverse[i] == rotation.inv()
+        assert np.allclose(rotation_matrices[i], rotation.get_rotation_matrix())
+        assert np.allclose(
+            rotation_vectors[i], rotation.copy().get_rotation_vector(), atol=1e-14
+        )
+        assert np.allclose(rotated_vectors[i], rotation * vectors[i])
+        assert smallest_rotations[i] == smallest_rotation(rotation, vectors[i])
+
+    # Check the creation functions.
+    assert np.all(
+        RotationArray.from_rotation_matrix(rotation_matrices) == rotation_array
+    )
+    assert np.all(
+        RotationArray.from_basis(rotation_matrices[:, :, 0], rotation_matrices[:, :, 1])
+        == rotation_array
+    )
+    assert np.all(
+        RotationArray.from_rotation_vector(rotation_vectors) == rotation_array
+    )
+    axis = np.random.rand(n_rotations, 3)
+    phi = np.random.rand(n_rotations)
+    assert np.all(
+        RotationArray(axis, phi)
+        == RotationArray.from_rotations(
+            [Rotation(axis[i], phi[i]) for i in range(n_rotations)]
+        )
+    )
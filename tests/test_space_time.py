@@ -30,7 +30,13 @@ from beamme.four_c.element_beam import Beam3rHerm2Line3, Beam3rLine2Line2
 from beamme.four_c.material import MaterialReissner
 from beamme.mesh_creation_functions.beam_arc import create_beam_mesh_arc_segment_2d
 from beamme.mesh_creation_functions.beam_line import create_beam_mesh_line
-from beamme.space_time.beam_to_space_time import beam_to_space_time, mesh_to_data_arrays
+from beamme.space_time.beam_to_space_time import (
+    beam_to_space_time,
+    beam_to_space_time_data_arrays,
+    load_data_arrays,
+    mesh_to_data_arrays,
+    save_data_arrays,
+)
 
 
 def get_name(beam_class):
@@ -139,6 +145,12 @@ def test_space_time_elbow(
         mesh_data_arrays,
     )
 
+    # Check that the same arrays are created without the space-time mesh
+    assert_results_equal(
+        mesh_data_arrays,
+        beam_to_space_time_data_arrays(mesh, 6.9, 5, time_start=1.69),
+    )
+
 
 @pytest.mark.parametrize("beam_type", [Beam3rLine2Line2, Beam3rHerm2Line3])
 @pytest.mark.parametrize("couple_nodes", [False, True])
@@ -208,6 +220,63 @@ def test_space_time_varying_material_length(
         mesh_data_arrays,
     )
 
+    # Check that the same arrays are created without the space-time mesh
+    assert_results_equal(
+        mesh_data_arrays,
+        beam_to_space_time_data_arrays(
+            beam_mesh_in_space_generator, 6.9, 5, time_start=1.69
+        ),
+    )
+
+
+def moving_beam_mesh_in_space_generator(time):
+    """Create the beam mesh in space at the given time.
+
+    This generator is defined at module level, so it can be used in
+    worker processes.
+    """
+    mesh = Mesh()
+    create_beam_mesh_line(
+        mesh,
+        Beam3rHerm2Line3,
+        MaterialReissner(radius=0.05),
+        [np.sin(time), 0, 0],
+        [2, 0.25 * time, 0],
+        n_el=3,
+        set_nodal_arc_length=True,
+    )
+    return mesh
+
+
+def test_space_time_generator_parallel(assert_results_equal):
+    """Check that the space-time mesh is the same if the spatial meshes are
+    created in parallel worker processes."""
+
+    mesh_data_arrays = [
+        mesh_to_data_arrays(
+            beam_to_space_time(
+                moving_beam_mesh_in_space_generator,
+                6.9,
+                5,
+                time_start=1.69,
+                n_processes=n_processes,
+            )[0]
+        )
+        for n_processes in [None, 2]
+    ]
+    assert_results_equal(mesh_data_arrays[0], mesh_data_arrays[1])
+
+
+def test_space_time_data_arrays_npz(tmp_path, assert_results_equal):
+    """Check that the data arrays of a space-time mesh can be saved to and
+    loaded from a NPZ file."""
+
+    data_arrays = beam_to_space_time_data_arrays(
+        moving_beam_mesh_in_space_generator, 6.9, 5, time_start=1.69
+    )
+    save_data_arrays(tmp_path / "space_time.npz", data_arrays)
+    assert_results_equal(data_arrays, load_data_arrays(tmp_path / "space_time.npz"))
+
 
 @pytest.mark.performance
 def test_performance_create_mesh_in_space(evaluate_execution_time, cache_data):